@@ -0,0 +1,162 @@
+import sys
+import os
+import argparse
+import csv
+import itertools
+import random
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+# Dynamically adjust the path to include the project root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from backtesting.vectorized_backtest import generate_signals, summarize_trades
+from strategies.indicators import EMA
+from utils.candle_store import read_candle_file
+
+RESULT_COLUMNS = ['short_window', 'long_window', 'stop_loss', 'profit_target',
+                  'total_return', 'max_drawdown', 'return_over_drawdown', 'trades', 'win_rate', 'stop_losses']
+
+# Per-worker state, set once by _init_worker
+_worker_shm = None
+_worker_close = None
+_worker_ema_cache = {}
+
+
+def load_close_prices(path):
+    """Load a close-price array from a candle store file, .npy, or a CSV with a 'close' column."""
+    if path.endswith('.bin'):
+        return np.array(read_candle_file(path)['close'], dtype=np.float64)
+    if path.endswith('.npy'):
+        return np.load(path).astype(np.float64)
+    with open(path, newline='') as f:
+        return np.array([float(row['close']) for row in csv.DictReader(f)], dtype=np.float64)
+
+
+def _init_worker(shm_name, length):
+    """Attach the shared price array once per worker process instead of pickling it per task."""
+    global _worker_shm, _worker_close
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_close = np.ndarray((length,), dtype=np.float64, buffer=_worker_shm.buf)
+    _worker_ema_cache.clear()
+
+
+def _ema(span, max_cached=16):
+    """EMAs are reused across every combination sharing a window."""
+    if span not in _worker_ema_cache:
+        if len(_worker_ema_cache) >= max_cached:
+            _worker_ema_cache.pop(next(iter(_worker_ema_cache)))
+        _worker_ema_cache[span] = EMA.batch(_worker_close, span)
+    return _worker_ema_cache[span]
+
+
+def _evaluate_group(short_window, long_window, exits, start, fee):
+    """Evaluate every (stop_loss, profit_target) pair for one window pair."""
+    fast_ind, slow_ind = _ema(short_window), _ema(long_window)
+    rows = []
+    for stop_loss, profit_target in exits:
+        signals = generate_signals(_worker_close, fast_ind, slow_ind, stop_loss, profit_target,
+                                   long_window, start=start)
+        stats = summarize_trades(_worker_close, signals, fee=fee)
+        drawdown = stats['max_drawdown']
+        rows.append({
+            'short_window': short_window,
+            'long_window': long_window,
+            'stop_loss': stop_loss,
+            'profit_target': profit_target,
+            'total_return': stats['total_return'],
+            'max_drawdown': drawdown,
+            'return_over_drawdown': stats['total_return'] / drawdown if drawdown > 0 else stats['total_return'],
+            'trades': stats['trades'],
+            'win_rate': stats['win_rate'],
+            'stop_losses': stats['stop_losses'],
+        })
+    return rows
+
+
+def build_grid(short_windows, long_windows, stop_losses, profit_targets, samples=None, seed=0):
+    """All valid combinations, or a random sample of `samples` of them."""
+    combos = [
+        c for c in itertools.product(short_windows, long_windows, stop_losses, profit_targets)
+        if c[0] < c[1]
+    ]
+    if samples is not None and samples < len(combos):
+        combos = random.Random(seed).sample(combos, samples)
+    return combos
+
+
+def optimize(close, combos, workers=None, start=0, fee=0.0, sort_by='return_over_drawdown'):
+    """
+    Evaluate parameter combinations over `close` with a process pool.
+    The prices live in one shared-memory block that every worker maps read-only.
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+
+    # Group by window pair so each task computes its two EMAs once
+    groups = {}
+    for short_window, long_window, stop_loss, profit_target in combos:
+        groups.setdefault((short_window, long_window), []).append((stop_loss, profit_target))
+
+    shm = shared_memory.SharedMemory(create=True, size=close.nbytes)
+    try:
+        np.ndarray(close.shape, dtype=np.float64, buffer=shm.buf)[:] = close
+        results = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(shm.name, len(close))) as pool:
+            futures = [
+                pool.submit(_evaluate_group, short_window, long_window, exits, start, fee)
+                for (short_window, long_window), exits in groups.items()
+            ]
+            for future in as_completed(futures):
+                results.extend(future.result())
+    finally:
+        shm.close()
+        shm.unlink()
+
+    results.sort(key=lambda row: (row[sort_by], -row['max_drawdown']), reverse=True)
+    return results
+
+
+def write_results(results, path):
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def _parse_list(value, cast):
+    return [cast(v) for v in value.split(',') if v]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel parameter sweep over a stored price dataset.")
+    parser.add_argument('--data', required=True, help="Close prices (candle store .bin, .npy, or CSV with a 'close' column)")
+    parser.add_argument('--short', default='10,20,30,50', help="SHORT_WINDOW values")
+    parser.add_argument('--long', default='100,150,200,300', help="LONG_WINDOW values")
+    parser.add_argument('--stop-loss', default='0.01,0.02,0.03', help="STOP_LOSS values")
+    parser.add_argument('--profit-target', default='0.02,0.04,0.06', help="PROFIT_TARGET values")
+    parser.add_argument('--samples', type=int, default=None, help="Random-search sample size (default: full grid)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--fee', type=float, default=0.0)
+    parser.add_argument('--sort-by', default='return_over_drawdown', choices=['return_over_drawdown', 'total_return'])
+    parser.add_argument('--out', default='./data/optimizer_results.csv')
+    args = parser.parse_args()
+
+    close = load_close_prices(args.data)
+    combos = build_grid(
+        _parse_list(args.short, int), _parse_list(args.long, int),
+        _parse_list(args.stop_loss, float), _parse_list(args.profit_target, float),
+        samples=args.samples
+    )
+
+    t0 = time.perf_counter()
+    results = optimize(close, combos, workers=args.workers, fee=args.fee, sort_by=args.sort_by)
+    elapsed = time.perf_counter() - t0
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    write_results(results, args.out)
+    print(f"✅ Evaluated {len(results)} combinations on {len(close)} candles in {elapsed:.1f}s -> {args.out}")
+    for row in results[:10]:
+        print(f"  short={row['short_window']} long={row['long_window']} sl={row['stop_loss']} pt={row['profit_target']} "
+              f"return={row['total_return']:.2%} dd={row['max_drawdown']:.2%} trades={row['trades']}")
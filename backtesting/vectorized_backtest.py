@@ -0,0 +1,139 @@
+import sys
+import os
+import numpy as np
+
+# Dynamically adjust the path to include the project root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from strategies.indicators import create_indicator
+
+# Signal codes used in the signal array (mirror strategies.live_strategy.Signal)
+HOLD = 0
+BUY_LONG = 1
+SELL_LONG = 2
+STOP_LOSS_LONG = 3
+SIGNAL_NAMES = {HOLD: 'HOLD', BUY_LONG: 'BUY_LONG', SELL_LONG: 'SELL_LONG', STOP_LOSS_LONG: 'STOP_LOSS_LONG'}
+
+
+def compute_indicators(close, short_window, long_window, fast_type='EMA', slow_type='EMA'):
+    """FAST_IND/SLOW_IND over the whole array, identical to LiveStrategy's streaming indicators."""
+    fast = create_indicator(fast_type, window=short_window)
+    slow = create_indicator(slow_type, window=long_window)
+    return fast.compute(close)[fast.key], slow.compute(close)[slow.key]
+
+
+def _first_index(indices, start):
+    """Smallest value in the sorted index array `indices` that is >= start, or None."""
+    pos = np.searchsorted(indices, start)
+    return int(indices[pos]) if pos < len(indices) else None
+
+
+def _first_exit(close, start, stop_price, target_price, chunk=4096):
+    """First index >= start where price hits the stop or the target, scanning in growing chunks."""
+    n = len(close)
+    while start < n:
+        end = min(start + chunk, n)
+        window = close[start:end]
+        hits = np.flatnonzero((window <= stop_price) | (window >= target_price))
+        if len(hits):
+            return start + int(hits[0])
+        start = end
+        chunk *= 2
+    return None
+
+
+def generate_signals(close, fast_ind, slow_ind, stop_loss, profit_target, long_window,
+                     enable_longing=True, start=0):
+    """
+    Replay LiveStrategy.get_signal over arrays and return one signal code per row.
+
+    Rows before `start` only warm up the indicators (as prefill does live). Instead of
+    stepping through every row, the state machine jumps between events: the next
+    FAST_IND<=SLOW_IND reset, the next crossover entry, and the next stop/target exit,
+    so the Python loop runs once per trade rather than once per candle.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    fast_ind = np.asarray(fast_ind, dtype=np.float64)
+    slow_ind = np.asarray(slow_ind, dtype=np.float64)
+    n = len(close)
+    signals = np.zeros(n, dtype=np.int8)
+
+    # get_signal holds until the buffer has long_window rows
+    i = max(start, long_window - 1)
+    if i >= n or not enable_longing:
+        return signals
+
+    # NaN compares False both ways, exactly like the scalar checks in get_signal
+    above = np.flatnonzero(fast_ind > slow_ind)
+    reset = np.flatnonzero(fast_ind <= slow_ind)
+
+    uptrend_triggered = False
+    while i < n:
+        # Flat: an entry needs the trigger cleared first, then fast > slow
+        if uptrend_triggered:
+            j = _first_index(reset, i)
+            if j is None:
+                break
+            i = j + 1
+            uptrend_triggered = False
+        entry = _first_index(above, i)
+        if entry is None:
+            break
+        signals[entry] = BUY_LONG
+        uptrend_triggered = True
+        entry_price = close[entry]
+
+        # Long: same float expressions as get_signal so boundary prices agree
+        stop_price = entry_price * (1 - stop_loss)
+        target_price = entry_price * (1 + profit_target)
+        exit_index = _first_exit(close, entry + 1, stop_price, target_price)
+        if exit_index is None:
+            break
+        signals[exit_index] = STOP_LOSS_LONG if close[exit_index] <= stop_price else SELL_LONG
+
+        # Ticks held without exiting still clear the trigger when fast <= slow
+        j = _first_index(reset, entry + 1)
+        if j is not None and j < exit_index:
+            uptrend_triggered = False
+        i = exit_index + 1
+
+    return signals
+
+
+def summarize_trades(close, signals, fee=0.0):
+    """Pair entries with exits and compute PnL statistics."""
+    close = np.asarray(close, dtype=np.float64)
+    entries = np.flatnonzero(signals == BUY_LONG)
+    exits = np.flatnonzero((signals == SELL_LONG) | (signals == STOP_LOSS_LONG))
+    n_closed = len(exits)  # every exit follows exactly one entry
+
+    entry_prices = close[entries[:n_closed]]
+    exit_prices = close[exits]
+    returns = exit_prices / entry_prices * (1 - fee) ** 2 - 1
+
+    equity = np.cumprod(1 + returns) if n_closed else np.ones(0)
+    peak = np.maximum.accumulate(np.concatenate(([1.0], equity)))
+    drawdowns = 1 - np.concatenate(([1.0], equity)) / peak
+
+    return {
+        'trades': n_closed,
+        'open_position': len(entries) > n_closed,
+        'total_return': float(equity[-1] - 1) if n_closed else 0.0,
+        'max_drawdown': float(drawdowns.max()),
+        'win_rate': float((returns > 0).mean()) if n_closed else 0.0,
+        'stop_losses': int((signals == STOP_LOSS_LONG).sum()),
+        'entry_index': entries,
+        'exit_index': exits,
+        'returns': returns,
+    }
+
+
+def run_backtest(close, stop_loss, profit_target, short_window, long_window,
+                 enable_longing=True, start=0, fee=0.0, fast_type='EMA', slow_type='EMA'):
+    """Compute indicators, signals and trade statistics for one parameter set."""
+    close = np.asarray(close, dtype=np.float64)
+    fast_ind, slow_ind = compute_indicators(close, short_window, long_window, fast_type, slow_type)
+    signals = generate_signals(close, fast_ind, slow_ind, stop_loss, profit_target, long_window,
+                               enable_longing=enable_longing, start=start)
+    result = summarize_trades(close, signals, fee=fee)
+    result.update({'signals': signals, 'FAST_IND': fast_ind, 'SLOW_IND': slow_ind})
+    return result
@@ -0,0 +1,79 @@
+import math
+import random
+from collections import deque
+
+
+class FakeBinanceClient:
+    """
+    Offline stand-in for BinanceClient used by the benchmarks.
+    Prices follow a seeded random walk; orders fill instantly at the last price.
+    `max_ticks` ends a LiveTrader.run loop by raising KeyboardInterrupt from get_ticker.
+    """
+
+    def __init__(self, start_price=100.0, volatility=0.002, seed=1, max_ticks=None):
+        self.rng = random.Random(seed)
+        self.price = start_price
+        self.volatility = volatility
+        self.max_ticks = max_ticks
+        self.ticks = 0
+        self.order_count = 0
+        self.orders = deque(maxlen=100)  # recent orders only, so a soak run's memory stays flat
+        self.balances = {'BTC': 0.0, 'USDT': 1_000_000.0}
+
+    def next_price(self):
+        self.price *= math.exp(self.rng.gauss(0, self.volatility))
+        return self.price
+
+    def get_ticker(self, symbol):
+        if self.max_ticks is not None and self.ticks >= self.max_ticks:
+            raise KeyboardInterrupt  # ends LiveTrader.run cleanly
+        self.ticks += 1
+        return {'symbol': symbol, 'last': self.next_price()}
+
+    def get_tickers(self, symbols):
+        price = self.next_price()
+        return {symbol: {'symbol': symbol, 'last': price} for symbol in symbols}
+
+    def get_balance(self, symbol):
+        return self.balances.get(symbol, 0.0)
+
+    def get_balances(self):
+        return {'free': dict(self.balances), 'used': {asset: 0.0 for asset in self.balances}}
+
+    def get_open_orders(self, symbol=None):
+        return []
+
+    def market(self, symbol):
+        base, quote = symbol.split('/')
+        return {'symbol': symbol, 'base': base, 'quote': quote}
+
+    def create_order(self, symbol, order_type, side, amount, price=None, params=None):
+        fill = price or self.price
+        if side.upper() == 'BUY':
+            self.balances['BTC'] += amount
+            self.balances['USDT'] -= amount * fill
+        else:
+            self.balances['BTC'] -= amount
+            self.balances['USDT'] += amount * fill
+        self.order_count += 1
+        order = {'id': str(self.order_count), 'symbol': symbol, 'side': side.lower(), 'status': 'closed',
+                 'amount': amount, 'filled': amount, 'average': fill, 'cost': amount * fill, 'price': fill,
+                 'clientOrderId': (params or {}).get('newClientOrderId')}
+        self.orders.append(order)
+        return order
+
+    def submit_order(self, symbol, order_type, side, amount, price=None, params=None):
+        return self.create_order(symbol, order_type, side, amount, price, params)
+
+    def get_order_by_client_id(self, symbol, client_order_id):
+        return next((order for order in self.orders if order['clientOrderId'] == client_order_id), None)
+
+    def get_ohlcv(self, symbol, interval='1m', limit=1000, since=None):
+        start = since or 0
+        return [[start + i * 60_000, p, p, p, p, 1.0] for i, p in ((i, self.next_price()) for i in range(limit))]
+
+    def get_historical_klines(self, symbol, interval='1m', limit=1000, since=None):
+        return [
+            {'timestamp': row[0], 'open': row[1], 'high': row[2], 'low': row[3], 'close': row[4], 'volume': row[5]}
+            for row in self.get_ohlcv(symbol, interval, limit, since)
+        ]
@@ -0,0 +1,59 @@
+import sys
+import os
+import argparse
+import logging
+import tempfile
+import time
+
+# Dynamically adjust the path to include the project root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from live_trading.live_trader import LiveTrader
+from live_trading.simulated_client import SimulatedBinanceClient
+from utils.logger import logger
+from visualization.plot_worker import PlotWorker
+
+
+def replay(config, client, run_folder):
+    """One full session through the unmodified LiveTrader.run loop on the simulator's clock."""
+    # A worker that is never started keeps chart rendering out of the measurement
+    trader = LiveTrader(config, client=client, run_folder=run_folder, clock=client.clock,
+                        plot_worker=PlotWorker(refresh_interval=float('inf')), export_metrics=False)
+    trader.run()
+    return trader
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay market sessions through LiveTrader as fast as possible.")
+    parser.add_argument('--data', help="Recorded candles (.bin candle store file or CSV); default: synthetic")
+    parser.add_argument('--sessions', type=int, default=10)
+    parser.add_argument('--candles', type=int, default=10_000, help="Candles per synthetic session (after history)")
+    parser.add_argument('--symbol', default='BTC/USDT')
+    parser.add_argument('--keep', action='store_true', help="Keep run folders (journal, config) for inspection")
+    args = parser.parse_args()
+
+    logger.setLevel(logging.CRITICAL)
+    config = dict(
+        API_KEY='', SECRET_KEY='', LIVE_SYMBOL=args.symbol, ENABLE_LONGING=True,
+        STOP_LOSS=0.02, PROFIT_TARGET=0.04, SHORT_WINDOW=50, LONG_WINDOW=200,
+        CANDLE_CACHE=False, ACCOUNT_RECONCILE_INTERVAL=3600, CHECKPOINT_INTERVAL=0,
+    )
+
+    base_folder = tempfile.mkdtemp(prefix='replay_') if args.keep else None
+    with tempfile.TemporaryDirectory() as scratch:
+        ticks, start = 0, time.perf_counter()
+        for session in range(args.sessions):
+            if args.data:
+                # Same recording every time: sessions must be identical (incident reproduction)
+                client = SimulatedBinanceClient.from_file(args.data, symbol=args.symbol)
+            else:
+                client = SimulatedBinanceClient.synthetic(length=1000 + args.candles, seed=session, symbol=args.symbol)
+            folder = os.path.join(base_folder or scratch, f'session{session + 1}')
+            trader = replay(config, client, folder)
+            ticks += client.polls
+            print(f"session {session + 1}: {client.polls} ticks, {len(client.trades)} trades, "
+                  f"{client.get_balance(client.quote):.2f} {client.quote} ({trader.stop_reason})")
+        elapsed = time.perf_counter() - start
+
+    print(f"✅ {args.sessions / elapsed:.2f} sessions/s | {ticks / elapsed:,.0f} ticks/s")
+    if base_folder:
+        print(f"📁 Run folders kept in {base_folder}")
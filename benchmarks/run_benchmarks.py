@@ -0,0 +1,224 @@
+import sys
+import os
+import argparse
+import gc
+import json
+import logging
+import tempfile
+from array import array
+import time
+import tracemalloc
+
+# Dynamically adjust the path to include the project root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from benchmarks.fake_client import FakeBinanceClient
+from strategies.live_strategy import LiveStrategy
+from utils.clock import SimulatedClock
+from utils.logger import logger
+
+# Absolute timings only compare on the machine that made them, so the baseline is written locally
+# (--save-baseline) and kept out of git; without one only the scale-free invariants below are checked
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# Scale-free invariants that hold on any machine: per-tick cost and memory must stay flat
+MAX_LATENCY_GROWTH = 1.5            # late-run p50 / early-run p50
+MAX_RETAINED_BLOCKS_PER_TICK = 0.05  # live objects left behind per tick once warm
+MAX_RSS_GROWTH_MB_PER_100K = 5.0
+
+# Machine-specific numbers may regress this much against the stored baseline; tail latency of a
+# ~15us tick is dominated by scheduler noise, so p99 gets more room than the median
+BASELINE_TOLERANCE = {'p50_us': 0.25, 'p99_us': 1.0}
+
+STRATEGY_PARAMS = dict(stop_loss=0.02, profit_target=0.04, short_window=50, long_window=200)
+
+
+def rss_mb():
+    """Current resident set size in MB (Linux /proc, falling back to peak RSS)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def summarize(latencies, blocks, rss, ticks, elapsed):
+    """
+    Reduce per-tick samples to the reported numbers. `blocks` and `rss` hold (tick, value)
+    samples; growth is taken after the first tenth (warm-up) and divided by the ticks in between.
+    """
+    window = max(1, len(latencies) // 10)
+    early, late = latencies[window:2 * window], latencies[-window:]  # skip the first window (warm-up)
+
+    def growth_per_tick(samples):
+        warm = [(tick, value) for tick, value in samples if tick >= ticks // 10] or samples
+        (first_tick, first), (last_tick, last) = warm[0], warm[-1]
+        return (last - first) / max(1, last_tick - first_tick)
+
+    return {
+        'ticks': ticks,
+        'ticks_per_second': ticks / elapsed,
+        'p50_us': percentile(latencies, 0.5) * 1e6,
+        'p99_us': percentile(latencies, 0.99) * 1e6,
+        'latency_growth': percentile(late, 0.5) / max(percentile(early, 0.5), 1e-12),
+        'retained_blocks_per_tick': growth_per_tick(blocks),
+        'rss_growth_mb_per_100k': growth_per_tick(rss) * 100_000,
+        'rss_end_mb': rss[-1][1],
+    }
+
+
+def sample_blocks():
+    """Live allocated blocks, after collecting cyclic garbage that is merely awaiting a full GC."""
+    gc.collect()
+    return sys.getallocatedblocks()
+
+
+def bench_strategy(ticks):
+    """LiveStrategy.update_data + get_signal on synthetic ticks."""
+    client = FakeBinanceClient()
+    strategy = LiveStrategy(**STRATEGY_PARAMS)
+    strategy.prefill_data(client.get_historical_klines('BTC/USDT', limit=1000))
+
+    # A float array holds samples unboxed, so the harness itself adds no blocks per tick
+    latencies, blocks, rss = array('d'), [], [(0, rss_mb())]
+    gc.collect()
+    start = time.perf_counter()
+    for i in range(ticks):
+        price = client.next_price()
+        t0 = time.perf_counter()
+        strategy.update_data(price)
+        strategy.get_signal()
+        latencies.append(time.perf_counter() - t0)
+        if i % (ticks // 20 or 1) == 0:
+            blocks.append((i, sample_blocks()))
+            rss.append((i, rss_mb()))
+    elapsed = time.perf_counter() - start
+    rss.append((ticks, rss_mb()))
+
+    # Allocation volume per tick (tracemalloc is slow, so only on a short slice)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(1000):
+        strategy.update_data(client.next_price())
+        strategy.get_signal()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, 'filename') if stat.size_diff > 0)
+
+    result = summarize(latencies, blocks, rss, ticks, elapsed)
+    result['allocated_bytes_per_tick'] = allocated / 1000
+    return result
+
+
+def bench_trader(ticks):
+    """The unmodified LiveTrader.run loop against a fake client, on a clock that never really sleeps."""
+    from live_trading import live_trader
+    from live_trading.account_state import AccountState
+
+    with tempfile.TemporaryDirectory() as folder:
+        client = FakeBinanceClient(max_ticks=ticks)
+        config = dict(
+            API_KEY='', SECRET_KEY='', LIVE_SYMBOL='BTC/USDT', ENABLE_LONGING=True,
+            STOP_LOSS=STRATEGY_PARAMS['stop_loss'], PROFIT_TARGET=STRATEGY_PARAMS['profit_target'],
+            SHORT_WINDOW=STRATEGY_PARAMS['short_window'], LONG_WINDOW=STRATEGY_PARAMS['long_window'],
+            CANDLE_CACHE=False, ACCOUNT_STREAM=False, CHECKPOINT_INTERVAL=0, ACCOUNT_RECONCILE_INTERVAL=3600, PLOT_INTERVAL=float('inf'), METRICS_INTERVAL=3600,
+        )
+        latencies, blocks, rss = array('d'), [], [(0, rss_mb())]
+        last = [time.perf_counter()]
+
+        class SamplingClock(SimulatedClock):
+            def sleep(self, seconds):
+                # run() sleeps once per iteration: use it as the per-tick sample point
+                super().sleep(seconds)
+                latencies.append(time.perf_counter() - last[0])
+                if len(latencies) % (ticks // 20 or 1) == 0:
+                    blocks.append((len(latencies), sample_blocks()))
+                    rss.append((len(latencies), rss_mb()))
+                last[0] = time.perf_counter()
+
+        # A worker that is never started keeps only the newest snapshot and renders nothing, so neither
+        # the matplotlib import nor the first chart lands inside the measured window
+        from visualization.plot_worker import PlotWorker
+        # Fill history is capped; a small cap reaches that steady state early in the run
+        account = AccountState(client, symbols=[config['LIVE_SYMBOL']], reconcile_interval=3600,
+                               max_fills=100).start(stream=False)
+        trader = live_trader.LiveTrader(config, client=client, run_folder=folder, clock=SamplingClock(time.time()),
+                                        plot_worker=PlotWorker(refresh_interval=float('inf')), account=account)
+        gc.collect()
+        start = time.perf_counter()
+        last[0] = start
+        trader.run()
+        elapsed = time.perf_counter() - start
+        # No final RSS sample here: run() ends with finish(), whose chart render is not per-tick cost
+
+        account.stop()
+        result = summarize(latencies, blocks, rss, len(latencies), elapsed)
+        result['orders'] = client.order_count
+        return result
+
+
+def check(results, baseline):
+    """Return a list of failure messages."""
+    failures = []
+    for name, result in results.items():
+        if result['latency_growth'] > MAX_LATENCY_GROWTH:
+            failures.append(f"{name}: per-tick latency grew {result['latency_growth']:.2f}x over the run")
+        if result['retained_blocks_per_tick'] > MAX_RETAINED_BLOCKS_PER_TICK:
+            failures.append(f"{name}: {result['retained_blocks_per_tick']:.3f} live blocks retained per tick")
+        if result['rss_growth_mb_per_100k'] > MAX_RSS_GROWTH_MB_PER_100K:
+            failures.append(f"{name}: RSS grows {result['rss_growth_mb_per_100k']:.1f} MB per 100k ticks")
+
+        reference = baseline.get(name)
+        if reference:
+            for key, tolerance in BASELINE_TOLERANCE.items():
+                if result[key] > reference[key] * (1 + tolerance):
+                    failures.append(f"{name}: {key} {result[key]:.1f} vs baseline {reference[key]:.1f}")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Strategy/trader micro-benchmarks and soak test.")
+    parser.add_argument('--ticks', type=int, default=100_000, help="Synthetic ticks per benchmark (10k-1M)")
+    parser.add_argument('--only', choices=['strategy', 'trader'])
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the new baseline")
+    args = parser.parse_args()
+
+    logger.setLevel(logging.CRITICAL)  # measure the code, not the log volume
+
+    benches = {'strategy': bench_strategy, 'trader': bench_trader}
+    if args.only:
+        benches = {args.only: benches[args.only]}
+
+    results = {}
+    for name, bench in benches.items():
+        results[name] = bench(args.ticks)
+        r = results[name]
+        print(f"{name:>8}: {r['ticks_per_second']:,.0f} ticks/s | p50 {r['p50_us']:.1f}us p99 {r['p99_us']:.1f}us | "
+              f"growth {r['latency_growth']:.2f}x | retained {r['retained_blocks_per_tick']:.3f} blocks/tick | "
+              f"RSS +{r['rss_growth_mb_per_100k']:.2f} MB/100k ({r['rss_end_mb']:.0f} MB)")
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"💾 Baseline saved to {BASELINE_PATH}")
+        sys.exit(0)
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as f:
+            baseline = json.load(f)
+    else:
+        print("ℹ️ No local baseline; run with --save-baseline to also gate p50/p99 on this machine.")
+
+    failures = check(results, baseline)
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        sys.exit(1)
+    print("✅ All benchmarks within limits.")
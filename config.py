@@ -12,13 +12,68 @@ TESTNET = os.getenv('TESTNET') == 'True'  # Set to False for live trading
 
 # Trading Parameters
 LIVE_SYMBOL = os.getenv('LIVE_SYMBOL')
+PORTFOLIO_SYMBOLS = [s.strip() for s in os.getenv('PORTFOLIO_SYMBOLS', '').split(',') if s.strip()]  # Empty = single-symbol mode
 STOP_LOSS = float(os.getenv('STOP_LOSS'))
 PROFIT_TARGET = float(os.getenv('PROFIT_TARGET'))
 SHORT_WINDOW = int(os.getenv('SHORT_WINDOW'))
 LONG_WINDOW = int(os.getenv('LONG_WINDOW'))
 ENABLE_LONGING = os.getenv('ENABLE_LONGING') == 'True'
+FAST_INDICATOR = os.getenv('FAST_INDICATOR', 'EMA')  # EMA, SMA, RSI, ATR, BOLLINGER, VWAP (SHORT_WINDOW is its length)
+SLOW_INDICATOR = os.getenv('SLOW_INDICATOR', 'EMA')  # Same choices, LONG_WINDOW is its length
+EXTRA_INDICATORS = os.getenv('EXTRA_INDICATORS', '')  # Also tracked and plotted, e.g. RSI:14,BOLLINGER:20,MACD
+RETENTION_WINDOW = int(os.getenv('RETENTION_WINDOW', 10080))  # Price rows kept in memory (1 week of 1m)
+CANDLE_CACHE = os.getenv('CANDLE_CACHE', 'True') == 'True'  # Keep a local OHLCV store and only fetch the missing tail
+CANDLE_STORE_PATH = os.getenv('CANDLE_STORE_PATH', './data/candles')
+
+# Market Data Feed
+FEED_MODE = os.getenv('FEED_MODE', 'poll')  # 'poll' (REST ticker), 'async' (asyncio REST) or 'stream' (WebSocket klines)
+TIMEFRAME = os.getenv('TIMEFRAME', '1m')  # Bars the strategy trades on (1m, 5m, 15m, 1h, ...), built from the feed
+STREAM_INTERVAL = os.getenv('STREAM_INTERVAL', '1m')  # Base kline interval streamed and aggregated up to TIMEFRAME
+STREAM_SOURCE = os.getenv('STREAM_SOURCE', 'kline')  # 'kline' (closed klines) or 'trade' (every trade)
+
+# REST Rate Limiting (Binance spot limits; the client keeps a 10% safety margin)
+REQUEST_WEIGHT_PER_MINUTE = int(os.getenv('REQUEST_WEIGHT_PER_MINUTE', 6000))
+ORDERS_PER_10S = int(os.getenv('ORDERS_PER_10S', 50))
+REST_MAX_RETRIES = int(os.getenv('REST_MAX_RETRIES', 3))  # Retries with jittered backoff on transient errors
+ORDER_RETRIES = int(os.getenv('ORDER_RETRIES', 2))  # Resends (same client order id) after a send with an unknown outcome
+MARKET_CACHE_PATH = os.getenv('MARKET_CACHE_PATH', './data/markets')  # Exchange market metadata kept between runs
+MARKET_CACHE_TTL = float(os.getenv('MARKET_CACHE_TTL', 86400))  # Older caches are used, then refreshed in the background; 0 disables
+
+# Account State
+ACCOUNT_STREAM = os.getenv('ACCOUNT_STREAM', 'True') == 'True'  # Follow balances/orders over the user-data stream
+ACCOUNT_RECONCILE_INTERVAL = float(os.getenv('ACCOUNT_RECONCILE_INTERVAL', 300))  # Seconds between REST reconciliations
+
+# Paper Trading (in-process simulated exchange instead of Binance)
+PAPER_TRADING = os.getenv('PAPER_TRADING', 'False') == 'True'
+PAPER_DATA = os.getenv('PAPER_DATA', '')  # Candle store .bin or CSV (timestamp, close); empty = synthetic prices
+PAPER_FEE_RATE = float(os.getenv('PAPER_FEE_RATE', 0.001))
+PAPER_SLIPPAGE_BPS = float(os.getenv('PAPER_SLIPPAGE_BPS', 5))
+PAPER_LATENCY = float(os.getenv('PAPER_LATENCY', 0))  # Seconds slept per simulated order
+
+# Trade Journal
+JOURNAL_BACKEND = os.getenv('JOURNAL_BACKEND', 'csv')  # 'csv' or 'binary' (compact fixed-width records)
+JOURNAL_BATCH_SIZE = int(os.getenv('JOURNAL_BATCH_SIZE', 100))
+JOURNAL_FLUSH_INTERVAL = float(os.getenv('JOURNAL_FLUSH_INTERVAL', 5))  # Seconds; orders are always flushed immediately
+
+# Crash Recovery
+RESUME = os.getenv('RESUME', 'False') == 'True'  # Continue the latest run folder from its checkpoint
+CHECKPOINT_INTERVAL = float(os.getenv('CHECKPOINT_INTERVAL', 60))  # Seconds between state snapshots (orders always snapshot); 0 disables
+SUPERVISOR = os.getenv('SUPERVISOR', 'False') == 'True'  # Ingest, strategies, execution and journaling as supervised processes
+HEARTBEAT_TIMEOUT = float(os.getenv('HEARTBEAT_TIMEOUT', 120))  # Seconds without a heartbeat before a worker is restarted
+MAX_WORKER_RESTARTS = int(os.getenv('MAX_WORKER_RESTARTS', 5))  # Per worker within 10 minutes before giving up on it
+
+# Plotting
+PLOT_INTERVAL = float(os.getenv('PLOT_INTERVAL', 60))  # Seconds between chart refreshes (rendered off the trading thread)
+PLOT_WINDOW = float(os.getenv('PLOT_WINDOW', 0))  # Seconds of history drawn (rolling window); 0 draws everything retained
+PLOT_FORMAT = os.getenv('PLOT_FORMAT', 'png')  # 'png' (matplotlib), or 'svg'/'html' (lightweight vector chart)
+
+# Metrics
+METRICS_PORT = int(os.getenv('METRICS_PORT', 0))  # Prometheus-style /metrics on 127.0.0.1 (0 disables)
+METRICS_INTERVAL = float(os.getenv('METRICS_INTERVAL', 60))  # Seconds between metrics.json snapshots in the run folder
 
 # Logging Configuration
 LOG_FOLDER = os.getenv('LOG_FOLDER')
 LOG_FILE = os.getenv('LOG_FILE')
 LOG_LEVEL = os.getenv('LOG_LEVEL')
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text')  # 'text', 'compact' or 'json'
+LOG_RATE_LIMIT = float(os.getenv('LOG_RATE_LIMIT', 60))  # Seconds between identical warnings (0 disables)
@@ -0,0 +1,275 @@
+import sys
+import os
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+
+# Dynamically adjust the path to include the utils directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from live_trading.market_stream import BINANCE_WS_URL
+from utils.logger import logger
+from utils.metrics import metrics
+import websockets
+
+LISTEN_KEY_KEEPALIVE = 30 * 60  # Binance expires listen keys after 60 minutes without a keepalive
+OPEN_ORDER_STATUSES = ('open', 'NEW', 'PARTIALLY_FILLED')
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+class AccountState:
+    """
+    In-memory balances, open orders and recent fills for the trading loop.
+    Updated from order responses and the Binance user-data stream, with periodic REST
+    reconciliation as the fallback, so `free(asset)` never needs a network round-trip.
+
+    Each balance remembers the exchange time it was last set from an absolute snapshot;
+    a fill older than that snapshot is already included and only its record is kept,
+    which makes order responses, stream events and reconciliation safe to apply in any order.
+    Fills are deduplicated by trade id and, since an order response may only carry the
+    aggregate fill, by the quantity already booked against each order.
+    """
+
+    def __init__(self, client, symbols=(), reconcile_interval=300.0, base_url=BINANCE_WS_URL, max_fills=1000):
+        self.client = client
+        self.symbols = list(symbols)
+        self.reconcile_interval = reconcile_interval
+        self.base_url = base_url.rstrip('/')
+        self.lock = threading.RLock()
+        self.balances = {}      # asset -> (free, locked)
+        self.balance_time = {}  # asset -> exchange time (ms) of the last absolute snapshot
+        self.open_orders = {}   # order id -> order dict
+        self.fills = deque(maxlen=max_fills)
+        self.fill_ids = set()
+        self.booked = OrderedDict()  # order id -> quantity already applied to balances
+        self.max_orders = max_fills
+        self.last_reconcile = 0.0
+        self.thread = None
+        self.loop = None
+        self.task = None
+
+    # --- reads (lock-free: each balance is replaced as one tuple) ---
+
+    def free(self, asset):
+        return self.balances.get(asset, (0.0, 0.0))[0]
+
+    def locked(self, asset):
+        return self.balances.get(asset, (0.0, 0.0))[1]
+
+    def orders_for(self, symbol):
+        return [order for order in list(self.open_orders.values()) if order['symbol'] == symbol]
+
+    # --- updates ---
+
+    def _adjust(self, asset, delta, timestamp):
+        if self.balance_time.get(asset, 0) >= timestamp:
+            return  # the last snapshot already contains this change
+        free, locked = self.balances.get(asset, (0.0, 0.0))
+        self.balances[asset] = (free + delta, locked)
+
+    def _apply_fill(self, fill, cumulative):
+        """
+        Record one fill and move balances. `cumulative` is the order's total filled quantity
+        including this fill; only the part not yet booked against the order is applied.
+        """
+        if fill['id'] in self.fill_ids:
+            return False
+        order_id = fill['order_id']
+        booked = self.booked.get(order_id, 0.0)
+        amount = min(fill['amount'], cumulative - booked)
+        if amount <= 1e-12 * max(1.0, cumulative):
+            return False  # already booked from another source
+        if amount < fill['amount']:
+            fill = dict(fill, amount=amount, fee_cost=fill['fee_cost'] * amount / fill['amount'])
+        self.booked[order_id] = booked + amount
+        self.booked.move_to_end(order_id)
+        if len(self.booked) > self.max_orders:
+            self.booked.popitem(last=False)
+
+        if len(self.fills) == self.fills.maxlen:
+            self.fill_ids.discard(self.fills[0]['id'])
+        self.fills.append(fill)
+        self.fill_ids.add(fill['id'])
+        metrics.inc('account_fills_total', symbol=fill['symbol'])
+
+        if '/' not in fill['symbol']:
+            return True  # unknown market: balances follow the next snapshot
+        base, quote = fill['symbol'].split(':')[0].split('/')
+        sign = 1 if fill['side'] == 'buy' else -1
+        self._adjust(base, sign * fill['amount'], fill['timestamp'])
+        self._adjust(quote, -sign * fill['amount'] * fill['price'], fill['timestamp'])
+        if fill['fee_cost']:
+            self._adjust(fill['fee_currency'], -fill['fee_cost'], fill['timestamp'])
+        return True
+
+    def apply_order(self, order):
+        """Fold a ccxt order response (from create_order) into the cache."""
+        if not order:
+            return
+        symbol = order['symbol']
+        side = (order.get('side') or '').lower()
+        timestamp = order.get('timestamp') or _now_ms()
+        with self.lock:
+            if order.get('status') in OPEN_ORDER_STATUSES:
+                self.open_orders[order['id']] = order
+            else:
+                self.open_orders.pop(order['id'], None)
+
+            trades = order.get('trades') or []
+            cumulative = 0.0
+            for i, trade in enumerate(trades):
+                fee = trade.get('fee') or {}
+                cumulative += trade['amount']
+                self._apply_fill({
+                    'id': str(trade.get('id') or f"{order['id']}:{i}"), 'order_id': order['id'],
+                    'symbol': symbol, 'side': side, 'amount': trade['amount'], 'price': trade['price'],
+                    'fee_cost': fee.get('cost') or 0.0, 'fee_currency': fee.get('currency'),
+                    'timestamp': trade.get('timestamp') or timestamp,
+                }, cumulative)
+            filled = order.get('filled') or 0.0
+            if not trades and filled:
+                # No per-trade breakdown: book whatever of the aggregate fill the stream has not
+                fee = order.get('fee') or {}
+                price = order.get('average') or (order.get('cost') or 0.0) / filled
+                self._apply_fill({
+                    'id': f"{order['id']}:{filled}", 'order_id': order['id'], 'symbol': symbol, 'side': side,
+                    'amount': filled, 'price': price, 'fee_cost': fee.get('cost') or 0.0,
+                    'fee_currency': fee.get('currency'), 'timestamp': timestamp,
+                }, filled)
+
+    def apply_event(self, payload):
+        """Apply one user-data stream event. Returns the event type."""
+        payload = payload.get('data', payload)
+        event = payload.get('e')
+        with self.lock:
+            if event == 'outboundAccountPosition':
+                # Absolute balances of every asset that changed
+                for balance in payload['B']:
+                    self.balances[balance['a']] = (float(balance['f']), float(balance['l']))
+                    self.balance_time[balance['a']] = int(payload['u'])
+
+            elif event == 'executionReport':
+                order_id = str(payload['i'])
+                symbol = self._unified_symbol(payload['s'])
+                if payload['X'] in OPEN_ORDER_STATUSES:
+                    self.open_orders[order_id] = {
+                        'id': order_id, 'symbol': symbol, 'side': payload['S'].lower(), 'status': 'open',
+                        'price': float(payload['p']), 'amount': float(payload['q']), 'filled': float(payload['z']),
+                        'clientOrderId': payload.get('c'),
+                    }
+                else:
+                    self.open_orders.pop(order_id, None)
+                if float(payload['l']) > 0:
+                    self._apply_fill({
+                        'id': str(payload['t']), 'order_id': order_id, 'symbol': symbol,
+                        'side': payload['S'].lower(), 'amount': float(payload['l']), 'price': float(payload['L']),
+                        'fee_cost': float(payload.get('n') or 0.0), 'fee_currency': payload.get('N'),
+                        'timestamp': int(payload['T']),
+                    }, float(payload['z']))
+            # balanceUpdate (deposits/transfers) is always followed by an outboundAccountPosition
+        return event
+
+    def _unified_symbol(self, market_id):
+        try:
+            return self.client.exchange.market(market_id)['symbol']
+        except Exception:
+            return market_id
+
+    def reconcile(self):
+        """Replace the cache with a REST snapshot and report any drift."""
+        balance = self.client.get_balances()
+        orders = [order for symbol in self.symbols for order in self.client.get_open_orders(symbol)]
+        snapshot_time = balance.get('timestamp') or _now_ms()
+        free, used = balance.get('free', {}), balance.get('used', {})
+        balances = {asset: (float(free.get(asset) or 0.0), float(used.get(asset) or 0.0)) for asset in free}
+
+        with self.lock:
+            for asset, (cached_free, _) in self.balances.items():
+                actual = balances.get(asset, (0.0, 0.0))[0]
+                if abs(cached_free - actual) > 1e-9 * max(1.0, abs(actual)):
+                    metrics.inc('account_drift_total', asset=asset)
+                    logger.warning("⚠️ Balance drift for %s: cached %s, exchange %s", asset, cached_free, actual)
+            self.balances = balances
+            self.balance_time = {asset: snapshot_time for asset in balances}
+            self.open_orders = {order['id']: order for order in orders}
+        self.last_reconcile = time.time()
+        metrics.inc('account_reconciles_total')
+
+    # --- background stream + reconciliation ---
+
+    def start(self, stream=True):
+        """Load a REST snapshot, then keep the cache current on a background thread."""
+        self.reconcile()
+        if stream and hasattr(self.client, 'subscribe_user_data'):
+            # In-process exchanges (SimulatedBinanceClient) push events directly
+            self.client.subscribe_user_data(self.apply_event)
+            stream = False
+        # Created here, not on the thread, so a stop() right after start() can always cancel it
+        self.loop = asyncio.new_event_loop()
+        self.task = self.loop.create_task(self._run(stream))
+        self.thread = threading.Thread(target=self._thread_main, name='AccountState', daemon=True)
+        self.thread.start()
+        return self
+
+    def _thread_main(self):
+        try:
+            self.loop.run_until_complete(self.task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.loop.close()
+
+    async def _run(self, stream):
+        loops = [self._reconcile_loop()] + ([self._stream_loop()] if stream else [])
+        await asyncio.gather(*loops)
+
+    async def _reconcile_loop(self):
+        while True:
+            await asyncio.sleep(self.reconcile_interval)
+            try:
+                await asyncio.to_thread(self.reconcile)
+            except Exception as e:
+                logger.error(f"❌ Failed to reconcile account state: {e}")
+
+    async def _stream_loop(self):
+        delay = 1.0
+        while True:
+            try:
+                listen_key = await asyncio.to_thread(self.client.create_listen_key)
+                async with websockets.connect(f'{self.base_url}/ws/{listen_key}', ping_interval=20, ping_timeout=20) as ws:
+                    logger.info("🔌 Connected to user-data stream.")
+                    delay = 1.0
+                    keepalive = asyncio.create_task(self._keepalive(listen_key))
+                    try:
+                        # Anything that happened while disconnected only shows up in REST
+                        await asyncio.to_thread(self.reconcile)
+                        async for message in ws:
+                            if self.apply_event(json.loads(message)) == 'listenKeyExpired':
+                                break
+                    finally:
+                        keepalive.cancel()
+                reason = 'closed by server'
+            except Exception as e:
+                reason = e
+            logger.warning(f"⚠️ User-data stream disconnected ({reason}). Reconnecting in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+
+    async def _keepalive(self, listen_key):
+        while True:
+            await asyncio.sleep(LISTEN_KEY_KEEPALIVE)
+            try:
+                await asyncio.to_thread(self.client.keepalive_listen_key, listen_key)
+            except Exception as e:
+                logger.error(f"❌ Failed to keep user-data stream alive: {e}")
+
+    def stop(self, timeout=5.0):
+        if self.loop is not None and self.task is not None:
+            self.loop.call_soon_threadsafe(self.task.cancel)
+        if self.thread is not None:
+            self.thread.join(timeout)
+            self.thread = None
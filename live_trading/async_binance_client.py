@@ -0,0 +1,122 @@
+import sys
+import os
+import asyncio
+
+# Dynamically adjust the path to include the utils directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.logger import logger
+from utils.metrics import metrics
+import aiohttp
+import ccxt.async_support as ccxt_async
+
+
+class AsyncBinanceClient:
+    """
+    asyncio market-data client built on ccxt.async_support for the async feed mode.
+    All calls share one keep-alive aiohttp session, so several traders can poll tickers
+    concurrently on one event loop. Balances and orders stay on the synchronous
+    BinanceClient (scheduler, retries, market cache) through the regular tick path.
+    Create it with `await AsyncBinanceClient.create(...)` or `async with`.
+    """
+
+    def __init__(self, api_key, secret_key, max_connections=20, keepalive_timeout=60, testnet=False):
+        self.api_key = api_key
+        self.secret_key = secret_key
+        self.testnet = testnet
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.session = None
+        self.exchange = None
+
+    @classmethod
+    async def create(cls, api_key, secret_key, **kwargs):
+        client = cls(api_key, secret_key, **kwargs)
+        await client.open()
+        return client
+
+    async def open(self):
+        """Open the pooled HTTP session and load markets once."""
+        if self.exchange is not None:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=300
+        )
+        self.session = aiohttp.ClientSession(connector=connector)
+        self.exchange = ccxt_async.binance({
+            'apiKey': self.api_key,
+            'secret': self.secret_key,
+            'session': self.session,  # ccxt reuses our pooled session instead of opening its own
+        })
+        if self.testnet:
+            self.exchange.set_sandbox_mode(True)  # Binance Spot Testnet, like BinanceClient
+        await self.exchange.load_markets()
+        logger.info(f"✅ Async Binance Client initialized{' (testnet)' if self.testnet else ''}.")
+
+    async def close(self):
+        if self.exchange is not None:
+            await self.exchange.close()
+            self.exchange = None
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _request(self, endpoint, method, *args, **kwargs):
+        """Await one REST call, counting it and timing it per endpoint."""
+        metrics.inc('rest_requests_total', endpoint=endpoint)
+        with metrics.span('rest_request', endpoint=endpoint):
+            return await method(*args, **kwargs)
+
+    async def get_ticker(self, symbol: str):
+        """Get the latest market data for a symbol."""
+        try:
+            ticker = await self._request('fetch_ticker', self.exchange.fetch_ticker, symbol)
+            logger.info("📊 Fetched ticker for %s: %s", symbol, ticker['last'])
+            return ticker
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch ticker: {e}")
+            raise
+
+    async def get_historical_klines(self, symbol: str, interval: str = '1m', limit: int = 1200, since: int = None):
+        """
+        Fetch historical OHLCV data, optionally starting at `since` (ms timestamp).
+        """
+        try:
+            ohlcv = await self._request('fetch_ohlcv', self.exchange.fetch_ohlcv, symbol=symbol, timeframe=interval,
+                                        since=since, limit=limit)
+            return [
+                {'timestamp': e[0], 'open': e[1], 'high': e[2], 'low': e[3], 'close': e[4], 'volume': e[5]}
+                for e in ohlcv
+            ]
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch historical data: {e}")
+            raise
+
+    async def get_server_time(self):
+        try:
+            return await self._request('fetch_time', self.exchange.fetch_time)
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch server time: {e}")
+            raise
+
+
+# 🔗 Boilerplate code to test async API connectivity
+if __name__ == "__main__":
+    import time
+    from config import API_KEY, SECRET_KEY, TESTNET
+
+    async def check():
+        async with AsyncBinanceClient(API_KEY, SECRET_KEY, testnet=TESTNET) as client:
+            start = time.perf_counter()
+            ticker = await client.get_ticker('BTC/USDT')
+            print(f"📊 BTC/USDT {ticker['last']} | ⏱️ {time.perf_counter() - start:.3f}s")
+
+    asyncio.run(check())
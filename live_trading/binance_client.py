@@ -4,23 +4,135 @@ import os
 # Dynamically adjust the path to include the utils directory
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from utils.logger import logger
+from utils.metrics import metrics
+from live_trading.market_cache import MarketCache, DEFAULT_MARKET_CACHE_PATH
+from live_trading.rate_limiter import (
+    RequestScheduler, RequestCoalescer, ENDPOINT_PRIORITIES, ORDER_ENDPOINTS, PRIORITY_DATA,
+    endpoint_weight, backoff_delay
+)
+import time
 import ccxt
 
+# Worth retrying: timeouts, 5xx, 429/418 (ccxt.DDoSProtection and RateLimitExceeded are NetworkErrors)
+TRANSIENT_ERRORS = (ccxt.NetworkError,)
+# The only failure where an order is known not to have reached the matching engine
+RATE_LIMIT_ERRORS = (ccxt.DDoSProtection,)
+# Reads that concurrent callers may share
+COALESCED_ENDPOINTS = ('fetch_ticker', 'fetch_tickers', 'fetch_ohlcv', 'fetch_balance', 'fetch_time', 'load_markets')
+
 
 class BinanceClient:
-    def __init__(self, api_key, secret_key):
+    def __init__(self, api_key, secret_key, weight_per_minute=6000, orders_per_10s=50, max_retries=3, testnet=False,
+                 market_cache=None):
         self.exchange = ccxt.binance({
             'apiKey': api_key,
             'secret': secret_key,
-            # 'enableRateLimit': True,
+            'enableRateLimit': False,  # RequestScheduler does weight-aware throttling instead
             # 'options': {
             #     'defaultType': 'future'  # Enable Futures Trading
             # }
         })
-        self.exchange.load_markets()
+        self.testnet = testnet
+        if testnet:
+            self.exchange.set_sandbox_mode(True)  # Binance Spot Testnet (testnet.binance.vision)
+        self.scheduler = RequestScheduler(weight_per_minute=weight_per_minute, orders_per_10s=orders_per_10s)
+        self.coalescer = RequestCoalescer()
+        self.max_retries = max_retries
+        self.market_cache = market_cache
+        self.load_markets()
         # self.exchange.verbose = True  # uncomment this line if it doesn't work
         
-        logger.info("✅ Binance Futures Client initialized.")
+        logger.info(f"✅ Binance Futures Client initialized{' (testnet)' if testnet else ''}.")
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            config['API_KEY'],
+            config['SECRET_KEY'],
+            weight_per_minute=config.get('REQUEST_WEIGHT_PER_MINUTE', 6000),
+            orders_per_10s=config.get('ORDERS_PER_10S', 50),
+            max_retries=config.get('REST_MAX_RETRIES', 3),
+            testnet=config.get('TESTNET', False),
+            market_cache=MarketCache(
+                'binance-testnet' if config.get('TESTNET') else 'binance',
+                base_path=config.get('MARKET_CACHE_PATH', DEFAULT_MARKET_CACHE_PATH),
+                ttl=config.get('MARKET_CACHE_TTL', 86400)
+            ) if config.get('MARKET_CACHE_TTL', 86400) > 0 else None,
+        )
+
+    def load_markets(self):
+        """Market metadata from the local cache when there is one, else downloaded from Binance."""
+        cached = self.market_cache.load() if self.market_cache is not None else None
+        if cached is None:
+            markets, currencies = self._fetch_markets()
+            if self.market_cache is not None:
+                self.market_cache.save(markets, currencies)
+            return
+        markets, currencies, age = cached
+        self.exchange.set_markets(markets, currencies)
+        logger.info(f"📦 Loaded {len(markets)} markets from cache ({age / 3600:.1f}h old).")
+        if not self.market_cache.fresh(age):
+            self.market_cache.refresh_async(self._fetch_markets)
+
+    def _fetch_markets(self):
+        markets = self._request('load_markets', self.exchange.load_markets, True)  # reload=True
+        return list(markets.values()), self.exchange.currencies
+
+    def _request(self, endpoint, method, *args, weight=None, **kwargs):
+        """Run one REST call through the scheduler; identical concurrent reads share one request."""
+        def call():
+            return self._send(endpoint, method, args, kwargs, weight)
+
+        if endpoint not in COALESCED_ENDPOINTS:
+            return call()
+        key = (endpoint, repr(args), repr(sorted(kwargs.items())))
+        result, coalesced = self.coalescer.run(key, call)
+        if coalesced:
+            metrics.inc('rest_coalesced_total', endpoint=endpoint)
+        return result
+
+    def _send(self, endpoint, method, args, kwargs, weight=None):
+        """Wait for request weight, send, and retry transient failures with jittered backoff."""
+        weight = weight or endpoint_weight(endpoint)
+        priority = ENDPOINT_PRIORITIES.get(endpoint, PRIORITY_DATA)
+        # A timed-out order may still have been placed, so orders only retry rate-limit rejections
+        retry_on = RATE_LIMIT_ERRORS if endpoint in ORDER_ENDPOINTS else TRANSIENT_ERRORS
+        for attempt in range(self.max_retries + 1):
+            waited = self.scheduler.acquire(endpoint, weight, priority)
+            if waited > 0:
+                metrics.observe('rate_limit_wait_seconds', waited, endpoint=endpoint)
+            metrics.inc('rest_requests_total', endpoint=endpoint)
+            try:
+                with metrics.span('rest_request', endpoint=endpoint):
+                    result = method(*args, **kwargs)
+                self._observe_used_weight()
+                return result
+            except retry_on as e:
+                if isinstance(e, RATE_LIMIT_ERRORS):
+                    self.scheduler.pause(self._retry_after(attempt))
+                if attempt == self.max_retries:
+                    raise
+                delay = backoff_delay(attempt)
+                metrics.inc('rest_retries_total', endpoint=endpoint)
+                logger.warning("⚠️ %s failed (%s); retry %d/%d in %.1fs", endpoint, e, attempt + 1, self.max_retries, delay)
+                time.sleep(delay)
+
+    def _response_header(self, name):
+        headers = getattr(self.exchange, 'last_response_headers', None) or {}
+        return headers.get(name, headers.get(name.lower()))
+
+    def _observe_used_weight(self):
+        used = self._response_header('X-MBX-USED-WEIGHT-1M')
+        if used is not None:
+            self.scheduler.observe_used_weight(float(used))
+
+    def _retry_after(self, attempt):
+        """Seconds Binance asked us to back off for (Retry-After), else an exponential guess."""
+        retry_after = self._response_header('Retry-After')
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            return min(60.0, 2.0 ** attempt)
 
 
     def set_leverage(self, symbol: str, leverage: int):
@@ -28,7 +140,9 @@ class BinanceClient:
         Set leverage for a trading pair in Binance Futures.
         """
         try:
-            response = self.exchange.set_leverage(
+            response = self._request(
+                'set_leverage',
+                self.exchange.set_leverage,
                 leverage=leverage,
                 symbol=symbol.replace('/', '')
             )
@@ -41,51 +155,64 @@ class BinanceClient:
     def get_ticker(self, symbol: str):
         """Get the latest market data for a symbol."""
         try:
-            ticker = self.exchange.fetch_ticker(symbol)
-            logger.info(f"📊 Fetched ticker for {symbol}: {ticker['last']}")
+            ticker = self._request('fetch_ticker', self.exchange.fetch_ticker, symbol)
+            logger.info("📊 Fetched ticker for %s: %s", symbol, ticker['last'])
             return ticker
         except Exception as e:
             logger.error(f"❌ Failed to fetch ticker: {e}")
             raise
 
+    def get_tickers(self, symbols):
+        """Get the latest market data for many symbols in a single request."""
+        try:
+            tickers = self._request('fetch_tickers', self.exchange.fetch_tickers, symbols,
+                                    weight=endpoint_weight('fetch_tickers', symbols))
+            logger.info("📊 Fetched %d tickers in one request.", len(tickers))
+            return tickers
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch tickers: {e}")
+            raise
+
+    def market(self, symbol: str):
+        """ccxt market metadata (precision, limits, raw Binance filters) for a symbol."""
+        return self.exchange.market(symbol)
+
     def create_order(self, symbol: str, order_type: str, side: str, amount: float, price: float = None):
         """
         Place an order on Binance Futures.
         """
+        if order_type == 'LIMIT' and price:
+            return self.submit_order(symbol, order_type, side, amount, price)
+        return self.submit_order(symbol, 'market', side, amount)
+
+    def submit_order(self, symbol: str, order_type: str, side: str, amount: float, price: float = None,
+                     params: dict = None):
+        """Send a fully prepared order as-is (see OrderExecutor for rounding and client order ids)."""
         try:
-            params = {
-                # 'test': True
-            }
-
-            if order_type == 'LIMIT' and price:
-                order = self.exchange.create_order(
-                    symbol=symbol,
-                    type=order_type,
-                    side=side,
-                    amount=amount,
-                    price=price,
-                    params=params
-                )
-            else:
-                order = self.exchange.create_order(
-                    symbol=symbol,
-                    type='market',
-                    side=side,
-                    amount=amount,
-                    params=params
-                )
-
-            logger.info(f"✅ Order successfully placed: {order}")
+            order = self._request('create_order', self.exchange.create_order, symbol=symbol, type=order_type,
+                                  side=side, amount=amount, price=price, params=params or {})
+            logger.info("✅ Order successfully placed: %s", order)
             return order
         except Exception as e:
             logger.error(f"❌ Failed to place order: {e}")
             raise
+
+    def get_order_by_client_id(self, symbol: str, client_order_id: str):
+        """Look an order up by its client order id; None if the exchange never received it."""
+        try:
+            return self._request('fetch_order', self.exchange.fetch_order, None, symbol,
+                                 params={'origClientOrderId': client_order_id})
+        except ccxt.OrderNotFound:
+            return None
+        except Exception as e:
+            logger.error(f"❌ Failed to look up order {client_order_id}: {e}")
+            raise
         
     def get_balance(self, symbol):
         """Fetch and print all wallet balances where the total is greater than 0."""
         try:
             # Fetch balance from the exchange
-            balance = self.exchange.fetch_balance()
+            balance = self._request('fetch_balance', self.exchange.fetch_balance)
             
             extrected_balance = balance.get(symbol, {}).get('free', 0)
             return extrected_balance
@@ -95,17 +222,55 @@ class BinanceClient:
             raise
 
 
-    def get_historical_klines(self, symbol: str, interval: str = '1m', limit: int = 1200):
+    def get_balances(self):
+        """Fetch the full balance snapshot (ccxt format: 'free'/'used'/'total' per asset)."""
+        try:
+            return self._request('fetch_balance', self.exchange.fetch_balance)
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch wallet balances: {e}")
+            raise
+
+    def get_open_orders(self, symbol: str = None):
+        """Fetch open orders for one symbol (or every symbol, at a much higher weight)."""
+        try:
+            return self._request('fetch_open_orders', self.exchange.fetch_open_orders, symbol,
+                                 weight=endpoint_weight('fetch_open_orders', [symbol] if symbol else None))
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch open orders: {e}")
+            raise
+
+    def create_listen_key(self):
+        """Open a user-data stream and return its listen key."""
+        response = self._request('user_data_stream', self.exchange.publicPostUserDataStream)
+        return response['listenKey']
+
+    def keepalive_listen_key(self, listen_key):
+        self._request('user_data_stream', self.exchange.publicPutUserDataStream, {'listenKey': listen_key})
+
+    def get_ohlcv(self, symbol: str, interval: str = '1m', limit: int = 1000, since: int = None):
         """
-        Fetch historical OHLCV data.
+        Fetch raw OHLCV rows ([timestamp, open, high, low, close, volume]) without per-row dicts.
         """
         try:
-            logger.info(f"📥 Fetching historical data for {symbol}, interval {interval}, limit {limit}...")
-            ohlcv = self.exchange.fetch_ohlcv(
+            return self._request(
+                'fetch_ohlcv',
+                self.exchange.fetch_ohlcv,
                 symbol=symbol,
                 timeframe=interval,
+                since=since,
                 limit=limit
             )
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch OHLCV data: {e}")
+            raise
+
+    def get_historical_klines(self, symbol: str, interval: str = '1m', limit: int = 1200, since: int = None):
+        """
+        Fetch historical OHLCV data, optionally starting at `since` (ms timestamp).
+        """
+        try:
+            logger.info(f"📥 Fetching historical data for {symbol}, interval {interval}, limit {limit}...")
+            ohlcv = self.get_ohlcv(symbol, interval=interval, limit=limit, since=since)
 
             historical_data = []
             for entry in ohlcv:
@@ -129,7 +294,7 @@ class BinanceClient:
         Fetch the server time from Binance.
         """
         try:
-            server_time = self.exchange.fetch_time()
+            server_time = self._request('fetch_time', self.exchange.fetch_time)
             logger.info(f"🕒 Binance server time: {server_time}")
             return server_time
         except Exception as e:
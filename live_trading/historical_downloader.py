@@ -0,0 +1,146 @@
+import sys
+import os
+import argparse
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timezone
+
+# Dynamically adjust the path to include the utils directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from live_trading.rate_limiter import TokenBucket
+from utils.candle_store import CandleStore, DEFAULT_STORE_PATH
+from utils.logger import logger
+from utils.timeframes import interval_to_ms
+
+
+class BulkDownloader:
+    """
+    Download long OHLCV ranges into a CandleStore.
+    The range is split into exchange-limit-sized pages that are fetched concurrently
+    (bounded by a request budget), then deduped and appended strictly in order. Because
+    the store only ever holds a contiguous prefix, an interrupted download resumes from
+    its last stored candle.
+    """
+
+    def __init__(self, client, max_workers=4, requests_per_second=5.0, page_limit=1000,
+                 max_retries=5, retry_delay=1.0):
+        self.client = client
+        self.max_workers = max_workers
+        self.budget = TokenBucket(rate=requests_per_second, capacity=max(1.0, requests_per_second))
+        self.page_limit = page_limit
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+    def _fetch_page(self, symbol, interval, page_start, page_end):
+        """Fetch one page, retrying transient failures; returns rows within [page_start, page_end)."""
+        for attempt in range(1, self.max_retries + 1):
+            self.budget.acquire()
+            try:
+                rows = self.client.get_ohlcv(symbol, interval=interval, limit=self.page_limit, since=page_start)
+                return [row for row in rows if page_start <= row[0] < page_end]
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_delay * 2 ** (attempt - 1)
+                logger.warning(f"⚠️ Page {page_start} failed ({e}); retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+
+    def download(self, symbol, interval, start_ms, end_ms=None, store=None):
+        """Fill `store` with candles in [start_ms, end_ms); returns the number of candles written."""
+        interval_ms = interval_to_ms(interval)
+        # An empty store is falsy (CandleStore defines __len__), so test for None explicitly
+        if store is None:
+            store = CandleStore(symbol, interval)
+
+        # Never store the still-open candle
+        now_ms = int(time.time() * 1000)
+        end_ms = min(end_ms or now_ms, now_ms - now_ms % interval_ms)
+
+        start_ms -= start_ms % interval_ms
+        # History older than the store is downloaded separately and put in front of it
+        written = 0
+        first = store.first_timestamp()
+        if first is not None and start_ms < first:
+            written += self._backfill(symbol, interval, start_ms, min(first, end_ms), store)
+
+        # Resume after the last stored candle
+        last = store.last_timestamp()
+        if last is not None and last + interval_ms > start_ms:
+            start_ms = last + interval_ms
+        if start_ms >= end_ms:
+            if written:
+                return written
+            logger.info(f"✅ {store.path} already covers the requested range.")
+            return 0
+
+        page_span = self.page_limit * interval_ms
+        pages = [(s, min(s + page_span, end_ms)) for s in range(start_ms, end_ms, page_span)]
+        logger.info(f"📥 Downloading {symbol} {interval}: {len(pages)} pages with {self.max_workers} workers...")
+
+        next_page = 0        # next page to submit
+        next_write = 0       # next page to append to the store
+        completed = {}
+        in_flight = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            try:
+                while next_write < len(pages):
+                    # Keep a bounded window of pages in flight so memory stays flat
+                    while next_page < len(pages) and len(in_flight) < self.max_workers * 2:
+                        future = pool.submit(self._fetch_page, symbol, interval, *pages[next_page])
+                        in_flight[future] = next_page
+                        next_page += 1
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        completed[in_flight.pop(future)] = future.result()
+
+                    # Stream consecutive finished pages into the store in order
+                    while next_write in completed:
+                        written += store.append(completed.pop(next_write))
+                        next_write += 1
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+        logger.info(f"✅ Downloaded {written} candles into {store.path} ({len(store)} total).")
+        return written
+
+    def _backfill(self, symbol, interval, start_ms, end_ms, store):
+        """Download [start_ms, end_ms) into a scratch store and prepend it to `store`."""
+        logger.info(f"📥 {store.path} starts after the requested range; backfilling the older candles first.")
+        folder = tempfile.mkdtemp(prefix='backfill-', dir=os.path.dirname(os.path.abspath(store.path)))
+        try:
+            prefix = CandleStore(symbol, interval, base_path=folder)
+            self.download(symbol, interval, start_ms, end_ms, store=prefix)
+            return store.prepend(prefix.path)
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+def _parse_date(value):
+    return int(datetime.strptime(value, '%Y-%m-%d').replace(tzinfo=timezone.utc).timestamp() * 1000)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-download OHLCV history into the local candle store.")
+    parser.add_argument('--symbol', default='BTC/USDT')
+    parser.add_argument('--interval', default='1m')
+    parser.add_argument('--start', required=True, help="YYYY-MM-DD (UTC)")
+    parser.add_argument('--end', help="YYYY-MM-DD (UTC), default now")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--rps', type=float, default=5.0, help="Request budget per second")
+    parser.add_argument('--store-path', default=DEFAULT_STORE_PATH)
+    args = parser.parse_args()
+
+    from config import API_KEY, SECRET_KEY
+    from live_trading.binance_client import BinanceClient
+
+    downloader = BulkDownloader(BinanceClient(API_KEY, SECRET_KEY), max_workers=args.workers,
+                                requests_per_second=args.rps)
+    downloader.download(
+        args.symbol, args.interval, _parse_date(args.start),
+        _parse_date(args.end) if args.end else None,
+        store=CandleStore(args.symbol, args.interval, base_path=args.store_path)
+    )
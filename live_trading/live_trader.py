@@ -1,57 +1,215 @@
-from live_trading.binance_client import BinanceClient
+from live_trading.binance_client import BinanceClient, TRANSIENT_ERRORS
+from live_trading.market_stream import KlineStream, BINANCE_WS_URL, BINANCE_TESTNET_WS_URL
+from live_trading.account_state import AccountState
+from live_trading.order_execution import OrderExecutor
+from live_trading.simulated_client import ReplayFinished
 from strategies.live_strategy import LiveStrategy, Signal
+from strategies.price_buffer import to_datetime64
 from utils.logger import logger
-from visualization.live_plot_results import plot_results
+from utils.candle_store import CandleStore, DEFAULT_STORE_PATH
+from utils.trade_journal import TradeJournal, JOURNAL_BACKENDS
+from utils.metrics import metrics, MetricsExporter
+from utils.clock import SYSTEM_CLOCK
+from utils.startup import startup
+from utils.checkpoint import save_checkpoint, load_checkpoint, checkpoint_key
+from utils.candle_aggregator import CandleAggregator
+from utils.timeframes import interval_to_ms
+from visualization.plot_worker import PlotWorker, plot_filename
 
-import pandas as pd
+import numpy as np
+import asyncio
 import os
-import csv
+import re
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 
 
-class LiveTrader:
-    def __init__(self, config):
-        self.client = BinanceClient(config['API_KEY'], config['SECRET_KEY'])
-        self.strategy = LiveStrategy(
-            stop_loss=config['STOP_LOSS'],
-            profit_target=config['PROFIT_TARGET'],
-            short_window=config['SHORT_WINDOW'],
-            long_window=config['LONG_WINDOW'],
-            enable_longing=config['ENABLE_LONGING'],
+# Quote currency spent per entry
+TRADE_MONEY_USD = 11
+
+# Signal -> (order side, recorded action, recorded position, log message)
+SIGNAL_ACTIONS = {
+    Signal.BUY_LONG: ('BUY', 'BUY', 'LONG', "🟢 Opening LONG position."),
+    Signal.SELL_LONG: ('SELL', 'SELL', 'LONG', "🔴 Closing LONG position."),
+    Signal.STOP_LOSS_LONG: ('SELL', 'STOP_LOSS', 'LONG', "🛑 Stop-Loss triggered for LONG. Closing LONG position."),
+    Signal.HOLD: (None, 'HOLD', '', "HOLD position triggered."),
+}
+
+
+def evaluate_tick(strategy, price, timestamp):
+    """Feed one bar close into the strategy; returns the signal and its order side, action and position."""
+    with metrics.span('stage', stage='update_data'):
+        strategy.update_data(price, timestamp)
+    with metrics.span('stage', stage='get_signal'):
+        signal = strategy.get_signal()
+    metrics.inc('signals_total', signal=signal.value)
+    side, action, position, message = SIGNAL_ACTIONS[signal]
+    logger.info(message)
+    return signal, side, action, position
+
+
+def closed_bars(candles, timeframe_ms, now_ms, price, timestamp):
+    """
+    (open time, close, timestamp) of the bars one polled price closes. With a 1m timeframe every
+    poll is a bar, as before; longer timeframes fold polls into the open bar until it closes.
+    """
+    if timeframe_ms <= 60 * 1000:
+        return [(now_ms - now_ms % timeframe_ms, price, timestamp)]
+    return [(bar['timestamp'], bar['close'], LiveTrader.bar_timestamp(bar)) for _, bar in candles.add_trade(now_ms, price)]
+
+
+def catch_up_checkpoint(strategy, client, symbol, timeframe, checkpoint, key, now_ms):
+    """
+    Restore a checkpoint into `strategy` and replay the candles closed since it was written.
+    Returns the missed candles, or None when a full prefill is needed; an open position is
+    restored either way.
+    """
+    strategy.restore_position(checkpoint['strategy'])
+    logger.info(f"♻️ Restored position: {strategy.position or 'NONE'} (entry {strategy.entry_price})")
+
+    if checkpoint['key'] != key or checkpoint['last_candle_time'] is None:
+        logger.warning("⚠️ Strategy settings changed since the checkpoint; prefilling indicators from history.")
+        return None
+
+    timeframe_ms = interval_to_ms(timeframe)
+    since = checkpoint['last_candle_time'] + timeframe_ms
+    try:
+        history = client.get_historical_klines(symbol=symbol, interval=timeframe, limit=1000, since=since)
+    except Exception as e:
+        logger.error(f"❌ Failed to backfill the checkpoint gap: {e}")
+        return None
+    if len(history) >= 1000:
+        logger.warning("⚠️ Checkpoint is too old to backfill; prefilling indicators from history.")
+        return None
+    missed = [c for c in history if c['timestamp'] >= since and c['timestamp'] + timeframe_ms <= now_ms]
+
+    strategy.restore(checkpoint['strategy'])
+    strategy.catch_up([c['timestamp'] for c in missed], [c['close'] for c in missed])
+    return missed
+
+
+def journal_rows(strategy, action, position='NONE', rows=None):
+    """Journal rows, with their indicators, for the last `rows` buffered bars (all of them by default)."""
+    arrays = strategy.buffer.to_arrays()
+    start = -rows if rows else 0
+    timestamps = np.datetime_as_string(arrays['timestamp'][start:], unit='s')
+    return [
+        (str(ts).replace('T', ' '), close, fast_ind, slow_ind, action, position, '', '')
+        for ts, close, fast_ind, slow_ind in zip(
+            timestamps, arrays['close'][start:].tolist(),
+            arrays['FAST_IND'][start:].tolist(), arrays['SLOW_IND'][start:].tolist()
         )
+    ]
+
+
+class LiveTrader:
+    def __init__(self, config, client=None, run_folder=None, plot_worker=None, export_metrics=True, account=None,
+                 clock=None, indicators=None):
+        self.config = config
+        # Wall clock by default; a SimulatedClock replays recorded sessions through this same loop
+        self.clock = clock or SYSTEM_CLOCK
+        if client is None:
+            with startup.stage('client'):
+                client = BinanceClient.from_config(config)
+        self.client = client
+        # Filters and order templates are prepared once; each order only fills in amount and id
+        self.executor = OrderExecutor.from_config(self.client, config, [config['LIVE_SYMBOL']])
+        self.strategy = LiveStrategy.from_config(config, clock=self.clock, indicators=indicators)
         self.symbol = config['LIVE_SYMBOL']
+        self.base_asset = config.get('BASE_ASSET', 'BTC')
+
+        # The strategy acts on closed bars of this timeframe, built up from the base stream
+        self.timeframe = config.get('TIMEFRAME', '1m')
+        self.timeframe_ms = interval_to_ms(self.timeframe)
+        self.candles = CandleAggregator(timeframes=(self.timeframe,), base_interval=config.get('STREAM_INTERVAL', '1m'))
+        self.last_candle_time = None  # open time (ms) of the newest prefilled bar
         
         self.stop_reason = 'Unknown'
         self.error_message = ''
-        self.run_folder = self.create_run_folder()
-        self.csv_path = os.path.join(self.run_folder, 'data_trade.csv')
-        self.plot_path = os.path.join(self.run_folder, 'plot.png')
+        # RESUME continues the latest run (journal, checkpoint) instead of starting a new one
+        self.run_folder = run_folder or (config.get('RESUME') and self.latest_run_folder()) or self.create_run_folder()
+        os.makedirs(self.run_folder, exist_ok=True)
+        journal_backend = config.get('JOURNAL_BACKEND', 'csv')
+        self.journal_path = os.path.join(self.run_folder, 'data_trade' + JOURNAL_BACKENDS[journal_backend].extension)
+        self.plot_path = os.path.join(self.run_folder, plot_filename(config))
         self.config_backup_path = os.path.join(self.run_folder, 'config_backup.py')
+        self.checkpoint_path = os.path.join(self.run_folder, 'checkpoint.pkl')
+        self.checkpoint_interval = config.get('CHECKPOINT_INTERVAL', 60)  # seconds; 0 disables checkpoints
+        self.last_checkpoint = self.clock.monotonic()
         self.save_config(config)
 
-        # Initialize CSV with headers
-        if not os.path.exists(self.csv_path):
-            with open(self.csv_path, mode='w', newline='') as file:
-                writer = csv.DictWriter(file, fieldnames=['timestamp', 'close', 'FAST_IND', 'SLOW_IND', 'action', 'position', 'stop_reason', 'error_message'])
-                writer.writeheader()
-            logger.info(f"📄 Created new CSV file: {self.csv_path}")
-
-        # Fetch Historical Data
-        self.prefill_historical_data()
-        self.trade_money_usd = 11
-    def create_run_folder(self):
+        # Charts render on a background thread from in-memory state
+        self.events = []  # (timestamp, price, action) of every order, for plot markers
+        self.owns_plot_worker = plot_worker is None
+        self.plot_worker = plot_worker or PlotWorker(refresh_interval=config.get('PLOT_INTERVAL', 60),
+                                                       window=config.get('PLOT_WINDOW', 0)).start()
+
+        # Latency/counter snapshot written into the run folder
+        self.metrics_exporter = None
+        if export_metrics:
+            self.metrics_exporter = MetricsExporter(
+                metrics, os.path.join(self.run_folder, 'metrics.json'), interval=config.get('METRICS_INTERVAL', 60)
+            ).start()
+
+        # Balances are read from a local cache kept current by order responses and the user-data stream
+        self.owns_account = account is None
+        if account is None:
+            with startup.stage('account'):
+                account = AccountState(
+                    self.client, symbols=[self.symbol], reconcile_interval=config.get('ACCOUNT_RECONCILE_INTERVAL', 300),
+                    base_url=BINANCE_TESTNET_WS_URL if config.get('TESTNET') else BINANCE_WS_URL
+                ).start(stream=config.get('ACCOUNT_STREAM', True))
+        self.account = account
+
+        # Trade journal keeps one open handle and batches rows
+        self.journal = TradeJournal(
+            self.journal_path,
+            backend=journal_backend,
+            batch_size=config.get('JOURNAL_BATCH_SIZE', 100),
+            flush_interval=config.get('JOURNAL_FLUSH_INTERVAL', 5.0)
+        )
+
+        # Warm resume from the last checkpoint, else fetch the full history
+        with startup.stage('prefill'):
+            checkpoint = load_checkpoint(self.checkpoint_path) if config.get('RESUME') else None
+            if checkpoint is None or not self.resume(checkpoint):
+                self.prefill_historical_data()
+        self.trade_money_usd = TRADE_MONEY_USD
+
+    @staticmethod
+    def run_numbers(base_path='./data/live_runs'):
+        """Numbers of the existing runN folders."""
+        if not os.path.isdir(base_path):
+            return []
+        return [
+            int(match.group(1)) for match in (re.fullmatch(r'run(\d+)', d) for d in os.listdir(base_path))
+            if match and os.path.isdir(os.path.join(base_path, match.group(0)))
+        ]
+
+    @staticmethod
+    def create_run_folder():
         """Create a unique folder for each trading run."""
         base_path = './data/live_runs'
         os.makedirs(base_path, exist_ok=True)
 
-        existing_runs = [d for d in os.listdir(base_path) if os.path.isdir(os.path.join(base_path, d)) and d.startswith('run')]
-        run_number = len(existing_runs) + 1
+        # Highest number + 1, so deleted or foreign folders never make two runs share a number
+        run_number = max(LiveTrader.run_numbers(base_path), default=0) + 1
         run_folder = os.path.join(base_path, f'run{run_number}')
         os.makedirs(run_folder, exist_ok=True)
         logger.info(f"📁 Created run folder: {run_folder}")
         return run_folder
 
+    @staticmethod
+    def latest_run_folder():
+        """The most recent run folder, or None if there is none."""
+        base_path = './data/live_runs'
+        numbers = LiveTrader.run_numbers(base_path)
+        if not numbers:
+            return None
+        run_folder = os.path.join(base_path, f'run{max(numbers)}')
+        logger.info(f"📁 Resuming run folder: {run_folder}")
+        return run_folder
+
     def save_config(self, config):
         """Save a backup of the current configuration."""
         with open(self.config_backup_path, 'w') as f:
@@ -60,115 +218,165 @@ class LiveTrader:
         logger.info(f"💾 Configuration saved to {self.config_backup_path}")
 
     def record_data(self, timestamp, price, action, position):
-        """Record live trade details incrementally into the CSV."""
+        """Record live trade details into the trade journal."""
+        if action != 'HOLD':
+            self.events.append((to_datetime64(timestamp), price, action))
         try:
-            trade_data = {
-                'timestamp': pd.to_datetime(timestamp).strftime('%Y-%m-%d %H:%M:%S'),
-                'close': price,
-                'FAST_IND': float(self.strategy.data['FAST_IND'].iloc[-1]),
-                'SLOW_IND': float(self.strategy.data['SLOW_IND'].iloc[-1]),
-                'action': action,
-                'position': position,
-                'stop_reason': self.stop_reason,
-                'error_message': self.error_message
-            }
-            # Write to CSV incrementally
-            with open(self.csv_path, mode='a', newline='') as file:
-                writer = csv.DictWriter(
-                    file,
-                    fieldnames=['timestamp', 'close', 'FAST_IND', 'SLOW_IND', 'action', 'position', 'stop_reason', 'error_message']
-                )
-                # Write the header if the file is empty
-                if file.tell() == 0:
-                    writer.writeheader()
-                writer.writerow(trade_data)
-
+            _, _, fast_ind, slow_ind, *_ = self.strategy.buffer.last()
+            # Orders are flushed right away; HOLD rows are batched
+            self.journal.record(
+                (timestamp, price, fast_ind, slow_ind, action, position, self.stop_reason, self.error_message),
+                urgent=action != 'HOLD'
+            )
         except Exception as e:
             logger.error(f"❌ Failed to record data: {e}")
 
+    def checkpoint_key(self):
+        return checkpoint_key(self.config)
 
+    def save_checkpoint(self):
+        """Snapshot strategy, position and the last processed candle to the run folder."""
+        try:
+            with metrics.span('stage', stage='checkpoint'):
+                save_checkpoint(self.checkpoint_path, {
+                    'key': self.checkpoint_key(),
+                    'symbol': self.symbol,
+                    'last_candle_time': self.last_candle_time,
+                    'strategy': self.strategy.snapshot(),
+                    'events': self.events,
+                })
+            self.last_checkpoint = self.clock.monotonic()
+        except Exception as e:
+            logger.error(f"❌ Failed to save checkpoint: {e}")
 
+    def resume(self, checkpoint):
+        """
+        Restore a checkpoint and backfill only the candles missed since it was written.
+        Returns False when a full prefill is needed; an open position is restored either way.
+        """
+        if checkpoint['symbol'] != self.symbol:
+            logger.warning(f"⚠️ Checkpoint is for {checkpoint['symbol']}, not {self.symbol}; starting fresh.")
+            return False
+        self.events = checkpoint['events']
+        missed = catch_up_checkpoint(self.strategy, self.client, self.symbol, self.timeframe, checkpoint,
+                                     self.checkpoint_key(), int(self.clock.time() * 1000))
+        if missed is None:
+            return False
+        self.last_candle_time = missed[-1]['timestamp'] if missed else checkpoint['last_candle_time']
+        if missed:
+            self.journal.record_many(journal_rows(self.strategy, 'BACKFILL', self.strategy.position or 'NONE', len(missed)))
+        logger.info(f"✅ Resumed from checkpoint; backfilled {len(missed)} missed {self.timeframe} candles.")
+        return True
 
     def prefill_historical_data(self):
-        """Fetch 1000 minutes of historical data and prefill strategy."""
-        logger.info("📥 Fetching 1000 minutes of historical data...")
+        """Load 1000 historical bars of the strategy timeframe (synced into the local candle store) and prefill strategy."""
+        logger.info(f"📥 Loading 1000 {self.timeframe} candles of historical data...")
         try:
-            historical_data = self.client.get_historical_klines(
-                symbol=self.symbol,
-                interval='1m',
-                limit=1000
-            )
-            self.strategy.prefill_data(historical_data)
-
-            # Prepare CSV DataFrame
-            prefilled_df = self.strategy.data.copy()
-            # Add Metadata Columns
-            prefilled_df['action'] = 'PREFILL'
-            prefilled_df['position'] = 'NONE'
-            prefilled_df['stop_reason'] = ''
-            prefilled_df['error_message'] = ''
-
-            # Ensure proper column order
-            expected_columns = ['timestamp', 'close', 'FAST_IND', 'SLOW_IND', 'action', 'position', 'stop_reason', 'error_message']
-            prefilled_df = prefilled_df[expected_columns]
-
-            # Debug Validation
-            logger.info(f"📊 Prefill Data Preview:\n{prefilled_df.head()}")
-
-            prefilled_df.to_csv(
-                self.csv_path,
-                mode='a',
-                header=not os.path.exists(self.csv_path),
-                index=False
-            )
-            logger.info("✅ Prefilled data successfully written to CSV with indicators.")
+            if self.config.get('CANDLE_CACHE', True):
+                # Only the tail missing since the last stored candle is downloaded
+                store = CandleStore(self.symbol, interval=self.timeframe, base_path=self.config.get('CANDLE_STORE_PATH', DEFAULT_STORE_PATH))
+                store.sync(self.client, limit=1000)
+                candles = store.load(limit=1000)
+                self.strategy.prefill_arrays(candles['timestamp'], candles['close'])
+            else:
+                historical_data = self.client.get_historical_klines(
+                    symbol=self.symbol,
+                    interval=self.timeframe,
+                    limit=1000
+                )
+                self.strategy.prefill_data(historical_data)
+
+            # Write prefill rows with their indicators to the journal
+            arrays = self.strategy.buffer.to_arrays()
+            if len(arrays['timestamp']):
+                self.last_candle_time = int(arrays['timestamp'][-1].astype('datetime64[ms]').astype(np.int64))
+            rows = journal_rows(self.strategy, 'PREFILL')
+            self.journal.record_many(rows)
+            logger.info(f"✅ Prefilled {len(rows)} rows successfully written to the journal with indicators.")
         except Exception as e:
             logger.error(f"❌ Failed to prefill historical data: {e}")
             raise
 
 
+    def process_tick(self, price, timestamp, received_at=None):
+        """Feed one price into the strategy and act on the resulting signal."""
+        received_at = received_at or time.perf_counter()
+        # Update strategy with the latest price
+        signal, side, action, position = evaluate_tick(self.strategy, price, timestamp)
+        #Handle Signals
+        if side == 'BUY':  # Koop, uptrend
+            quantity = self.trade_money_usd / price  #OR usdc value for full balance
+            with metrics.span('stage', stage='create_order'):
+                order = self.executor.submit(self.symbol, 'BUY', quantity, reference_price=price)
+            self.account.apply_order(order)
+            metrics.observe('tick_to_order_seconds', time.perf_counter() - received_at)
+        elif side == 'SELL':
+            btc_quantity = self.account.free(self.base_asset)  # cached, no round-trip
+            with metrics.span('stage', stage='create_order'):
+                order = self.executor.submit(self.symbol, 'SELL', btc_quantity, reference_price=price)
+            self.account.apply_order(order)
+            metrics.observe('tick_to_order_seconds', time.perf_counter() - received_at)
+        with metrics.span('stage', stage='record'):
+            self.record_data(timestamp, price, action, position)
+        # Position changes are checkpointed right away, everything else periodically
+        if self.checkpoint_interval and (
+                side is not None or self.clock.monotonic() - self.last_checkpoint >= self.checkpoint_interval):
+            self.save_checkpoint()
+        if not startup.done:
+            startup.finish()
+        return signal
+
+    def on_price(self, price, timestamp):
+        """
+        Handle one polled price. With a 1m timeframe every poll is a tick, as before; longer
+        timeframes fold polls into the open bar and only act when it closes.
+        """
+        signal = None
+        now_ms = int(self.clock.time() * 1000)
+        for candle_time, close, bar_time in closed_bars(self.candles, self.timeframe_ms, now_ms, price, timestamp):
+            self.last_candle_time = candle_time
+            signal = self.process_tick(close, bar_time)
+        return signal
+
+    @staticmethod
+    def bar_timestamp(bar):
+        return datetime.fromtimestamp(bar['timestamp'] / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+    def update_plot(self, force=False):
+        """Hand the current state to the plot worker; never waits for rendering."""
+        with metrics.span('stage', stage='plot_submit'):
+            self.plot_worker.submit(self.plot_path, self.strategy.buffer, self.events, force=force,
+                                    labels=self.strategy.indicator_labels)
+
     def run(self):
         logger.info(f"🚀 Starting live trading for {self.symbol} on Binance...")
         try:
             while True:
                 try:
-                    # usdc_value = self.client.get_balance('USDC')
-                    btc_quantity = self.client.get_balance('BTC')
-                    # Fetch current ticker price
-                    ticker = self.client.get_ticker(self.symbol)
-                    price = ticker['last']
-                    quantity = self.trade_money_usd / price  #OR usdc value for full balance
-                    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    # Update strategy with the latest price
-                    self.strategy.update_data(price)
-                    signal = self.strategy.get_signal()
-                    #Handle Signals
-                    if signal == Signal.BUY_LONG:  # Koop, uptrend
-                        logger.info("🟢 Opening LONG position.")
-                        self.client.create_order(self.symbol, 'MARKET', 'BUY', quantity)
-                        self.record_data(timestamp, price, 'BUY', 'LONG')
-                    elif signal == Signal.SELL_LONG:
-                        logger.info("🔴 Closing LONG position.")
-                        self.client.create_order(self.symbol, 'MARKET', 'SELL', btc_quantity)
-                        self.record_data(timestamp, price, 'SELL', 'LONG')
-                    elif signal == Signal.STOP_LOSS_LONG:
-                        logger.info("🛑 Stop-Loss triggered for LONG. Closing LONG position.")
-                        self.client.create_order(self.symbol, 'MARKET', 'SELL', btc_quantity)
-                        self.record_data(timestamp, price, 'STOP_LOSS', 'LONG')
-                    elif signal == Signal.HOLD:
-                        logger.info("HOLD position triggered.")
-                        self.record_data(timestamp, price, 'HOLD', '')
-
-                    # Update plot
-                    try:
-                        df = pd.read_csv(self.csv_path, parse_dates=['timestamp'])
-                        df.set_index('timestamp', inplace=True)  # Set 'timestamp' as the index
-                        plot_results(df, self.plot_path)
-                    except Exception as plot_error:
-                        logger.error(f"❌ Failed to generate plot: {plot_error}")
+                    with metrics.span('cycle'):
+                        # Fetch current ticker price
+                        with metrics.span('stage', stage='fetch_ticker'):
+                            ticker = self.client.get_ticker(self.symbol)
+                        price = ticker['last']
+                        timestamp = self.clock.now().strftime('%Y-%m-%d %H:%M:%S')
+                        self.on_price(price, timestamp)
+
+                        # Update plot
+                        self.update_plot()
                     
                     logger.info("✅ Run completed. Waiting 1 minute before the next iteration...")
-                    time.sleep(60)  # Wait 1 minute before the next cycle
+                    self.clock.sleep(60)  # Wait 1 minute before the next cycle
+
+                except ReplayFinished:
+                    self.stop_reason = 'Replay Finished'
+                    logger.info("🏁 Replay finished: no more recorded market data.")
+                    break
+
+                except TRANSIENT_ERRORS as e:
+                    # Retries are exhausted but the exchange usually recovers: skip this cycle, keep the session
+                    metrics.inc('cycles_skipped_total')
+                    logger.warning(f"⚠️ Transient error, skipping this cycle: {e}")
+                    self.clock.sleep(60)
 
                 except Exception as e:
                     self.stop_reason = 'Error'
@@ -182,10 +390,104 @@ class LiveTrader:
         except Exception as e:
             logger.error(f"❌ Error: {e}")
         finally:
+            self.finish()
+
+    def run_stream(self, interval='1m', source='kline'):
+        """
+        Push-based trading loop: act on every closed bar of the strategy timeframe, aggregated
+        from the Binance WebSocket feed (`interval` klines or raw trades) instead of polling
+        the REST ticker once a minute.
+        """
+        logger.info(f"🚀 Starting streaming live trading for {self.symbol} ({self.timeframe} bars from {interval} {source}s)...")
+        stream = KlineStream(self.symbol, interval=interval, client=self.client, mode=source)
+        if self.last_candle_time is not None:
+            # The first connect backfills the base candles of the bar that is still open
+            stream.last_timestamp = self.last_candle_time + self.timeframe_ms - stream.interval_ms
+        try:
+            asyncio.run(self._consume_stream(stream))
+        except KeyboardInterrupt:
+            self.stop_reason = 'Manual Stop'
+            logger.info("🛑 Live trading manually stopped by user.")
+        except Exception as e:
+            self.stop_reason = 'Error'
+            self.error_message = str(e)
+            logger.error(f"❌ Error in live trading: {e}")
+        finally:
+            self.finish()
+
+    async def _consume_stream(self, stream):
+        async for event in stream.candles():
+            received_at = time.perf_counter()
+            for timeframe, bar in self.candles.add(event):
+                if timeframe != self.timeframe:
+                    continue  # built for another subscriber
+                self.last_candle_time = bar['timestamp']
+                # How far behind the bar close we are acting (grows if the bot falls behind)
+                metrics.set_gauge('market_lag_seconds', time.time() - (bar['timestamp'] + self.timeframe_ms) / 1000)
+                # Order placement is blocking; keep the socket serviced while it runs
+                await asyncio.to_thread(self.process_tick, bar['close'], self.bar_timestamp(bar), received_at)
+                self.update_plot()
+
+    def run_async(self, interval_seconds=60):
+        """Async polling loop on top of AsyncBinanceClient."""
+        logger.info(f"🚀 Starting async live trading for {self.symbol} on Binance...")
+        try:
+            asyncio.run(self._run_async(interval_seconds))
+        except KeyboardInterrupt:
+            self.stop_reason = 'Manual Stop'
+            logger.info("🛑 Live trading manually stopped by user.")
+        except Exception as e:
+            self.stop_reason = 'Error'
+            self.error_message = str(e)
+            logger.error(f"❌ Error in live trading: {e}")
+        finally:
+            self.finish()
+
+    async def _run_async(self, interval_seconds):
+        # aiohttp and ccxt's async exchanges are only loaded when the async feed is used
+        from live_trading.async_binance_client import AsyncBinanceClient
+        async with AsyncBinanceClient(self.config['API_KEY'], self.config['SECRET_KEY'],
+                                      testnet=self.config.get('TESTNET', False)) as client:
+            await self.trade_async(client, interval_seconds)
+
+    async def trade_async(self, client, interval_seconds=60):
+        """
+        One symbol's trading loop on a (possibly shared) AsyncBinanceClient.
+        Several traders can run in one process with asyncio.gather(*(t.trade_async(client) ...)).
+        Only the ticker poll is async; balances and orders go through the sync client in on_price.
+        """
+        while True:
+            cycle_start = time.monotonic()
             try:
-                plot_results(pd.read_csv(self.csv_path, parse_dates=['timestamp']).set_index('timestamp'), self.plot_path)
-                logger.info("✅ Final plot generated successfully.")
-            except Exception as plot_error:
-                logger.error(f"❌ Failed to generate final plot: {plot_error}")
+                with metrics.span('stage', stage='fetch_ticker'):
+                    ticker = await client.get_ticker(self.symbol)
+                timestamp = self.clock.now().strftime('%Y-%m-%d %H:%M:%S')
+                # Same tick path as run() (timeframe aggregation, orders, account, journal, checkpoints);
+                # order placement and file I/O block, so they stay off the event loop
+                await asyncio.to_thread(self.on_price, ticker['last'], timestamp)
+                self.update_plot()
+            except TRANSIENT_ERRORS as e:
+                # Retries are exhausted but the exchange usually recovers: skip this cycle, keep the session
+                metrics.inc('cycles_skipped_total')
+                logger.warning(f"⚠️ Transient error, skipping this cycle: {e}")
+
+            # Keep a fixed cadence instead of sleeping a full interval after slow cycles
+            await asyncio.sleep(max(0.0, interval_seconds - (time.monotonic() - cycle_start)))
+
+    def finish(self):
+        if self.checkpoint_interval:
+            self.save_checkpoint()
+        self.journal.close()
+        if self.owns_account:
+            self.account.stop()
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.stop()
+        try:
+            self.update_plot(force=True)
+            if self.owns_plot_worker:
+                self.plot_worker.stop()
+            logger.info("✅ Final plot generated successfully.")
+        except Exception as plot_error:
+            logger.error(f"❌ Failed to generate final plot: {plot_error}")
 
-            logger.info("✅ Live trading session completed.")
+        logger.info("✅ Live trading session completed.")
@@ -0,0 +1,66 @@
+import sys
+import os
+import json
+import threading
+import time
+
+# Dynamically adjust the path to include the utils directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.logger import logger
+
+DEFAULT_MARKET_CACHE_PATH = './data/markets'
+
+
+class MarketCache:
+    """
+    Exchange market metadata (symbols, precision, limits) persisted between runs.
+    A warm start loads the file instead of downloading the full Binance market list;
+    entries older than `ttl` seconds are still used but refreshed in the background.
+    """
+
+    def __init__(self, name='binance', base_path=DEFAULT_MARKET_CACHE_PATH, ttl=86400):
+        self.path = os.path.join(base_path, f'{name}.json')
+        self.ttl = ttl
+        self.refresh_thread = None
+
+    def load(self):
+        """Return (markets, currencies, age in seconds), or None if there is no usable cache."""
+        try:
+            with open(self.path) as f:
+                cached = json.load(f)
+            return cached['markets'], cached.get('currencies'), max(0.0, time.time() - cached['saved_at'])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable market cache {self.path}: {e}")
+            return None
+
+    def save(self, markets, currencies=None):
+        """Write atomically so a crash mid-write never leaves a truncated cache."""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({'saved_at': time.time(), 'markets': markets, 'currencies': currencies}, f, default=str)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️ Failed to save market cache: {e}")
+
+    def fresh(self, age):
+        return age < self.ttl
+
+    def refresh_async(self, fetch):
+        """Run `fetch()` -> (markets, currencies) on a daemon thread and persist the result."""
+        if self.refresh_thread is not None and self.refresh_thread.is_alive():
+            return self.refresh_thread
+
+        def refresh():
+            try:
+                self.save(*fetch())
+                logger.info("✅ Market metadata refreshed in the background.")
+            except Exception as e:
+                logger.warning(f"⚠️ Background market refresh failed, keeping cached markets: {e}")
+
+        self.refresh_thread = threading.Thread(target=refresh, name='MarketRefresh', daemon=True)
+        self.refresh_thread.start()
+        return self.refresh_thread
@@ -0,0 +1,141 @@
+import sys
+import os
+import asyncio
+import json
+import time
+
+# Dynamically adjust the path to include the utils directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.logger import logger
+from utils.timeframes import interval_to_ms
+import websockets
+
+BINANCE_WS_URL = 'wss://stream.binance.com:9443'
+BINANCE_TESTNET_WS_URL = 'wss://testnet.binance.vision'
+
+
+class KlineStream:
+    """
+    Push-based market data feed over the Binance WebSocket API.
+    Yields closed klines (mode='kline') or individual trades (mode='trade') and, after a
+    reconnect, backfills the missed candles through `client.get_historical_klines`.
+    """
+
+    def __init__(self, symbol, interval='1m', client=None, base_url=BINANCE_WS_URL, mode='kline',
+                 reconnect_delay=1.0, max_reconnect_delay=60.0, backfill_limit=1000):
+        if mode not in ('kline', 'trade'):
+            raise ValueError(f"❌ Unsupported stream mode: {mode}")
+        self.symbol = symbol
+        self.interval = interval
+        self.interval_ms = interval_to_ms(interval)
+        self.client = client
+        self.mode = mode
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.backfill_limit = backfill_limit
+
+        stream_name = symbol.replace('/', '').lower()
+        stream_name += f'@kline_{interval}' if mode == 'kline' else '@trade'
+        self.url = f"{base_url.rstrip('/')}/ws/{stream_name}"
+
+        # Open time (ms) of the last candle handed out, used for dedupe and gap backfill
+        self.last_timestamp = None
+        self.last_trade_id = None
+        self.reconnects = 0
+
+    async def candles(self):
+        """Async generator of market events; reconnects forever with exponential backoff."""
+        delay = self.reconnect_delay
+        while True:
+            try:
+                async with websockets.connect(self.url, ping_interval=20, ping_timeout=20) as ws:
+                    logger.info(f"🔌 Connected to market stream {self.url}")
+                    delay = self.reconnect_delay
+
+                    # Messages received meanwhile are queued by the socket, so nothing is lost
+                    for candle in await self._backfill():
+                        yield candle
+
+                    async for message in ws:
+                        event = self.parse_message(message)
+                        if event is not None:
+                            yield event
+                reason = 'closed by server'
+            # WebSocketException covers rejected handshakes (429/5xx during maintenance);
+            # ValueError/KeyError a malformed frame
+            except (websockets.WebSocketException, OSError, asyncio.TimeoutError, ValueError, KeyError) as e:
+                reason = e
+
+            self.reconnects += 1
+            logger.warning(f"⚠️ Market stream disconnected ({reason}). Reconnecting in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def parse_message(self, message):
+        """Turn a raw stream message into an event dict, or None if it should be skipped."""
+        payload = json.loads(message)
+        payload = payload.get('data', payload)  # combined streams wrap the event
+
+        if payload.get('e') == 'kline':
+            kline = payload['k']
+            if not kline['x']:
+                return None  # candle still open
+            candle = {
+                'timestamp': int(kline['t']),
+                'open': float(kline['o']),
+                'high': float(kline['h']),
+                'low': float(kline['l']),
+                'close': float(kline['c']),
+                'volume': float(kline['v'])
+            }
+            if self.last_timestamp is not None and candle['timestamp'] <= self.last_timestamp:
+                return None
+            self.last_timestamp = candle['timestamp']
+            return candle
+
+        if payload.get('e') == 'trade':
+            if self.last_trade_id is not None and payload['t'] <= self.last_trade_id:
+                return None
+            self.last_trade_id = payload['t']
+            price = float(payload['p'])
+            timestamp = int(payload['T'])
+            # Track the candle the trade falls in so a reconnect backfills from there
+            self.last_timestamp = timestamp - timestamp % self.interval_ms
+            return {
+                'timestamp': timestamp,
+                'open': price,
+                'high': price,
+                'low': price,
+                'close': price,
+                'volume': float(payload['q']),
+                'trade_id': payload['t']
+            }
+
+        return None
+
+    async def _backfill(self):
+        """Fetch the closed candles missed since `last_timestamp`."""
+        if self.client is None or self.last_timestamp is None:
+            return []
+        since = self.last_timestamp + self.interval_ms
+        try:
+            history = await asyncio.to_thread(
+                self.client.get_historical_klines,
+                symbol=self.symbol,
+                interval=self.interval,
+                limit=self.backfill_limit,
+                since=since
+            )
+        except Exception as e:
+            logger.error(f"❌ Failed to backfill stream gap: {e}")
+            return []
+
+        now_ms = int(time.time() * 1000)
+        missed = [
+            candle for candle in history
+            if candle['timestamp'] >= since and candle['timestamp'] + self.interval_ms <= now_ms
+        ]
+        if missed:
+            self.last_timestamp = missed[-1]['timestamp']
+            logger.info(f"📥 Backfilled {len(missed)} missed candles for {self.symbol}.")
+        return missed
@@ -0,0 +1,194 @@
+import sys
+import os
+import itertools
+import time
+import uuid
+from decimal import Decimal, ROUND_FLOOR, ROUND_CEILING
+
+# Dynamically adjust the path to include the utils directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.logger import logger
+from utils.metrics import metrics
+from live_trading.binance_client import TRANSIENT_ERRORS, RATE_LIMIT_ERRORS
+from live_trading.rate_limiter import backoff_delay
+import ccxt
+
+ORDER_TYPES = ('MARKET', 'LIMIT')
+ORDER_SIDES = ('BUY', 'SELL')
+# Binance accepts newClientOrderId matching ^[.A-Z:/a-z0-9_-]{1,36}$
+MAX_CLIENT_ORDER_ID = 36
+
+
+class OrderRejected(ccxt.InvalidOrder):
+    """An order that would break the symbol's exchange filters; raised before anything is sent."""
+
+
+def _decimal(value):
+    """Exchange filter value -> Decimal, or None when the filter is absent/disabled (0)."""
+    if value in (None, ''):
+        return None
+    value = Decimal(str(value))
+    return value if value > 0 else None
+
+
+def _precision_step(value):
+    """ccxt precision is a step size (TICK_SIZE mode) or a number of decimals (DECIMAL_PLACES)."""
+    value = _decimal(value)
+    if value is None or value < 1:
+        return value
+    return Decimal(1).scaleb(-int(value))
+
+
+class SymbolFilters:
+    """
+    The exchange filters one symbol's orders must satisfy (LOT_SIZE step, PRICE_FILTER tick,
+    MIN_NOTIONAL/NOTIONAL), parsed once so each order is rounded and checked locally.
+    """
+
+    def __init__(self, symbol, step_size=None, min_qty=None, tick_size=None, min_notional=None):
+        self.symbol = symbol
+        self.step_size = _decimal(step_size)
+        self.min_qty = _decimal(min_qty)
+        self.tick_size = _decimal(tick_size)
+        self.min_notional = _decimal(min_notional)
+
+    @classmethod
+    def from_market(cls, market):
+        """Build from a ccxt market: raw Binance filters when present, else ccxt's precision/limits."""
+        filters = {f.get('filterType'): f for f in (market.get('info') or {}).get('filters', [])}
+        lot = filters.get('LOT_SIZE', {})
+        notional = filters.get('NOTIONAL') or filters.get('MIN_NOTIONAL') or {}
+        precision = market.get('precision') or {}
+        limits = market.get('limits') or {}
+        return cls(
+            market['symbol'],
+            step_size=lot.get('stepSize') or _precision_step(precision.get('amount')),
+            min_qty=lot.get('minQty') or (limits.get('amount') or {}).get('min'),
+            tick_size=filters.get('PRICE_FILTER', {}).get('tickSize') or _precision_step(precision.get('price')),
+            min_notional=notional.get('minNotional') or (limits.get('cost') or {}).get('min'),
+        )
+
+    def quantity(self, amount):
+        """Floor an amount to the lot step, so a rounded order never spends more than asked."""
+        amount = Decimal(str(amount))
+        if self.step_size is not None:
+            amount = (amount / self.step_size).to_integral_value(ROUND_FLOOR) * self.step_size
+        return amount
+
+    def price(self, price, side):
+        """Round a limit price onto the tick grid, never to a worse price for `side`."""
+        price = Decimal(str(price))
+        if self.tick_size is not None:
+            rounding = ROUND_FLOOR if side == 'BUY' else ROUND_CEILING
+            price = (price / self.tick_size).to_integral_value(rounding) * self.tick_size
+        return price
+
+    def check(self, side, quantity, price=None):
+        """Raise OrderRejected if the rounded order would fail the exchange's filters."""
+        if quantity <= 0 or (self.min_qty is not None and quantity < self.min_qty):
+            raise OrderRejected(f"❌ {side} {self.symbol}: quantity {quantity} is below the minimum {self.min_qty or 0}.")
+        if price is not None and self.min_notional is not None and quantity * price < self.min_notional:
+            raise OrderRejected(
+                f"❌ {side} {self.symbol}: notional {float(quantity * price):.2f} is below the minimum {self.min_notional}."
+            )
+
+
+class OrderExecutor:
+    """
+    Places orders from per-symbol templates built once at startup.
+    Amounts and prices are rounded to the symbol filters and validated locally, and every order
+    carries a client order id: when a send fails with its outcome unknown (timeout, 5xx) the
+    order is looked up by that id and only resent if the exchange never saw it.
+    Submit-to-ack latency is exported as `order_ack_seconds{symbol,side}`.
+    """
+
+    def __init__(self, client, symbols=(), max_retries=2, prefix='lt'):
+        self.client = client
+        self.max_retries = max_retries
+        # A fresh session tag per process keeps ids unique across restarts
+        self.id_prefix = f"{prefix}-{uuid.uuid4().hex[:8]}-"
+        self.sequence = itertools.count(1)
+        self.filters = {}
+        self.templates = {}
+        for symbol in symbols:
+            self.prepare_symbol(symbol)
+
+    @classmethod
+    def from_config(cls, client, config, symbols=()):
+        return cls(client, symbols, max_retries=config.get('ORDER_RETRIES', 2))
+
+    def prepare_symbol(self, symbol):
+        """Parse the symbol's filters and build one request template per side and order type."""
+        market = self.client.market(symbol)
+        self.filters[symbol] = SymbolFilters.from_market(market)
+        for side in ORDER_SIDES:
+            for order_type in ORDER_TYPES:
+                params = {'newOrderRespType': 'FULL'}  # fills come back in the ack, no follow-up query
+                if order_type == 'LIMIT':
+                    params['timeInForce'] = 'GTC'
+                self.templates[symbol, side, order_type] = {
+                    'symbol': market['symbol'], 'order_type': order_type.lower(), 'side': side.lower(), 'params': params
+                }
+        return self.filters[symbol]
+
+    def next_client_order_id(self):
+        return f"{self.id_prefix}{next(self.sequence)}"[:MAX_CLIENT_ORDER_ID]
+
+    def build(self, symbol, side, amount, order_type='MARKET', price=None, reference_price=None):
+        """
+        Fill a template with a rounded amount/price and a new client order id.
+        `reference_price` (the last trade) lets market orders be checked against the minimum notional.
+        """
+        side, order_type = side.upper(), order_type.upper()
+        if symbol not in self.filters:
+            self.prepare_symbol(symbol)
+        if order_type == 'LIMIT' and not price:
+            raise OrderRejected(f"❌ LIMIT {side} {symbol} needs a price.")
+        filters = self.filters[symbol]
+        quantity = filters.quantity(amount)
+        limit_price = filters.price(price, side) if order_type == 'LIMIT' else None
+        check_price = limit_price if limit_price is not None else reference_price
+        filters.check(side, quantity, None if check_price is None else Decimal(str(check_price)))
+
+        template = self.templates[symbol, side, order_type]
+        request = dict(template, amount=float(quantity), price=None if limit_price is None else float(limit_price))
+        request['params'] = dict(template['params'], newClientOrderId=self.next_client_order_id())
+        return request
+
+    def submit(self, symbol, side, amount, order_type='MARKET', price=None, reference_price=None):
+        """Send one order, retrying unknown outcomes under the same client order id."""
+        request = self.build(symbol, side, amount, order_type, price, reference_price)
+        client_order_id = request['params']['newClientOrderId']
+        start = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            try:
+                order = self.client.submit_order(**request)
+                break
+            except TRANSIENT_ERRORS as e:
+                # Rate-limit rejections were already retried by the client and never reached the engine
+                if isinstance(e, RATE_LIMIT_ERRORS) or attempt == self.max_retries:
+                    raise
+                time.sleep(backoff_delay(attempt))
+                order = self.client.get_order_by_client_id(request['symbol'], client_order_id)
+                if self._recovered(order, request, client_order_id, e, attempt):
+                    break
+        return self._acknowledged(order, request, client_order_id, time.perf_counter() - start)
+
+    def _recovered(self, order, request, client_order_id, error, attempt):
+        """After an unknown outcome: True if the order did land, else log the resend."""
+        if order is not None:
+            metrics.inc('order_recovered_total', symbol=request['symbol'])
+            logger.warning("♻️ Order %s was placed despite %s; not resending.", client_order_id, error)
+            return True
+        metrics.inc('order_resends_total', symbol=request['symbol'])
+        logger.warning("⚠️ Order %s not on the exchange after %s; resend %d/%d with the same id.",
+                       client_order_id, error, attempt + 1, self.max_retries)
+        return False
+
+    def _acknowledged(self, order, request, client_order_id, elapsed):
+        metrics.observe('order_ack_seconds', elapsed, symbol=request['symbol'], side=request['side'])
+        order = dict(order, ack_seconds=elapsed)
+        order.setdefault('clientOrderId', client_order_id)
+        logger.info("✅ %s %s %s acknowledged in %.1fms (%s).", request['side'].upper(), request['amount'],
+                    request['symbol'], elapsed * 1000, client_order_id)
+        return order
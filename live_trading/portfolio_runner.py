@@ -0,0 +1,106 @@
+from live_trading.binance_client import BinanceClient, TRANSIENT_ERRORS
+from live_trading.live_trader import LiveTrader
+from live_trading.account_state import AccountState
+from live_trading.market_stream import BINANCE_WS_URL, BINANCE_TESTNET_WS_URL
+from utils.logger import logger
+from utils.metrics import metrics, MetricsExporter
+from utils.clock import SYSTEM_CLOCK
+from utils.startup import startup
+from visualization.plot_worker import PlotWorker
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+class PortfolioRunner:
+    """
+    Trade many symbols from one process.
+    All LiveTraders share one BinanceClient (one connection, one market cache), and
+    prices for every symbol come from a single batched fetch_tickers request per cycle.
+    """
+
+    def __init__(self, config, symbols, interval_seconds=60, prefill_workers=4, clock=None):
+        self.config = config
+        self.interval_seconds = interval_seconds
+        self.clock = clock or SYSTEM_CLOCK
+        # One render thread serves every symbol's chart
+        self.plot_worker = PlotWorker(refresh_interval=config.get('PLOT_INTERVAL', 60),
+                                      window=config.get('PLOT_WINDOW', 0)).start()
+        with startup.stage('client'):
+            self.client = BinanceClient.from_config(config)
+
+        self.run_folder = (config.get('RESUME') and LiveTrader.latest_run_folder()) or LiveTrader.create_run_folder()
+        self.stop_reason = 'Unknown'
+        self.metrics_exporter = MetricsExporter(
+            metrics, os.path.join(self.run_folder, 'metrics.json'), interval=config.get('METRICS_INTERVAL', 60)
+        ).start()
+
+        # Resolve market ids (e.g. BTCUSDC) to unified symbols from the shared market cache
+        markets = [self.client.exchange.market(symbol) for symbol in symbols]
+
+        # One account cache (and one user-data stream) shared by every symbol
+        with startup.stage('account'):
+            self.account = AccountState(
+                self.client, symbols=[market['symbol'] for market in markets],
+                reconcile_interval=config.get('ACCOUNT_RECONCILE_INTERVAL', 300),
+                base_url=BINANCE_TESTNET_WS_URL if config.get('TESTNET') else BINANCE_WS_URL
+            ).start(stream=config.get('ACCOUNT_STREAM', True))
+
+        # Prefill is one klines request per symbol; overlap them instead of paying N round-trips
+        with ThreadPoolExecutor(max_workers=prefill_workers) as pool:
+            traders = list(pool.map(self._create_trader, markets))
+        self.traders = {trader.symbol: trader for trader in traders}
+        logger.info(f"✅ Portfolio initialized with {len(self.traders)} symbols.")
+
+    def _create_trader(self, market):
+        symbol_config = dict(self.config, LIVE_SYMBOL=market['symbol'], BASE_ASSET=market['base'])
+        folder = os.path.join(self.run_folder, market['id'])
+        return LiveTrader(symbol_config, client=self.client, run_folder=folder, plot_worker=self.plot_worker,
+                          export_metrics=False, account=self.account, clock=self.clock)
+
+    def run_cycle(self):
+        """Fetch all prices in one request and dispatch them to each symbol's strategy."""
+        tickers = self.client.get_tickers(list(self.traders))
+        timestamp = self.clock.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        for symbol, trader in self.traders.items():
+            ticker = tickers.get(symbol)
+            if ticker is None or ticker.get('last') is None:
+                logger.warning("⚠️ No ticker returned for %s; skipping this cycle.", symbol)
+                continue
+            try:
+                trader.on_price(ticker['last'], timestamp)
+                trader.update_plot()
+            except Exception as e:
+                # One failing symbol must not stop the others
+                trader.error_message = str(e)
+                logger.error(f"❌ Error trading {symbol}: {e}")
+
+    def run(self):
+        logger.info(f"🚀 Starting portfolio trading for {len(self.traders)} symbols on Binance...")
+        try:
+            while True:
+                cycle_start = self.clock.monotonic()
+                try:
+                    with metrics.span('cycle'):
+                        self.run_cycle()
+                except TRANSIENT_ERRORS as e:
+                    metrics.inc('cycles_skipped_total')
+                    logger.warning(f"⚠️ Transient error, skipping this portfolio cycle: {e}")
+                except Exception as e:
+                    self.stop_reason = 'Error'
+                    logger.error(f"❌ Error in portfolio cycle: {e}")
+                    break
+                logger.info("✅ Portfolio cycle completed.")
+                self.clock.sleep(max(0.0, self.interval_seconds - (self.clock.monotonic() - cycle_start)))
+        except KeyboardInterrupt:
+            self.stop_reason = 'Manual Stop'
+            logger.info("🛑 Portfolio trading manually stopped by user.")
+        finally:
+            for trader in self.traders.values():
+                trader.stop_reason = self.stop_reason
+                trader.finish()
+            self.plot_worker.stop()
+            self.account.stop()
+            self.metrics_exporter.stop()
+            logger.info("✅ Portfolio trading session completed.")
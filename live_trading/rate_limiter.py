@@ -0,0 +1,200 @@
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import Future
+
+# Request priorities (lower runs first): orders must never queue behind market-data polls
+PRIORITY_ORDER = 0
+PRIORITY_ACCOUNT = 1
+PRIORITY_DATA = 2
+
+# Binance spot REST request weights per ccxt method (api/v3, symbol-scoped calls)
+ENDPOINT_WEIGHTS = {
+    'fetch_ticker': 2,
+    'fetch_ohlcv': 2,
+    'fetch_balance': 20,
+    'fetch_open_orders': 6,
+    'fetch_my_trades': 20,
+    'fetch_order': 4,
+    'create_order': 1,
+    'cancel_order': 1,
+    'fetch_time': 1,
+    'load_markets': 20,
+    'set_leverage': 1,
+    'user_data_stream': 2,
+}
+ENDPOINT_PRIORITIES = {
+    'create_order': PRIORITY_ORDER,
+    'cancel_order': PRIORITY_ORDER,
+    'fetch_balance': PRIORITY_ACCOUNT,
+    'fetch_open_orders': PRIORITY_ACCOUNT,
+    'fetch_my_trades': PRIORITY_ACCOUNT,
+    'fetch_order': PRIORITY_ACCOUNT,
+    'user_data_stream': PRIORITY_ACCOUNT,
+}
+ORDER_ENDPOINTS = ('create_order', 'cancel_order')
+
+
+def endpoint_weight(endpoint, symbols=None):
+    """Request weight of one call; 24hr tickers scale with the number of symbols."""
+    if endpoint == 'fetch_tickers':
+        count = len(symbols) if symbols else None
+        if count is None or count > 100:
+            return 80
+        return 2 if count <= 20 else 40
+    if endpoint == 'fetch_open_orders' and not symbols:
+        return 80  # all symbols
+    return ENDPOINT_WEIGHTS.get(endpoint, 1)
+
+
+def backoff_delay(attempt, base=0.5, cap=30.0):
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, bursts up to `capacity`.
+    `acquire(weight)` blocks until enough tokens are available.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, weight=1, reserve=0.0):
+        """Take `weight` tokens if at least `reserve` tokens would remain afterwards."""
+        with self.lock:
+            self._refill()
+            if self.tokens - weight >= reserve:
+                self.tokens -= weight
+                return True
+            return False
+
+    def wait_time(self, weight=1, reserve=0.0):
+        """Seconds until `try_acquire(weight, reserve)` can succeed."""
+        with self.lock:
+            self._refill()
+            return max(0.0, (weight + reserve - self.tokens) / self.rate)
+
+    def drain(self, tokens=None):
+        """Drop available tokens (all, or down to `tokens`) after the server reports heavier usage."""
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.tokens, 0.0 if tokens is None else tokens)
+
+    def acquire(self, weight=1):
+        weight = min(weight, self.capacity)
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= weight:
+                    self.tokens -= weight
+                    return
+                wait = (weight - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class RequestScheduler:
+    """
+    Weight-aware admission for Binance REST calls.
+    Requests wait in priority order for request-weight tokens (orders also for order-count
+    tokens); market-data calls must leave `reserve` of the weight bucket untouched so an
+    order never waits behind polls. A 429/418 pauses everything until the ban expires.
+    """
+
+    def __init__(self, weight_per_minute=6000, orders_per_10s=50, reserve=0.1, safety=0.9):
+        usable = weight_per_minute * safety
+        self.weight_limit = usable
+        self.weights = TokenBucket(rate=usable / 60, capacity=usable / 4)
+        self.orders = TokenBucket(rate=orders_per_10s * safety / 10, capacity=orders_per_10s * safety)
+        self.reserve = self.weights.capacity * reserve
+        self.condition = threading.Condition()
+        self.waiting = []
+        self.tickets = itertools.count()
+        self.paused_until = 0.0
+
+    def _wait_for(self, weight, priority, order):
+        now = time.monotonic()
+        if now < self.paused_until:
+            return self.paused_until - now
+        reserve = 0.0 if priority == PRIORITY_ORDER else self.reserve
+        wait = self.weights.wait_time(weight, reserve)
+        if order:
+            wait = max(wait, self.orders.wait_time(1))
+        return wait
+
+    def acquire(self, endpoint, weight, priority=PRIORITY_DATA):
+        """Block until this request may be sent; returns the seconds spent waiting."""
+        weight = min(weight, self.weights.capacity)
+        order = endpoint in ORDER_ENDPOINTS
+        start = time.monotonic()
+        with self.condition:
+            entry = (priority, next(self.tickets))
+            heapq.heappush(self.waiting, entry)
+            try:
+                while True:
+                    if self.waiting[0] == entry:
+                        wait = self._wait_for(weight, priority, order)
+                        if wait <= 0:
+                            reserve = 0.0 if priority == PRIORITY_ORDER else self.reserve
+                            if self.weights.try_acquire(weight, reserve) and (not order or self.orders.try_acquire(1)):
+                                return time.monotonic() - start
+                            wait = 0.01
+                        self.condition.wait(wait)
+                    else:
+                        self.condition.wait()
+            finally:
+                self.waiting.remove(entry)
+                heapq.heapify(self.waiting)
+                self.condition.notify_all()
+
+    def observe_used_weight(self, used):
+        """Align with the server's `X-MBX-USED-WEIGHT-1M` header when it is ahead of our estimate."""
+        self.weights.drain(max(0.0, self.weight_limit - used))
+
+    def pause(self, seconds):
+        """Stop all requests for `seconds` (429 back-off or 418 IP ban)."""
+        with self.condition:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.weights.drain()
+            self.condition.notify_all()
+
+
+class RequestCoalescer:
+    """Share one in-flight call between concurrent callers that ask for the same thing."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = {}
+
+    def run(self, key, func):
+        """Return (result, coalesced); exceptions propagate to every waiter."""
+        with self.lock:
+            future = self.in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self.in_flight[key] = Future()
+        if not owner:
+            return future.result(), True
+
+        try:
+            result = func()
+            future.set_result(result)
+            return result, False
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[key]
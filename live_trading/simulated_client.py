@@ -0,0 +1,293 @@
+import sys
+import os
+import csv
+import itertools
+import math
+import random
+import time
+
+# Dynamically adjust the path to include the utils directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.logger import logger
+from utils.timeframes import interval_to_ms
+from utils.clock import SimulatedClock
+import ccxt
+
+KNOWN_QUOTES = ('USDT', 'USDC', 'FDUSD', 'BUSD', 'TUSD', 'EUR', 'TRY', 'BTC', 'ETH', 'BNB')
+
+
+class ReplayFinished(Exception):
+    """The simulated price stream has no more ticks."""
+
+
+def split_symbol(symbol):
+    """'BTC/USDT' or the market id 'BTCUSDT' -> ('BTC', 'USDT')."""
+    if '/' in symbol:
+        base, quote = symbol.split(':')[0].split('/')
+        return base, quote
+    for quote in KNOWN_QUOTES:
+        if symbol.endswith(quote) and len(symbol) > len(quote):
+            return symbol[:-len(quote)], quote
+    raise ValueError(f"❌ Cannot split symbol into base/quote: {symbol}")
+
+
+class SimulatedBinanceClient:
+    """
+    In-process paper-trading exchange with the BinanceClient interface.
+    Prices come from a recorded or synthetic candle stream driven by `self.clock` (a
+    SimulatedClock): the first `history` candles are already closed, and the market moves on
+    whenever the trader sleeps on that clock. Market orders fill at the current close plus
+    slippage, limit orders rest until crossed, fees are charged like Binance (in the received
+    asset), and `latency` advances the clock before an order fills. Nothing really sleeps,
+    so a session replays as fast as the trader can process ticks.
+    """
+
+    def __init__(self, timestamps, closes, symbol='BTC/USDT', interval='1m', history=1000,
+                 balances=None, fee_rate=0.001, slippage_bps=5.0, latency=0.0):
+        if len(timestamps) != len(closes):
+            raise ValueError("❌ timestamps and closes must have the same length.")
+        self.timestamps = [int(ts) for ts in timestamps]
+        self.closes = [float(price) for price in closes]
+        self.base, self.quote = split_symbol(symbol)
+        self.symbol = f'{self.base}/{self.quote}'
+        self.market_id = f'{self.base}{self.quote}'
+        self.interval = interval
+        self.interval_ms = interval_to_ms(interval)
+        self.cursor = min(history, len(self.closes)) - 1  # index of the current (last closed) candle
+        self.balances = dict(balances or {self.quote: 10_000.0})
+        self.fee_rate = fee_rate
+        self.slippage = slippage_bps / 10_000
+        self.latency = latency
+        self.order_ids = itertools.count(1)
+        self.trade_ids = itertools.count(1)
+        self.open_orders = {}
+        self.client_orders = {}  # newClientOrderId -> order, for OrderExecutor lookups
+        self.trades = []
+        self.subscribers = []
+        self.polls = 0
+        self.clock = SimulatedClock((self.timestamps[self.cursor] + self.interval_ms) / 1000)
+        # PortfolioRunner/AccountState resolve markets through `client.exchange.market`
+        self.exchange = self
+
+    # --- construction ---
+
+    @classmethod
+    def synthetic(cls, length=100_000, start_price=30_000.0, volatility=0.001, seed=1,
+                  start_ms=1_700_000_000_000, interval='1m', **kwargs):
+        """Seeded geometric random walk."""
+        rng = random.Random(seed)
+        step = interval_to_ms(interval)
+        closes, price = [], start_price
+        for _ in range(length):
+            price *= math.exp(rng.gauss(0, volatility))
+            closes.append(price)
+        return cls([start_ms + i * step for i in range(length)], closes, interval=interval, **kwargs)
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Recorded candles: a candle store .bin file or a CSV with timestamp (ms) and close columns."""
+        if path.endswith('.bin'):
+            from utils.candle_store import read_candle_file
+            candles = read_candle_file(path)
+            return cls(candles['timestamp'].tolist(), candles['close'].tolist(), **kwargs)
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+        return cls([row['timestamp'] for row in rows], [row['close'] for row in rows], **kwargs)
+
+    @classmethod
+    def from_config(cls, config):
+        kwargs = dict(
+            symbol=config['LIVE_SYMBOL'],
+            fee_rate=config.get('PAPER_FEE_RATE', 0.001),
+            slippage_bps=config.get('PAPER_SLIPPAGE_BPS', 5.0),
+            latency=config.get('PAPER_LATENCY', 0.0),
+        )
+        data = config.get('PAPER_DATA')
+        return cls.from_file(data, **kwargs) if data else cls.synthetic(**kwargs)
+
+    # --- market data ---
+
+    @property
+    def price(self):
+        return self.closes[self.cursor]
+
+    @property
+    def now_ms(self):
+        """Simulated exchange time."""
+        return int(self.clock.time() * 1000)
+
+    @property
+    def remaining(self):
+        return len(self.closes) - 1 - self.cursor
+
+    def market(self, symbol):
+        if split_symbol(symbol) != (self.base, self.quote):
+            raise ccxt.BadSymbol(f"Simulated exchange only trades {self.symbol}, not {symbol}")
+        return {'symbol': self.symbol, 'id': self.market_id, 'base': self.base, 'quote': self.quote}
+
+    def _ticker(self):
+        return {'symbol': self.symbol, 'last': self.price, 'close': self.price, 'timestamp': self.now_ms}
+
+    def sync(self, strict=True):
+        """Catch the price stream up with the clock, filling limit orders crossed on the way."""
+        now_ms = self.now_ms
+        if strict and now_ms > self.timestamps[-1] + self.interval_ms:
+            raise ReplayFinished(f"Simulated price stream exhausted after {len(self.closes)} candles.")
+        while self.remaining > 0 and self.timestamps[self.cursor + 1] + self.interval_ms <= now_ms:
+            self.cursor += 1
+            for order in list(self.open_orders.values()):
+                if (order['side'] == 'buy' and self.price <= order['price']) or \
+                        (order['side'] == 'sell' and self.price >= order['price']):
+                    self._fill(order, order['price'])
+
+    def get_ticker(self, symbol):
+        self.market(symbol)
+        self.sync()
+        self.polls += 1
+        return self._ticker()
+
+    def get_tickers(self, symbols):
+        self.sync()
+        self.polls += 1
+        return {self.symbol: self._ticker()} if any(split_symbol(s) == (self.base, self.quote) for s in symbols) else {}
+
+    def get_ohlcv(self, symbol, interval='1m', limit=1000, since=None):
+        """Closed candles up to the current one (never the future)."""
+        self.market(symbol)
+        if interval_to_ms(interval) != self.interval_ms:
+            raise ValueError(f"❌ Simulated exchange only serves {self.interval} candles, not {interval}.")
+        end = self.cursor + 1
+        start = max(0, end - limit)
+        if since is not None:
+            start = next((i for i in range(start, end) if self.timestamps[i] >= since), end)
+        return [[self.timestamps[i], self.closes[i], self.closes[i], self.closes[i], self.closes[i], 0.0]
+                for i in range(start, min(end, start + limit))]
+
+    def get_historical_klines(self, symbol, interval='1m', limit=1200, since=None):
+        return [
+            {'timestamp': row[0], 'open': row[1], 'high': row[2], 'low': row[3], 'close': row[4], 'volume': row[5]}
+            for row in self.get_ohlcv(symbol, interval=interval, limit=limit, since=since)
+        ]
+
+    def get_server_time(self):
+        return self.now_ms
+
+    def set_leverage(self, symbol, leverage):
+        return {'symbol': symbol, 'leverage': leverage}
+
+    # --- account ---
+
+    def get_balance(self, symbol):
+        return self.balances.get(symbol, 0.0)
+
+    def get_balances(self):
+        locked = {}
+        for order in self.open_orders.values():
+            asset, amount = (self.quote, order['amount'] * order['price']) if order['side'] == 'buy' else (self.base, order['amount'])
+            locked[asset] = locked.get(asset, 0.0) + amount
+        assets = set(self.balances) | set(locked)
+        return {
+            'free': {asset: self.balances.get(asset, 0.0) for asset in assets},
+            'used': {asset: locked.get(asset, 0.0) for asset in assets},
+            'timestamp': self.now_ms,
+        }
+
+    def get_open_orders(self, symbol=None):
+        return [dict(order) for order in self.open_orders.values()]
+
+    def subscribe_user_data(self, callback):
+        """Receive Binance-format user-data events (executionReport, outboundAccountPosition) in-process."""
+        self.subscribers.append(callback)
+
+    def _publish(self, event):
+        for callback in self.subscribers:
+            callback(event)
+
+    def create_order(self, symbol, order_type, side, amount, price=None, params=None):
+        self.market(symbol)
+        if self.latency:
+            self.clock.sleep(self.latency)
+            self.sync(strict=False)
+        side = side.lower()
+        amount = float(amount)
+        if amount <= 0:
+            raise ccxt.InvalidOrder(f"Order amount must be positive, got {amount}")
+
+        order = {
+            'id': str(next(self.order_ids)), 'symbol': self.symbol, 'type': order_type.lower(), 'side': side,
+            'amount': amount, 'price': price, 'filled': 0.0, 'cost': 0.0, 'average': None,
+            'status': 'open', 'timestamp': self.now_ms, 'fee': None, 'trades': [],
+            'clientOrderId': (params or {}).get('newClientOrderId'),
+        }
+        if order['clientOrderId']:
+            self.client_orders[order['clientOrderId']] = order
+        if order_type.upper() == 'LIMIT' and price:
+            self._reserve(order, amount * price if side == 'buy' else amount)
+            self.open_orders[order['id']] = order
+            self._publish_order(order, None)
+            logger.debug("📝 Simulated limit order resting: %s", order)
+        else:
+            slipped = self.price * (1 + self.slippage if side == 'buy' else 1 - self.slippage)
+            self._reserve(order, amount * slipped if side == 'buy' else amount)
+            self._fill(order, slipped)
+        return dict(order)
+
+    def submit_order(self, symbol, order_type, side, amount, price=None, params=None):
+        return self.create_order(symbol, order_type, side, amount, price, params)
+
+    def get_order_by_client_id(self, symbol, client_order_id):
+        order = self.client_orders.get(client_order_id)
+        return None if order is None else dict(order)
+
+    def _reserve(self, order, needed):
+        asset = self.quote if order['side'] == 'buy' else self.base
+        available = self.balances.get(asset, 0.0)
+        if needed > available * (1 + 1e-12):
+            raise ccxt.InsufficientFunds(f"Simulated {asset} balance {available} < {needed}")
+        self.balances[asset] = available - needed
+
+    def _fill(self, order, price):
+        """Fill the whole order at `price`; funds were already taken by `_reserve`."""
+        amount = order['amount']
+        cost = amount * price
+        if order['side'] == 'buy':
+            if order['price']:  # limit buys reserved at the limit price
+                self.balances[self.quote] += amount * order['price'] - cost
+            fee = {'cost': amount * self.fee_rate, 'currency': self.base}
+            self.balances[self.base] = self.balances.get(self.base, 0.0) + amount - fee['cost']
+        else:
+            fee = {'cost': cost * self.fee_rate, 'currency': self.quote}
+            self.balances[self.quote] = self.balances.get(self.quote, 0.0) + cost - fee['cost']
+
+        trade = {'id': str(next(self.trade_ids)), 'order': order['id'], 'symbol': self.symbol, 'side': order['side'],
+                 'amount': amount, 'price': price, 'cost': cost, 'fee': fee, 'timestamp': self.now_ms}
+        self.trades.append(trade)
+        order.update(filled=amount, cost=cost, average=price, status='closed', fee=fee, trades=[trade])
+        self.open_orders.pop(order['id'], None)
+        self._publish_order(order, trade)
+
+    def _publish_order(self, order, trade):
+        if not self.subscribers:
+            return
+        self._publish({
+            'e': 'executionReport', 'E': self.now_ms, 's': self.market_id, 'c': order.get('clientOrderId'),
+            'S': order['side'].upper(), 'o': order['type'].upper(), 'q': str(order['amount']),
+            'p': str(order['price'] or 0), 'X': 'FILLED' if trade else 'NEW', 'i': int(order['id']),
+            'l': str(trade['amount'] if trade else 0), 'z': str(order['filled']),
+            'L': str(trade['price'] if trade else 0), 'n': str(trade['fee']['cost'] if trade else 0),
+            'N': trade['fee']['currency'] if trade else None, 'T': self.now_ms, 't': trade['id'] if trade else -1,
+        })
+        self._publish({
+            'e': 'outboundAccountPosition', 'E': self.now_ms, 'u': self.now_ms,
+            'B': [{'a': asset, 'f': str(free), 'l': '0'} for asset, free in self.balances.items()],
+        })
+
+
+def replay_session(trader, client):
+    """Run a LiveTrader's unmodified loop on the simulated clock; returns ticks per second."""
+    polls, start = client.polls, time.perf_counter()
+    trader.run()
+    ticks = client.polls - polls
+    rate = ticks / max(time.perf_counter() - start, 1e-9)
+    logger.info(f"🏁 Replayed {ticks} ticks at {rate:,.0f} ticks/s.")
+    return rate
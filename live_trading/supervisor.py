@@ -0,0 +1,388 @@
+import sys
+import os
+import multiprocessing as mp
+import queue
+import signal
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+# Dynamically adjust the path to include the project root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.logger import logger
+
+HEARTBEAT_PERIOD = 1.0  # workers never block longer than this without beating
+
+
+class WorkerContext:
+    """Handed to every worker: its heartbeat slot and the shared stop flag."""
+
+    def __init__(self, name, heartbeats, index, stop):
+        self.name = name
+        self.heartbeats = heartbeats
+        self.index = index
+        self.stop = stop
+
+    @property
+    def running(self):
+        return not self.stop.is_set()
+
+    def beat(self):
+        self.heartbeats[self.index] = time.time()
+
+    def get(self, inbox):
+        """Next message from `inbox`, or None after a heartbeat period without one."""
+        self.beat()
+        try:
+            return inbox.get(timeout=HEARTBEAT_PERIOD)
+        except queue.Empty:
+            return None
+
+    def wait(self, seconds):
+        """Sleep while beating; returns False if the supervisor asked to stop."""
+        deadline = time.monotonic() + seconds
+        while self.running:
+            self.beat()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            self.stop.wait(min(remaining, HEARTBEAT_PERIOD))
+        return False
+
+
+def _worker_main(target, name, heartbeats, index, stop, args):
+    # Ctrl-C reaches every process in the group; shutdown is driven by the supervisor's stop flag
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    ctx = WorkerContext(name, heartbeats, index, stop)
+    ctx.beat()
+    try:
+        target(ctx, *args)
+    except Exception as e:
+        logger.error(f"❌ Worker {name} crashed: {e}")
+        sys.exit(1)
+
+
+class Supervisor:
+    """
+    Runs workers as separate processes and keeps them alive.
+    A worker that exits unexpectedly or stops beating for `heartbeat_timeout` seconds is
+    killed and restarted with backoff. A worker that keeps failing is given up on after
+    `max_restarts` restarts within `restart_window` seconds; for a critical worker that
+    stops the whole session.
+    """
+
+    def __init__(self, heartbeat_timeout=120.0, max_restarts=5, restart_window=600.0, max_workers=64):
+        self.mp = mp.get_context('spawn')  # fresh interpreters: no inherited threads or sockets
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self.heartbeats = self.mp.Array('d', max_workers, lock=False)
+        self.stop = self.mp.Event()
+        self.workers = []
+        self.stop_reason = 'Unknown'
+
+    def queue(self):
+        return self.mp.Queue()
+
+    def add_worker(self, name, target, args=(), critical=False):
+        """Register `target(ctx, *args)`; it must be a module-level function (spawn pickles it by name)."""
+        if len(self.workers) == len(self.heartbeats):
+            raise ValueError("❌ Too many workers for the heartbeat table.")
+        self.workers.append({
+            'name': name, 'target': target, 'args': args, 'critical': critical, 'index': len(self.workers),
+            'process': None, 'restarts': deque(), 'next_start': 0.0, 'failed': False,
+        })
+
+    def _spawn(self, worker):
+        self.heartbeats[worker['index']] = time.time()  # startup counts as a beat
+        process = self.mp.Process(
+            target=_worker_main, name=worker['name'], daemon=True,
+            args=(worker['target'], worker['name'], self.heartbeats, worker['index'], self.stop, worker['args'])
+        )
+        process.start()
+        worker['process'] = process
+        logger.info(f"🚀 Started worker {worker['name']} (pid {process.pid}).")
+
+    def start(self):
+        for worker in self.workers:
+            self._spawn(worker)
+        return self
+
+    def check(self):
+        """Restart dead or stalled workers; returns False once a critical worker has been given up on."""
+        now = time.time()
+        for worker in self.workers:
+            if worker['failed']:
+                continue
+            process = worker['process']
+            if process is not None:
+                if process.is_alive():
+                    if now - self.heartbeats[worker['index']] <= self.heartbeat_timeout:
+                        continue
+                    logger.warning(f"⚠️ Worker {worker['name']} missed heartbeats; killing it.")
+                    process.kill()
+                    process.join(5)
+                else:
+                    logger.warning(f"⚠️ Worker {worker['name']} exited with code {process.exitcode}.")
+                worker['process'] = None
+                restarts = worker['restarts']
+                while restarts and now - restarts[0] > self.restart_window:
+                    restarts.popleft()
+                if len(restarts) >= self.max_restarts:
+                    worker['failed'] = True
+                    logger.error(f"❌ Worker {worker['name']} failed {len(restarts)} times; giving up on it.")
+                    if worker['critical']:
+                        return False
+                    continue
+                restarts.append(now)
+                worker['next_start'] = time.monotonic() + min(2 ** (len(restarts) - 1), 30)
+            if time.monotonic() >= worker['next_start']:
+                self._spawn(worker)
+        return True
+
+    def run(self, check_interval=1.0):
+        """Start every worker and supervise them until Ctrl-C or a critical failure."""
+        self.start()
+        try:
+            while True:
+                time.sleep(check_interval)
+                if not self.check():
+                    self.stop_reason = 'Error'
+                    break
+        except KeyboardInterrupt:
+            self.stop_reason = 'Manual Stop'
+            logger.info("🛑 Supervisor manually stopped by user.")
+        finally:
+            self.shutdown()
+
+    def shutdown(self, timeout=15.0):
+        """Ask every worker to finish (flush, checkpoint) and kill whatever does not."""
+        self.stop.set()
+        deadline = time.monotonic() + timeout
+        for worker in self.workers:
+            process = worker['process']
+            if process is not None:
+                process.join(max(0.0, deadline - time.monotonic()))
+                if process.is_alive():
+                    logger.warning(f"⚠️ Worker {worker['name']} did not stop in time; killing it.")
+                    process.kill()
+                    process.join(5)
+        logger.info(f"✅ Supervisor stopped ({self.stop_reason}).")
+
+    @classmethod
+    def for_trading(cls, config, symbols, interval_seconds=60):
+        """
+        Ingest -> per-symbol strategy -> execution pipeline plus a journal/plot worker:
+        a crashed or slow strategy, journal or chart never blocks order placement.
+        """
+        from live_trading.live_trader import LiveTrader
+
+        supervisor = cls(heartbeat_timeout=config.get('HEARTBEAT_TIMEOUT', 120),
+                         max_restarts=config.get('MAX_WORKER_RESTARTS', 5))
+        run_folder = (config.get('RESUME') and LiveTrader.latest_run_folder()) or LiveTrader.create_run_folder()
+        folders = {symbol: os.path.join(run_folder, symbol.replace('/', '')) for symbol in symbols}
+        for folder in folders.values():
+            os.makedirs(folder, exist_ok=True)
+
+        ticks = {symbol: supervisor.queue() for symbol in symbols}
+        orders, journal = supervisor.queue(), supervisor.queue()
+        supervisor.add_worker('execution', execution_worker, (config, list(symbols), orders, ticks, run_folder),
+                              critical=True)
+        supervisor.add_worker('journal', journal_worker, (config, folders, journal))
+        for symbol in symbols:
+            supervisor.add_worker(f'strategy-{symbol}', strategy_worker,
+                                  (dict(config, LIVE_SYMBOL=symbol), folders[symbol], ticks[symbol], orders, journal))
+        supervisor.add_worker('ingest', ingest_worker, (config, ticks, run_folder, interval_seconds), critical=True)
+        logger.info(f"✅ Supervisor configured for {len(symbols)} symbols in {run_folder}.")
+        return supervisor
+
+
+def _metrics_exporter(config, run_folder, name):
+    from utils.metrics import metrics, MetricsExporter
+    return MetricsExporter(metrics, os.path.join(run_folder, f'metrics_{name}.json'),
+                           interval=config.get('METRICS_INTERVAL', 60)).start()
+
+
+def ingest_worker(ctx, config, outboxes, run_folder, interval_seconds=60):
+    """Poll every symbol's price in one batched request and fan the ticks out to the strategy workers."""
+    from live_trading.binance_client import BinanceClient, TRANSIENT_ERRORS
+    from utils.metrics import metrics
+
+    client = BinanceClient.from_config(config)
+    exporter = _metrics_exporter(config, run_folder, ctx.name)
+    unified = {client.exchange.market(symbol)['symbol']: symbol for symbol in outboxes}
+    try:
+        while ctx.running:
+            cycle_start = time.monotonic()
+            try:
+                with metrics.span('stage', stage='fetch_tickers'):
+                    tickers = client.get_tickers(list(unified))
+                received_at = time.time()
+                for market_symbol, symbol in unified.items():
+                    ticker = tickers.get(market_symbol)
+                    if ticker is not None and ticker.get('last') is not None:
+                        outboxes[symbol].put(('tick', ticker['last'], received_at))
+            except TRANSIENT_ERRORS as e:
+                metrics.inc('cycles_skipped_total')
+                logger.warning(f"⚠️ Transient error, skipping this ingest cycle: {e}")
+            ctx.wait(max(0.0, interval_seconds - (time.monotonic() - cycle_start)))
+    finally:
+        exporter.stop()
+
+
+def strategy_worker(ctx, config, folder, inbox, orders, journal, client=None):
+    """
+    One symbol's strategy, on LiveTrader's tick path. State and chart markers are checkpointed
+    to the symbol's folder, so a restarted worker backfills the candles it missed (as
+    LiveTrader.resume does) and then drains the ticks queued meanwhile. `client` is only used
+    for history (orders go through the execution worker) and is built from config by default.
+    """
+    from live_trading.live_trader import TRADE_MONEY_USD, catch_up_checkpoint, closed_bars, evaluate_tick, journal_rows
+    from strategies.live_strategy import LiveStrategy
+    from strategies.price_buffer import to_datetime64
+    from utils.candle_aggregator import CandleAggregator
+    from utils.checkpoint import save_checkpoint, load_checkpoint, checkpoint_key
+    from utils.timeframes import interval_to_ms
+
+    if client is None:
+        from live_trading.binance_client import BinanceClient
+        client = BinanceClient.from_config(config)
+    symbol = config['LIVE_SYMBOL']
+    strategy = LiveStrategy.from_config(config)
+    timeframe = config.get('TIMEFRAME', '1m')
+    timeframe_ms = interval_to_ms(timeframe)
+    candles = CandleAggregator(timeframes=(timeframe,))
+    checkpoint_path = os.path.join(folder, 'checkpoint.pkl')
+    state = load_checkpoint(checkpoint_path)
+    events = []  # (timestamp, price, action) of the orders placed, for plot markers
+    last_candle_time = None
+    missed = None
+    if state is not None:
+        events = state['events']
+        missed = catch_up_checkpoint(strategy, client, symbol, timeframe, state, checkpoint_key(config),
+                                     int(time.time() * 1000))
+    if missed is None:
+        strategy.prefill_data(client.get_historical_klines(symbol=symbol, interval=timeframe, limit=1000))
+        journal.put(('rows', symbol, journal_rows(strategy, 'PREFILL')))
+    else:
+        last_candle_time = missed[-1]['timestamp'] if missed else state['last_candle_time']
+        if missed:
+            journal.put(('rows', symbol, journal_rows(strategy, 'BACKFILL', strategy.position or 'NONE', len(missed))))
+        logger.info(f"♻️ {symbol}: resumed from checkpoint; backfilled {len(missed)} missed {timeframe} candles.")
+
+    def checkpoint():
+        save_checkpoint(checkpoint_path, {'key': checkpoint_key(config), 'symbol': symbol,
+                                          'last_candle_time': last_candle_time, 'strategy': strategy.snapshot(),
+                                          'events': events})
+
+    checkpoint_interval = config.get('CHECKPOINT_INTERVAL', 60)
+    plot_interval = config.get('PLOT_INTERVAL', 60)
+    last_checkpoint = last_plot = time.monotonic()
+    try:
+        while ctx.running:
+            message = ctx.get(inbox)
+            if message is not None and message[0] == 'event':
+                # The execution worker placed one of our orders
+                _, timestamp, price, action = message
+                events.append((to_datetime64(timestamp), price, action))
+            elif message is not None:
+                _, price, received_at = message
+                timestamp = datetime.fromtimestamp(received_at).strftime('%Y-%m-%d %H:%M:%S')
+                for last_candle_time, close, bar_time in closed_bars(candles, timeframe_ms, int(received_at * 1000),
+                                                                     price, timestamp):
+                    _, side, action, position = evaluate_tick(strategy, close, bar_time)
+                    if side is not None:
+                        amount = TRADE_MONEY_USD / close if side == 'BUY' else None  # SELL: executor uses the free balance
+                        orders.put(('order', symbol, side, amount, close, bar_time, action, received_at))
+                    _, _, fast_ind, slow_ind, *_ = strategy.buffer.last()
+                    journal.put(('row', symbol, (bar_time, close, fast_ind, slow_ind, action, position, '', '')))
+                    if checkpoint_interval and side is not None:
+                        checkpoint()
+                        last_checkpoint = time.monotonic()
+
+            now = time.monotonic()
+            if checkpoint_interval and now - last_checkpoint >= checkpoint_interval:
+                checkpoint()
+                last_checkpoint = now
+            if now - last_plot >= plot_interval:
+                journal.put(('plot', symbol, strategy.buffer.to_arrays(), strategy.indicator_labels, list(events)))
+                last_plot = now
+    finally:
+        if checkpoint_interval:
+            checkpoint()
+
+
+def execution_worker(ctx, config, symbols, inbox, strategies, run_folder):
+    """Place the orders the strategy workers ask for and report each placed one back to its strategy."""
+    from live_trading.binance_client import BinanceClient
+    from live_trading.account_state import AccountState
+    from live_trading.order_execution import OrderExecutor
+    from live_trading.market_stream import BINANCE_WS_URL, BINANCE_TESTNET_WS_URL
+    from utils.metrics import metrics
+
+    client = BinanceClient.from_config(config)
+    executor = OrderExecutor.from_config(client, config, symbols)
+    markets = {symbol: client.exchange.market(symbol) for symbol in symbols}
+    account = AccountState(
+        client, symbols=[market['symbol'] for market in markets.values()],
+        reconcile_interval=config.get('ACCOUNT_RECONCILE_INTERVAL', 300),
+        base_url=BINANCE_TESTNET_WS_URL if config.get('TESTNET') else BINANCE_WS_URL
+    ).start(stream=config.get('ACCOUNT_STREAM', True))
+    exporter = _metrics_exporter(config, run_folder, ctx.name)
+    try:
+        while ctx.running:
+            message = ctx.get(inbox)
+            if message is None:
+                continue
+            _, symbol, side, amount, price, timestamp, action, received_at = message
+            market = markets[symbol]
+            try:
+                if amount is None:
+                    amount = account.free(market['base'])
+                with metrics.span('stage', stage='create_order'):
+                    order = executor.submit(symbol, side, amount, reference_price=price)
+                account.apply_order(order)
+                metrics.observe('tick_to_order_seconds', time.time() - received_at)
+                strategies[symbol].put(('event', timestamp, price, action))
+            except Exception as e:
+                # One rejected order must not take the other symbols down
+                logger.error(f"❌ {action} order for {symbol} failed: {e}")
+    finally:
+        account.stop()
+        exporter.stop()
+
+
+def journal_worker(ctx, config, folders, inbox):
+    """Trade journals and charts for every symbol, off the order path."""
+    from utils.trade_journal import TradeJournal, JOURNAL_BACKENDS
+    from visualization.plot_worker import PlotWorker, plot_filename
+
+    backend = config.get('JOURNAL_BACKEND', 'csv')
+    journals = {
+        symbol: TradeJournal(os.path.join(folder, 'data_trade' + JOURNAL_BACKENDS[backend].extension), backend=backend,
+                             batch_size=config.get('JOURNAL_BATCH_SIZE', 100),
+                             flush_interval=config.get('JOURNAL_FLUSH_INTERVAL', 5.0))
+        for symbol, folder in folders.items()
+    }
+    # Snapshots are already throttled by the strategy workers; the interval only paces HTML reloads
+    plot_worker = PlotWorker(refresh_interval=config.get('PLOT_INTERVAL', 60), window=config.get('PLOT_WINDOW', 0)).start()
+    try:
+        while ctx.running:
+            message = ctx.get(inbox)
+            if message is None:
+                for journal in journals.values():
+                    journal.flush()
+                continue
+            kind, symbol = message[0], message[1]
+            if kind == 'row':
+                journals[symbol].record(message[2], urgent=message[2][4] != 'HOLD')
+            elif kind == 'rows':
+                journals[symbol].record_many(message[2])
+            elif kind == 'plot':
+                # Markers come with every snapshot, so a restarted journal worker loses none
+                _, _, arrays, labels, events = message
+                plot_worker.submit_arrays(os.path.join(folders[symbol], plot_filename(config)), arrays, events, labels=labels)
+    finally:
+        for journal in journals.values():
+            journal.close()
+        plot_worker.stop()
@@ -1,11 +1,25 @@
 # main.py
 
-from live_trading.live_trader import LiveTrader
-from config import API_KEY, SECRET_KEY, TESTNET, LIVE_SYMBOL, STOP_LOSS, PROFIT_TARGET, SHORT_WINDOW, LONG_WINDOW, ENABLE_LONGING
+import time
+from utils.startup import startup  # first, so the 'imports' stage covers everything else
+from utils.metrics import metrics, start_metrics_server
+from config import (
+    API_KEY, SECRET_KEY, TESTNET, LIVE_SYMBOL, PORTFOLIO_SYMBOLS,
+    STOP_LOSS, PROFIT_TARGET, SHORT_WINDOW, LONG_WINDOW, ENABLE_LONGING,
+    FAST_INDICATOR, SLOW_INDICATOR, EXTRA_INDICATORS, RETENTION_WINDOW,
+    CANDLE_CACHE, CANDLE_STORE_PATH, TIMEFRAME,
+    JOURNAL_BACKEND, JOURNAL_BATCH_SIZE, JOURNAL_FLUSH_INTERVAL,
+    RESUME, CHECKPOINT_INTERVAL, SUPERVISOR, HEARTBEAT_TIMEOUT, MAX_WORKER_RESTARTS,
+    PLOT_INTERVAL, PLOT_WINDOW, PLOT_FORMAT, METRICS_PORT, METRICS_INTERVAL,
+    FEED_MODE, STREAM_INTERVAL, STREAM_SOURCE,
+    REQUEST_WEIGHT_PER_MINUTE, ORDERS_PER_10S, REST_MAX_RETRIES, ORDER_RETRIES,
+    MARKET_CACHE_PATH, MARKET_CACHE_TTL, ACCOUNT_STREAM, ACCOUNT_RECONCILE_INTERVAL,
+    PAPER_TRADING, PAPER_DATA, PAPER_FEE_RATE, PAPER_SLIPPAGE_BPS, PAPER_LATENCY,
+)
 
 if __name__ == '__main__':
-    # Initialize and Start Live Trader
-    trader = LiveTrader({
+    startup.record('imports', time.perf_counter() - startup.started)
+    config = {
         'API_KEY': API_KEY,
         'SECRET_KEY': SECRET_KEY,
         'TESTNET': TESTNET,
@@ -14,8 +28,72 @@ if __name__ == '__main__':
         'SHORT_WINDOW': SHORT_WINDOW,
         'LONG_WINDOW': LONG_WINDOW,
         'ENABLE_LONGING': ENABLE_LONGING,
+        'FAST_INDICATOR': FAST_INDICATOR,
+        'SLOW_INDICATOR': SLOW_INDICATOR,
+        'EXTRA_INDICATORS': EXTRA_INDICATORS,
         'LIVE_SYMBOL': LIVE_SYMBOL,
-    })
+        'RETENTION_WINDOW': RETENTION_WINDOW,
+        'CANDLE_CACHE': CANDLE_CACHE,
+        'CANDLE_STORE_PATH': CANDLE_STORE_PATH,
+        'TIMEFRAME': TIMEFRAME,
+        'STREAM_INTERVAL': STREAM_INTERVAL,
+        'REQUEST_WEIGHT_PER_MINUTE': REQUEST_WEIGHT_PER_MINUTE,
+        'ORDERS_PER_10S': ORDERS_PER_10S,
+        'REST_MAX_RETRIES': REST_MAX_RETRIES,
+        'ORDER_RETRIES': ORDER_RETRIES,
+        'MARKET_CACHE_PATH': MARKET_CACHE_PATH,
+        'MARKET_CACHE_TTL': MARKET_CACHE_TTL,
+        'ACCOUNT_STREAM': ACCOUNT_STREAM,
+        'ACCOUNT_RECONCILE_INTERVAL': ACCOUNT_RECONCILE_INTERVAL,
+        'JOURNAL_BACKEND': JOURNAL_BACKEND,
+        'JOURNAL_BATCH_SIZE': JOURNAL_BATCH_SIZE,
+        'JOURNAL_FLUSH_INTERVAL': JOURNAL_FLUSH_INTERVAL,
+        'RESUME': RESUME,
+        'CHECKPOINT_INTERVAL': CHECKPOINT_INTERVAL,
+        'HEARTBEAT_TIMEOUT': HEARTBEAT_TIMEOUT,
+        'MAX_WORKER_RESTARTS': MAX_WORKER_RESTARTS,
+        'PLOT_INTERVAL': PLOT_INTERVAL,
+        'PLOT_WINDOW': PLOT_WINDOW,
+        'PLOT_FORMAT': PLOT_FORMAT,
+        'METRICS_INTERVAL': METRICS_INTERVAL,
+        'PAPER_DATA': PAPER_DATA,
+        'PAPER_FEE_RATE': PAPER_FEE_RATE,
+        'PAPER_SLIPPAGE_BPS': PAPER_SLIPPAGE_BPS,
+        'PAPER_LATENCY': PAPER_LATENCY,
+    }
 
-    # Run the Trader
-    trader.run()
+    if METRICS_PORT:
+        start_metrics_server(metrics, METRICS_PORT)
+
+    if PAPER_TRADING:
+        # Replay a recorded/synthetic session against the in-process exchange, as fast as possible
+        config['CANDLE_CACHE'] = False  # keep simulated candles out of the real cache
+        config['CHECKPOINT_INTERVAL'] = 0  # a replay restarts from its data, not from a checkpoint
+        with startup.stage('imports'):
+            from live_trading.live_trader import LiveTrader
+            from live_trading.simulated_client import SimulatedBinanceClient, replay_session
+        client = SimulatedBinanceClient.from_config(config)
+        replay_session(LiveTrader(config, client=client, clock=client.clock), client)
+    elif SUPERVISOR:
+        # Each component in its own process; crashed or stalled workers are restarted
+        with startup.stage('imports'):
+            from live_trading.supervisor import Supervisor
+        Supervisor.for_trading(config, PORTFOLIO_SYMBOLS or [LIVE_SYMBOL]).run()
+    elif PORTFOLIO_SYMBOLS:
+        # One process, one shared client, many symbols
+        with startup.stage('imports'):
+            from live_trading.portfolio_runner import PortfolioRunner
+        PortfolioRunner(config, PORTFOLIO_SYMBOLS).run()
+    else:
+        # Initialize and Start Live Trader
+        with startup.stage('imports'):
+            from live_trading.live_trader import LiveTrader
+        trader = LiveTrader(config)
+
+        # Run the Trader
+        if FEED_MODE == 'stream':
+            trader.run_stream(interval=STREAM_INTERVAL, source=STREAM_SOURCE)
+        elif FEED_MODE == 'async':
+            trader.run_async()
+        else:
+            trader.run()
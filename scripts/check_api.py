@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+# Manual check that the API keys work: validates (but does not place) one order on the configured exchange.
+import sys
+import os
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from config import API_KEY, SECRET_KEY, TESTNET
+import ccxt
+
+
+def check_api(symbol='ETH/BTC', type='limit', side='sell', amount=1.0, price=0.060154):
+    exchange = ccxt.binance({
+        'apiKey': API_KEY,
+        'secret': SECRET_KEY,
+    })
+    if TESTNET:
+        exchange.set_sandbox_mode(True)  # Binance Spot Testnet keys
+
+    # extra params and overrides if needed
+    params = {
+        'test': True,  # test if it's valid, but don't actually place it
+    }
+    return exchange.create_order(symbol, type, side, amount, price, params)
+
+
+if __name__ == "__main__":
+    print(check_api())
@@ -0,0 +1,490 @@
+import math
+from collections import deque
+
+NAN = float('nan')
+
+
+class Indicator:
+    """
+    Common interface of the indicator library.
+    `update(close, high, low, volume)` advances the streaming state in O(1) and returns the
+    primary value; `compute(...)` is the vectorized form over whole arrays and returns
+    {column: array} with the same values. Multi-output indicators expose every output in
+    `current` and `columns`; the first one is the primary value.
+    """
+
+    name = None
+    window_param = None  # constructor argument a strategy window maps to
+    outputs = ('',)      # column suffixes, '' for the primary output
+
+    def params(self):
+        raise NotImplementedError
+
+    @property
+    def key(self):
+        """Identity used to deduplicate indicators, e.g. 'EMA_50' or 'BOLLINGER_20_2'."""
+        return '_'.join([self.name] + [f'{p:g}' if isinstance(p, float) else str(p) for p in self.params()])
+
+    @property
+    def columns(self):
+        return [f'{self.key}_{suffix}' if suffix else self.key for suffix in self.outputs]
+
+    @property
+    def current(self):
+        """Every output of the latest update, in `columns` order."""
+        return (self.value,)
+
+    @property
+    def values(self):
+        return dict(zip(self.columns, self.current))
+
+    def seed(self, close, high=None, low=None, volume=None):
+        """Reset and replay a history, returning the list of primary values."""
+        self.reset()
+        return [
+            self.update(c, high[i] if high is not None else None, low[i] if low is not None else None,
+                        volume[i] if volume is not None else None)
+            for i, c in enumerate(close)
+        ]
+
+
+class EMA(Indicator):
+    """
+    Streaming exponential moving average.
+    Updates in O(1) per price and matches pandas `ewm(span=..., min_periods=...).mean()`
+    (adjust=True) value for value.
+    """
+
+    name = 'EMA'
+    window_param = 'span'
+
+    def __init__(self, span, min_periods=1):
+        if span < 1:
+            raise ValueError("❌ EMA span must be >= 1.")
+        self.span = span
+        self.alpha = 2.0 / (span + 1.0)
+        self.min_periods = max(int(min_periods), 1)
+
+        # Running State
+        self.weighted_avg = float('nan')
+        self.old_wt = 1.0
+        self.count = 0
+
+    def params(self):
+        return (self.span,) if self.min_periods == 1 else (self.span, f'mp{self.min_periods}')
+
+    @property
+    def value(self):
+        """Current EMA value, NaN while still warming up."""
+        if self.count < self.min_periods:
+            return float('nan')
+        return self.weighted_avg
+
+    @property
+    def ready(self):
+        return self.count >= self.min_periods
+
+    def update(self, price, high=None, low=None, volume=None):
+        """Feed one price and return the new EMA value."""
+        price = float(price)
+        if math.isnan(price):
+            # Same as pandas ignore_na=False: missing values still decay the old weight
+            if self.count:
+                self.old_wt *= 1.0 - self.alpha
+            return self.value
+
+        if self.count == 0:
+            self.weighted_avg = price
+            self.old_wt = 1.0
+        else:
+            # Mirrors the recurrence used by pandas' ewma kernel (adjust=True)
+            self.old_wt *= 1.0 - self.alpha
+            if self.weighted_avg != price:
+                self.weighted_avg = (self.old_wt * self.weighted_avg + price) / (self.old_wt + 1.0)
+            self.old_wt += 1.0
+        self.count += 1
+        return self.value
+
+    def reset(self):
+        self.weighted_avg = float('nan')
+        self.old_wt = 1.0
+        self.count = 0
+
+    def compute(self, close, high=None, low=None, volume=None):
+        return {self.key: EMA.batch(close, self.span, self.min_periods)}
+
+    @staticmethod
+    def batch(prices, span, min_periods=1):
+        """Vectorized form over a whole price array (same values as the streaming form)."""
+        import pandas as pd
+        return pd.Series(prices, dtype='float64').ewm(span=span, min_periods=min_periods).mean().to_numpy()
+
+
+class SMA(Indicator):
+    """Simple moving average over the last `window` prices (NaN until the window is full)."""
+
+    name = 'SMA'
+    window_param = 'window'
+
+    def __init__(self, window):
+        if window < 1:
+            raise ValueError("❌ SMA window must be >= 1.")
+        self.window = int(window)
+        self.reset()
+
+    def params(self):
+        return (self.window,)
+
+    def reset(self):
+        self.prices = deque(maxlen=self.window)
+        self.total = 0.0
+        self.value = NAN
+
+    @property
+    def ready(self):
+        return len(self.prices) == self.window
+
+    def update(self, close, high=None, low=None, volume=None):
+        close = float(close)
+        if len(self.prices) == self.window:
+            self.total -= self.prices[0]
+        self.prices.append(close)
+        self.total += close
+        self.value = self.total / self.window if self.ready else NAN
+        return self.value
+
+    def compute(self, close, high=None, low=None, volume=None):
+        import pandas as pd
+        return {self.key: pd.Series(close, dtype='float64').rolling(self.window).mean().to_numpy()}
+
+
+class _WilderAverage:
+    """Wilder smoothing (pandas `ewm(alpha=1/period, adjust=False)`), first value seeds the average."""
+
+    def __init__(self, period):
+        self.alpha = 1.0 / period
+        self.average = NAN
+        self.count = 0
+
+    def update(self, value):
+        self.average = value if self.count == 0 else self.average + self.alpha * (value - self.average)
+        self.count += 1
+        return self.average
+
+    @staticmethod
+    def batch(series, period):
+        return series.ewm(alpha=1.0 / period, adjust=False, min_periods=period).mean()
+
+
+class RSI(Indicator):
+    """Wilder's relative strength index (0-100)."""
+
+    name = 'RSI'
+    window_param = 'period'
+
+    def __init__(self, period=14):
+        if period < 1:
+            raise ValueError("❌ RSI period must be >= 1.")
+        self.period = int(period)
+        self.reset()
+
+    def params(self):
+        return (self.period,)
+
+    def reset(self):
+        self.previous = None
+        self.gains = _WilderAverage(self.period)
+        self.losses = _WilderAverage(self.period)
+        self.value = NAN
+
+    @property
+    def ready(self):
+        return self.gains.count >= self.period
+
+    @staticmethod
+    def _rsi(gain, loss):
+        if loss == 0:
+            return NAN if gain == 0 else 100.0
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+
+    def update(self, close, high=None, low=None, volume=None):
+        close = float(close)
+        if self.previous is not None:
+            change = close - self.previous
+            gain = self.gains.update(max(change, 0.0))
+            loss = self.losses.update(max(-change, 0.0))
+            self.value = self._rsi(gain, loss) if self.ready else NAN
+        self.previous = close
+        return self.value
+
+    def compute(self, close, high=None, low=None, volume=None):
+        import numpy as np
+        import pandas as pd
+        change = pd.Series(close, dtype='float64').diff()
+        gain = _WilderAverage.batch(change.clip(lower=0), self.period).to_numpy()
+        loss = _WilderAverage.batch(-change.clip(upper=0), self.period).to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+        return {self.key: rsi}
+
+
+class ATR(Indicator):
+    """Average true range with Wilder smoothing; on close-only ticks the range is |close - previous close|."""
+
+    name = 'ATR'
+    window_param = 'period'
+
+    def __init__(self, period=14):
+        if period < 1:
+            raise ValueError("❌ ATR period must be >= 1.")
+        self.period = int(period)
+        self.reset()
+
+    def params(self):
+        return (self.period,)
+
+    def reset(self):
+        self.previous = None
+        self.ranges = _WilderAverage(self.period)
+        self.value = NAN
+
+    @property
+    def ready(self):
+        return self.ranges.count >= self.period
+
+    def update(self, close, high=None, low=None, volume=None):
+        close = float(close)
+        high = close if high is None else float(high)
+        low = close if low is None else float(low)
+        true_range = high - low
+        if self.previous is not None:
+            true_range = max(true_range, abs(high - self.previous), abs(low - self.previous))
+        average = self.ranges.update(true_range)
+        self.value = average if self.ready else NAN
+        self.previous = close
+        return self.value
+
+    def compute(self, close, high=None, low=None, volume=None):
+        import pandas as pd
+        close = pd.Series(close, dtype='float64')
+        high = close if high is None else pd.Series(high, dtype='float64')
+        low = close if low is None else pd.Series(low, dtype='float64')
+        previous = close.shift()
+        true_range = pd.concat([high - low, (high - previous).abs(), (low - previous).abs()], axis=1).max(axis=1)
+        return {self.key: _WilderAverage.batch(true_range, self.period).to_numpy()}
+
+
+class BollingerBands(Indicator):
+    """Moving average with bands `num_std` population standard deviations away."""
+
+    name = 'BOLLINGER'
+    window_param = 'window'
+    outputs = ('mid', 'upper', 'lower')
+
+    def __init__(self, window=20, num_std=2.0):
+        if window < 1:
+            raise ValueError("❌ Bollinger window must be >= 1.")
+        self.window = int(window)
+        self.num_std = float(num_std)
+        self.reset()
+
+    def params(self):
+        return (self.window, self.num_std)
+
+    def reset(self):
+        self.prices = deque(maxlen=self.window)
+        self.shift = None  # sums are kept around the first price to avoid cancellation
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.value, self.upper, self.lower = NAN, NAN, NAN
+
+    @property
+    def ready(self):
+        return len(self.prices) == self.window
+
+    @property
+    def current(self):
+        return self.value, self.upper, self.lower
+
+    def update(self, close, high=None, low=None, volume=None):
+        close = float(close)
+        if self.shift is None:
+            self.shift = close
+        if len(self.prices) == self.window:
+            old = self.prices[0] - self.shift
+            self.total -= old
+            self.total_sq -= old * old
+        self.prices.append(close)
+        x = close - self.shift
+        self.total += x
+        self.total_sq += x * x
+        if self.ready:
+            mean = self.total / self.window
+            std = math.sqrt(max(self.total_sq / self.window - mean * mean, 0.0))
+            self.value = mean + self.shift
+            self.upper = self.value + self.num_std * std
+            self.lower = self.value - self.num_std * std
+        return self.value
+
+    def compute(self, close, high=None, low=None, volume=None):
+        import pandas as pd
+        rolling = pd.Series(close, dtype='float64').rolling(self.window)
+        mid, std = rolling.mean().to_numpy(), rolling.std(ddof=0).to_numpy()
+        return dict(zip(self.columns, (mid, mid + self.num_std * std, mid - self.num_std * std)))
+
+
+class VWAP(Indicator):
+    """Volume-weighted average price, cumulative or over the last `window` ticks (volume defaults to 1)."""
+
+    name = 'VWAP'
+    window_param = 'window'
+
+    def __init__(self, window=None):
+        self.window = int(window) if window else None
+        self.reset()
+
+    def params(self):
+        return (self.window,) if self.window else ()
+
+    def reset(self):
+        self.rows = deque(maxlen=self.window) if self.window else None
+        self.pv = 0.0
+        self.volume = 0.0
+        self.value = NAN
+
+    @property
+    def ready(self):
+        return self.volume > 0 and (self.rows is None or len(self.rows) == self.window)
+
+    def update(self, close, high=None, low=None, volume=None):
+        close = float(close)
+        volume = 1.0 if volume is None else float(volume)
+        if self.rows is not None:
+            if len(self.rows) == self.window:
+                old_pv, old_volume = self.rows[0]
+                self.pv -= old_pv
+                self.volume -= old_volume
+            self.rows.append((close * volume, volume))
+        self.pv += close * volume
+        self.volume += volume
+        self.value = self.pv / self.volume if self.ready else NAN
+        return self.value
+
+    def compute(self, close, high=None, low=None, volume=None):
+        import numpy as np
+        import pandas as pd
+        close = pd.Series(close, dtype='float64')
+        volume = pd.Series(1.0, index=close.index) if volume is None else pd.Series(volume, dtype='float64')
+        if self.window:
+            pv, vol = (close * volume).rolling(self.window).sum(), volume.rolling(self.window).sum()
+        else:
+            pv, vol = (close * volume).cumsum(), volume.cumsum()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {self.key: np.where(vol.to_numpy() > 0, (pv / vol).to_numpy(), NAN)}
+
+
+class MACD(Indicator):
+    """MACD line (fast EMA - slow EMA), its signal EMA and the histogram."""
+
+    name = 'MACD'
+    outputs = ('', 'signal', 'hist')
+
+    def __init__(self, fast=12, slow=26, signal=9):
+        self.fast, self.slow, self.signal = int(fast), int(slow), int(signal)
+        self.fast_ema, self.slow_ema, self.signal_ema = EMA(self.fast), EMA(self.slow), EMA(self.signal)
+        self.value, self.signal_value, self.hist = NAN, NAN, NAN
+
+    def params(self):
+        return (self.fast, self.slow, self.signal)
+
+    def reset(self):
+        for ema in (self.fast_ema, self.slow_ema, self.signal_ema):
+            ema.reset()
+        self.value, self.signal_value, self.hist = NAN, NAN, NAN
+
+    @property
+    def ready(self):
+        return self.slow_ema.ready
+
+    @property
+    def current(self):
+        return self.value, self.signal_value, self.hist
+
+    def update(self, close, high=None, low=None, volume=None):
+        self.value = self.fast_ema.update(close) - self.slow_ema.update(close)
+        self.signal_value = self.signal_ema.update(self.value)
+        self.hist = self.value - self.signal_value
+        return self.value
+
+    def compute(self, close, high=None, low=None, volume=None):
+        macd = EMA.batch(close, self.fast) - EMA.batch(close, self.slow)
+        signal = EMA.batch(macd, self.signal)
+        return dict(zip(self.columns, (macd, signal, macd - signal)))
+
+
+INDICATORS = {cls.name: cls for cls in (EMA, SMA, RSI, ATR, BollingerBands, VWAP, MACD)}
+
+
+def create_indicator(name, window=None, **params):
+    """Build a registered indicator; `window` maps to its main length parameter."""
+    try:
+        cls = INDICATORS[name.upper()]
+    except KeyError:
+        raise ValueError(f"❌ Unknown indicator '{name}'. Available: {', '.join(INDICATORS)}") from None
+    if window is not None:
+        if cls.window_param is None:
+            raise ValueError(f"❌ Indicator '{name}' has no window parameter.")
+        params[cls.window_param] = window
+    return cls(**params)
+
+
+def parse_indicator_specs(text):
+    """'RSI:14,BOLLINGER:20,MACD' -> [('RSI', {'window': 14}), ('BOLLINGER', {'window': 20}), ('MACD', {})]."""
+    specs = []
+    for item in filter(None, (part.strip() for part in text.split(','))):
+        name, _, window = item.partition(':')
+        specs.append((name.upper(), {'window': int(window)} if window else {}))
+    return specs
+
+
+class IndicatorSet:
+    """
+    The unique indicators computed on one price stream.
+    Consumers (strategies on the same symbol) `require` what they need; identical indicators
+    are created once and advanced once per tick however many consumers read them. Each
+    consumer passes its own tick count as `seq`: a consumer that is behind the set only reads
+    values a peer already computed for that tick.
+    """
+
+    def __init__(self):
+        self.indicators = {}
+        self.seeded = set()
+        self.ticks = 0
+
+    def require(self, name, **params):
+        indicator = create_indicator(name, **params)
+        return self.indicators.setdefault(indicator.key, indicator)
+
+    def update(self, close, high=None, low=None, volume=None, seq=None):
+        """Advance every indicator by one tick; returns False if this tick was already applied."""
+        if seq is not None and seq < self.ticks:
+            return False
+        for indicator in self.indicators.values():
+            indicator.update(close, high, low, volume)
+        self.ticks += 1
+        return True
+
+    def seed(self, close, high=None, low=None, volume=None):
+        """Replay history into indicators that have not been seeded yet; restarts tick counting."""
+        for key, indicator in self.indicators.items():
+            if key not in self.seeded:
+                indicator.seed(close, high, low, volume)
+                self.seeded.add(key)
+        self.ticks = 0
+
+    @property
+    def values(self):
+        merged = {}
+        for indicator in self.indicators.values():
+            merged.update(indicator.values)
+        return merged
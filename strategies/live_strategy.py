@@ -1,5 +1,8 @@
-import pandas as pd
+import numpy as np
 from utils.logger import logger
+from strategies.indicators import IndicatorSet, parse_indicator_specs
+from strategies.price_buffer import PriceBuffer
+from utils.clock import SYSTEM_CLOCK
 from enum import Enum
 
 
@@ -11,69 +14,111 @@ class Signal(Enum):
 
 
 class LiveStrategy:
-    def __init__(self, stop_loss, profit_target, short_window, long_window, enable_longing=True, enable_shorting=True):
+    def __init__(self, stop_loss, profit_target, short_window, long_window, enable_longing=True, enable_shorting=True,
+                 retention_window=10080, clock=None, indicators=None, fast_type='EMA', slow_type='EMA',
+                 extra_indicators=()):
         self.stop_loss = stop_loss
         self.profit_target = profit_target
         self.short_window = short_window
         self.long_window = long_window
         self.enable_longing = enable_longing
         self.enable_shorting = enable_shorting
+        self.clock = clock or SYSTEM_CLOCK
 
         # State Tracking
         self.position = None  # 'long', 'short', None
         self.entry_price = None
-        self.data = pd.DataFrame()
+
+        # Streaming Indicators (O(1) per price), shared with other strategies on the same stream
+        self.indicators = indicators if indicators is not None else IndicatorSet()
+        self.fast_indicator = self.indicators.require(fast_type, window=short_window)
+        self.slow_indicator = self.indicators.require(slow_type, window=long_window)
+        self.extra_indicators = [self.indicators.require(name, **params) for name, params in extra_indicators]
+        self.ticks_seen = 0
+        self.indicator_labels = {'FAST_IND': self.fast_indicator.key, 'SLOW_IND': self.slow_indicator.key}
+
+        # Bounded price history (never shorter than the slow indicator window)
+        extra_columns = [column for indicator in self.extra_indicators for column in indicator.columns]
+        self.buffer = PriceBuffer(capacity=max(retention_window, long_window),
+                                  columns=PriceBuffer.INDICATOR_COLUMNS + tuple(extra_columns))
 
         logger.info("✅ Live Strategy Initialized.")
         
         self.uptrend_triggered = False
 
+    @classmethod
+    def from_config(cls, config, clock=None, indicators=None):
+        return cls(
+            stop_loss=config['STOP_LOSS'],
+            profit_target=config['PROFIT_TARGET'],
+            short_window=config['SHORT_WINDOW'],
+            long_window=config['LONG_WINDOW'],
+            enable_longing=config['ENABLE_LONGING'],
+            retention_window=config.get('RETENTION_WINDOW', 10080),
+            clock=clock,
+            indicators=indicators,
+            fast_type=config.get('FAST_INDICATOR', 'EMA'),
+            slow_type=config.get('SLOW_INDICATOR', 'EMA'),
+            extra_indicators=parse_indicator_specs(config.get('EXTRA_INDICATORS', '')),
+        )
+
     def prefill_data(self, historical_data):
         """
         Prefill the strategy data with historical data and calculate indicators.
         """
+        self.prefill_arrays(
+            [candle['timestamp'] for candle in historical_data],
+            [float(candle['close']) for candle in historical_data]
+        )
+
+    def prefill_arrays(self, timestamps, closes):
+        """
+        Prefill from ms timestamps and close prices (e.g. straight from the candle store).
+        """
         logger.info("📥 Prefilling strategy with historical data...")
         try:
-            df = pd.DataFrame(historical_data, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df['close'] = df['close'].astype(float)
-
-            # Copy data into strategy
-            self.data = df[['timestamp', 'close']].copy()
-            # Calculate indicators
-            self.data['FAST_IND'] = self.data['close'].ewm(span=self.short_window, min_periods=1).mean()
-            self.data['SLOW_IND'] = self.data['close'].ewm(span=self.long_window, min_periods=1).mean()
+            closes = np.asarray(closes, dtype=np.float64)
+            timestamps = np.asarray(timestamps, dtype=np.int64).astype('datetime64[ms]')
+
+            # Seed streaming indicators from history; the buffer gets the batch forms (same values)
+            self.indicators.seed(closes.tolist())
+            self.ticks_seen = 0
+            columns = {}
+            for indicator in [self.fast_indicator, self.slow_indicator] + self.extra_indicators:
+                columns.update(indicator.compute(closes))
+            self.buffer.clear()
+            self.buffer.extend(
+                timestamps,
+                closes,
+                columns[self.fast_indicator.key],
+                columns[self.slow_indicator.key],
+                *(columns[column] for column in self.buffer.columns[2:])
+            )
             logger.info("✅ Historical data successfully prefilled with indicators.")
         except Exception as e:
             logger.error(f"❌ Failed to prefill strategy data: {e}")
             raise
 
-    def update_data(self, price):
+    @property
+    def data(self):
+        """DataFrame view of the retained history (plotting/export only)."""
+        return self.buffer.to_frame()
+
+    def update_data(self, price, timestamp=None):
         """
-        Update live data with new price.
-        Calculate indicators on the fly.
+        Update live data with new price (stamped now unless a candle timestamp is given).
+        Indicators are advanced incrementally instead of recomputed over the full history.
         """
-        new_row = {
-            'timestamp': pd.Timestamp.now(),  # Add current timestamp
-            'close': price,
-            'FAST_IND': float('nan'),  # Use NaN explicitly for consistency
-            'SLOW_IND': float('nan')   # Use NaN explicitly for consistency
-        }
+        self.indicators.update(price, seq=self.ticks_seen)
+        self.ticks_seen += 1
+        values = [self.fast_indicator.value, self.slow_indicator.value]
+        for indicator in self.extra_indicators:
+            values.extend(indicator.current)
 
-        new_row_df = pd.DataFrame([new_row])
+        timestamp = self.clock.now() if timestamp is None else timestamp
+        self.buffer.append(timestamp, price, *values)
 
-        # Ensure self.data is properly initialized
-        if self.data.empty:
-            self.data = new_row_df.copy()
-        else:
-            # Align columns explicitly to avoid warnings
-            new_row_df = new_row_df.reindex(columns=self.data.columns)
-            self.data = pd.concat([self.data, new_row_df], ignore_index=True).copy()
-
-        # Calculate indicators if enough data is available
-        if len(self.data) >= self.long_window:
-            self.data['FAST_IND'] = self.data['close'].ewm(span=self.short_window, min_periods=1).mean()
-            self.data['SLOW_IND'] = self.data['close'].ewm(span=self.long_window, min_periods=1).mean()
+        if len(self.buffer) >= self.long_window:
             logger.info("📊 Indicators updated.")
         else:
             logger.warning("⚠️ Not enough data points for indicator calculation.")
@@ -85,15 +130,13 @@ class LiveStrategy:
         Generate trading signals based on strategy logic.
         Returns: Signal Enum (BUY, SELL, HOLD)
         """
-        if len(self.data) < self.long_window:
+        if len(self.buffer) < self.long_window:
             logger.warning("⚠️ Not enough data for strategy evaluation.")
             return Signal.HOLD
 
-        current_price = self.data['close'].iloc[-1]
-        fast_ind = self.data['FAST_IND'].iloc[-1]
-        slow_ind = self.data['SLOW_IND'].iloc[-1]
+        _, current_price, fast_ind, slow_ind, *_ = self.buffer.last()
 
-        logger.info(f"📈 Current Price: {current_price}, FAST_IND: {fast_ind}, SLOW_IND: {slow_ind}")
+        logger.info("📈 Current Price: %s, FAST_IND: %s, SLOW_IND: %s", current_price, fast_ind, slow_ind)
 
         # Stop-Loss Logic
         if self.position == 'long' and current_price <= self.entry_price * (1 - self.stop_loss):
@@ -120,6 +163,45 @@ class LiveStrategy:
         return Signal.HOLD
 
 
+    def catch_up(self, timestamps, closes):
+        """
+        Feed candles missed while the bot was down (ms timestamps). Indicators and the trend
+        trigger advance as they would have live, but no entries are generated from stale prices.
+        """
+        for timestamp, close in zip(timestamps, closes):
+            self.update_data(float(close), np.datetime64(int(timestamp), 'ms'))
+            _, _, fast_ind, slow_ind, *_ = self.buffer.last()
+            if fast_ind <= slow_ind:
+                self.uptrend_triggered = False
+
+    def snapshot(self):
+        """Position, trend trigger, indicator state and history needed to resume after a restart."""
+        own = [self.fast_indicator, self.slow_indicator] + self.extra_indicators
+        return {
+            'position': self.position,
+            'entry_price': self.entry_price,
+            'uptrend_triggered': self.uptrend_triggered,
+            'ticks_seen': self.ticks_seen,
+            'indicators': {indicator.key: indicator for indicator in own},
+            'buffer': self.buffer,
+        }
+
+    def restore_position(self, state):
+        self.position = state['position']
+        self.entry_price = state['entry_price']
+        self.uptrend_triggered = state['uptrend_triggered']
+
+    def restore(self, state):
+        """Resume from `snapshot()` output taken with the same indicator configuration."""
+        self.restore_position(state)
+        self.indicators.indicators.update(state['indicators'])
+        self.indicators.seeded.update(state['indicators'])
+        self.indicators.ticks = self.ticks_seen = state['ticks_seen']
+        self.fast_indicator = self.indicators.indicators[self.fast_indicator.key]
+        self.slow_indicator = self.indicators.indicators[self.slow_indicator.key]
+        self.extra_indicators = [self.indicators.indicators[indicator.key] for indicator in self.extra_indicators]
+        self.buffer = state['buffer']
+
     def reset_position(self):
         """
         Reset the strategy state after closing a position.
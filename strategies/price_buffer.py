@@ -0,0 +1,101 @@
+import numpy as np
+
+
+def to_datetime64(value):
+    """datetime, Timestamp or 'YYYY-MM-DD HH:MM:SS' string -> datetime64[ns], without pandas."""
+    if isinstance(value, np.datetime64):
+        return value.astype('datetime64[ns]')
+    return np.datetime64(str(value).replace(' ', 'T'), 'ns')
+
+
+class PriceBuffer:
+    """
+    Fixed-capacity ring buffer holding timestamp/close plus one float column per indicator
+    output (FAST_IND/SLOW_IND by default).
+    Memory stays constant for the whole run; a DataFrame is only built on request.
+    """
+
+    INDICATOR_COLUMNS = ('FAST_IND', 'SLOW_IND')
+
+    def __init__(self, capacity, columns=INDICATOR_COLUMNS):
+        if capacity < 1:
+            raise ValueError("❌ PriceBuffer capacity must be >= 1.")
+        self.capacity = int(capacity)
+        self.columns = tuple(columns)
+        self.timestamps = np.empty(self.capacity, dtype='datetime64[ns]')
+        self.close = np.empty(self.capacity, dtype=np.float64)
+        self.values = np.empty((self.capacity, len(self.columns)), dtype=np.float64)
+
+        self._next = 0   # slot the next row is written to
+        self._size = 0
+        self.total = 0   # rows ever appended, including evicted ones
+
+    @property
+    def COLUMNS(self):
+        return ('timestamp', 'close') + self.columns
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def empty(self):
+        return self._size == 0
+
+    def append(self, timestamp, close, *values):
+        """Write one row (indicator values in `columns` order), overwriting the oldest once full."""
+        i = self._next
+        self.timestamps[i] = to_datetime64(timestamp)
+        self.close[i] = close
+        self.values[i] = values
+
+        self._next = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self.total += 1
+
+    def extend(self, timestamps, close, *columns):
+        """Bulk append equally sized arrays, one per indicator column (used for prefill)."""
+        timestamps = np.asarray(timestamps, dtype='datetime64[ns]')
+        n = len(timestamps)
+        self.total += n
+        if n == 0:
+            return
+
+        # Only the newest `capacity` rows can survive
+        start = max(n - self.capacity, 0)
+        count = n - start
+        idx = (self._next + np.arange(count)) % self.capacity
+        self.timestamps[idx] = timestamps[start:]
+        self.close[idx] = np.asarray(close, dtype=np.float64)[start:]
+        self.values[idx] = np.column_stack([np.asarray(c, dtype=np.float64)[start:] for c in columns])
+
+        self._next = (self._next + count) % self.capacity
+        self._size = min(self._size + count, self.capacity)
+
+    def last(self):
+        """Return (timestamp, close, *indicator values) of the newest row."""
+        if self._size == 0:
+            raise IndexError("❌ PriceBuffer is empty.")
+        i = self._next - 1
+        return (self.timestamps[i], float(self.close[i])) + tuple(self.values[i].tolist())
+
+    def _ordered(self, values):
+        if self._size < self.capacity:
+            return values[:self._size].copy()
+        return np.concatenate((values[self._next:], values[:self._next]))
+
+    def to_arrays(self):
+        """Return the retained columns as oldest-to-newest arrays."""
+        values = self._ordered(self.values)
+        arrays = {'timestamp': self._ordered(self.timestamps), 'close': self._ordered(self.close)}
+        arrays.update((name, values[:, j]) for j, name in enumerate(self.columns))
+        return arrays
+
+    def to_frame(self):
+        """Build a DataFrame view for plotting/export; not meant for the per-tick path."""
+        import pandas as pd
+        return pd.DataFrame(self.to_arrays(), columns=list(self.COLUMNS))
+
+    def clear(self):
+        self._next = 0
+        self._size = 0
+        self.total = 0
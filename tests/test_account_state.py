@@ -0,0 +1,148 @@
+# tests/test_account_state.py
+import sys
+import os
+
+import pytest
+
+# Dynamically adjust the path to include the live_trading directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from live_trading.account_state import AccountState
+from live_trading.simulated_client import SimulatedBinanceClient
+from utils.metrics import metrics
+
+
+@pytest.fixture
+def client():
+    client = SimulatedBinanceClient([0, 60_000, 120_000], [1000.0, 1000.0, 1000.0], symbol='BTCUSDT', history=2,
+                                    balances={'USDT': 1000.0}, fee_rate=0.001, slippage_bps=0)
+    client.clock.sleep(60)
+    return client
+
+
+@pytest.fixture
+def events(client):
+    """User-data events the exchange publishes, held back so a test can choose their order."""
+    captured = []
+    client.subscribe_user_data(captured.append)
+    return captured
+
+
+@pytest.fixture
+def account(client):
+    account = AccountState(client, symbols=['BTC/USDT'])
+    account.reconcile()
+    client.clock.sleep(1)  # fills land after the snapshot
+    return account
+
+
+def assert_matches_exchange(account, client):
+    for asset in ('BTC', 'USDT'):
+        assert account.free(asset) == pytest.approx(client.get_balance(asset), abs=1e-12), asset
+
+
+def test_reconcile_loads_the_snapshot(account):
+    assert account.free('USDT') == 1000.0 and account.free('BTC') == 0.0
+
+
+def test_order_response_then_stream_is_not_double_counted(client, events, account):
+    order = client.create_order('BTC/USDT', 'MARKET', 'BUY', 0.1)
+    account.apply_order(order)
+    assert_matches_exchange(account, client)
+
+    execution, position = events
+    account.apply_event(execution)
+    assert_matches_exchange(account, client)
+    account.apply_event(position)
+    assert_matches_exchange(account, client)
+    assert len(account.fills) == 1
+
+
+def test_stream_then_late_order_response_is_not_double_counted(client, events, account):
+    order = client.create_order('BTC/USDT', 'MARKET', 'BUY', 0.1)
+    for event in events:
+        account.apply_event(event)
+    account.apply_order(order)
+    assert_matches_exchange(account, client)
+    assert len(account.fills) == 1
+
+
+def test_aggregate_response_then_stream_is_not_double_counted(client, events, account):
+    order = client.create_order('BTC/USDT', 'MARKET', 'BUY', 0.1)
+    account.apply_order(dict(order, trades=[]))  # no per-trade breakdown in the response
+    execution, position = events
+    account.apply_event(execution)
+    # Checked before the absolute snapshot arrives: the SELL path may read it in this window
+    assert_matches_exchange(account, client)
+    account.apply_event(position)
+    assert_matches_exchange(account, client)
+
+
+def test_partial_stream_fill_then_aggregate_books_the_remainder(account):
+    account.apply_event({'e': 'executionReport', 'i': 7, 's': 'BTC/USDT', 'S': 'BUY', 'X': 'PARTIALLY_FILLED',
+                         'p': '0', 'q': '0.1', 'z': '0.04', 'l': '0.04', 'L': '1000', 'n': '0', 'N': 'BTC',
+                         't': 11, 'T': 10_000_000})
+    assert account.free('BTC') == pytest.approx(0.04)
+    account.apply_order({'id': '7', 'symbol': 'BTC/USDT', 'side': 'buy', 'status': 'closed', 'filled': 0.1,
+                         'average': 1000.0, 'timestamp': 10_000_000})
+    assert account.free('BTC') == pytest.approx(0.1) and account.free('USDT') == pytest.approx(900.0)
+
+    # The rest of the order's trades arriving afterwards are already booked
+    account.apply_event({'e': 'executionReport', 'i': 7, 's': 'BTC/USDT', 'S': 'BUY', 'X': 'FILLED', 'p': '0',
+                         'q': '0.1', 'z': '0.1', 'l': '0.06', 'L': '1000', 'n': '0', 'N': 'BTC', 't': 12,
+                         'T': 10_000_000})
+    assert account.free('BTC') == pytest.approx(0.1)
+
+
+def test_trades_without_ids_are_all_booked():
+    account = AccountState(client=None, max_fills=1)
+    # Fill the fill deque first: a full deque must not make the fallback ids collide
+    account.apply_order({'id': '8', 'symbol': 'ETH/USDC', 'side': 'buy', 'status': 'closed', 'filled': 1.0,
+                         'timestamp': 1, 'trades': [{'amount': 1.0, 'price': 3000.0}]})
+    trades = [{'amount': 0.04, 'price': 1000.0}, {'amount': 0.06, 'price': 1000.0}]
+    account.apply_order({'id': '9', 'symbol': 'BTC/USDT', 'side': 'buy', 'status': 'closed', 'filled': 0.1,
+                         'timestamp': 1, 'trades': trades})
+    assert account.free('BTC') == pytest.approx(0.1)
+    account.apply_order({'id': '9', 'symbol': 'BTC/USDT', 'side': 'buy', 'status': 'closed', 'filled': 0.1,
+                         'timestamp': 1, 'trades': trades})
+    assert account.free('BTC') == pytest.approx(0.1)
+
+
+def test_snapshot_then_late_aggregate_response_is_not_double_counted(client, events, account):
+    order = client.create_order('BTC/USDT', 'MARKET', 'BUY', 0.1)
+    account.apply_event(events[-1])  # absolute balances after the fill
+    account.apply_order(dict(order, trades=[]))
+    assert_matches_exchange(account, client)
+
+
+def test_resting_limit_order_is_tracked_until_filled(client, events, account):
+    order = client.create_order('BTC/USDT', 'LIMIT', 'BUY', 0.1, price=900.0)
+    account.apply_order(order)
+    assert [o['id'] for o in account.orders_for('BTC/USDT')] == [order['id']]
+    for event in events:
+        account.apply_event(event)
+    assert account.free('USDT') == pytest.approx(910.0)
+
+    client.open_orders.pop(order['id'])  # cancelled on the exchange side
+    account.reconcile()
+    assert account.orders_for('BTC/USDT') == []
+
+
+def test_reconcile_reports_drift_and_replaces_the_cache(client, account):
+    key = ('account_drift_total', (('asset', 'USDT'),))
+    before = metrics.counters.get(key, 0)
+    client.balances['USDT'] = 999.0
+    account.reconcile()
+    assert account.free('USDT') == 999.0
+    assert metrics.counters.get(key, 0) == before + 1
+
+
+def test_started_cache_follows_the_simulated_exchange(client):
+    account = AccountState(client, symbols=['BTC/USDT'], reconcile_interval=3600).start()
+    try:
+        client.create_order('BTC/USDT', 'MARKET', 'BUY', 0.1)
+        assert_matches_exchange(account, client)
+        client.create_order('BTC/USDT', 'MARKET', 'SELL', account.free('BTC'))
+        assert_matches_exchange(account, client)
+        assert len(account.fills) == 2
+    finally:
+        account.stop()
@@ -0,0 +1,65 @@
+# tests/test_candle_aggregator.py
+import sys
+import os
+import random
+
+import pytest
+
+# Dynamically adjust the path to include the project root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.candle_aggregator import CandleAggregator, DEFAULT_TIMEFRAMES
+from utils.timeframes import interval_to_ms
+
+MINUTE = 60 * 1000
+START = 1_700_000_000_000 // (60 * MINUTE) * (60 * MINUTE) + 7 * MINUTE  # mid-hour start
+
+
+@pytest.fixture
+def candles():
+    rng = random.Random(3)
+    candles, price = [], 100.0
+    for i in range(500):
+        o = price
+        price += rng.gauss(0, 1)
+        candles.append({'timestamp': START + i * MINUTE, 'open': o, 'high': max(o, price) + 0.5,
+                        'low': min(o, price) - 0.5, 'close': price, 'volume': rng.uniform(1, 5)})
+    return candles
+
+
+def resample(candles, timeframe_ms):
+    bars = {}
+    for c in candles:
+        key = c['timestamp'] - c['timestamp'] % timeframe_ms
+        bar = bars.setdefault(key, {'timestamp': key, 'open': c['open'], 'high': c['high'], 'low': c['low'],
+                                    'close': c['close'], 'volume': 0.0})
+        bar['high'], bar['low'] = max(bar['high'], c['high']), min(bar['low'], c['low'])
+        bar['close'] = c['close']
+        bar['volume'] += c['volume']
+    # Only bars whose last minute is in the data are closed
+    return [b for b in bars.values() if b['timestamp'] + timeframe_ms <= candles[-1]['timestamp'] + MINUTE]
+
+
+def test_closed_klines_match_a_full_resample(candles):
+    aggregator = CandleAggregator()
+    seen = {timeframe: [] for timeframe in DEFAULT_TIMEFRAMES}
+    for timeframe in DEFAULT_TIMEFRAMES:
+        aggregator.subscribe(timeframe, lambda tf, bar: seen[tf].append(bar))
+    for candle in candles:
+        aggregator.add(candle)
+
+    for timeframe in DEFAULT_TIMEFRAMES:
+        expected = resample(candles, interval_to_ms(timeframe))
+        assert len(seen[timeframe]) == len(expected), timeframe
+        for got, want in zip(seen[timeframe], expected):
+            assert got['timestamp'] == want['timestamp'] and got['open'] == want['open']
+            assert got['high'] == want['high'] and got['low'] == want['low'] and got['close'] == want['close']
+            assert got['volume'] == pytest.approx(want['volume'])
+
+
+def test_trades_close_bars_on_period_boundaries():
+    trades = CandleAggregator(timeframes=('1m', '5m'))
+    assert trades.add({'timestamp': START + 1000, 'close': 10.0, 'volume': 1.0, 'trade_id': 1}) == []
+    trades.add_trade(START + 30_000, 12.0, 2.0)
+    closed = trades.add_trade(START + MINUTE + 5, 11.0, 1.0)
+    assert [(tf, bar['open'], bar['high'], bar['close'], bar['volume']) for tf, bar in closed] == [('1m', 10.0, 12.0, 12.0, 3.0)]
+    assert [tf for tf, _ in trades.flush(START + 2 * MINUTE)] == ['1m']  # the 5m bar runs until :10
@@ -0,0 +1,46 @@
+# tests/test_chart_data.py
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Dynamically adjust the path to include the project root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from visualization.chart_data import EventIndex, visible_rows
+
+N = 7 * 24 * 60  # a week of 1m bars
+
+
+@pytest.fixture
+def arrays():
+    timestamps = np.datetime64('2024-01-01T00:00', 'ns') + np.arange(N) * np.timedelta64(60, 's')
+    close = 100 + np.sin(np.arange(N) / 50.0)
+    close[4321] = 250.0
+    close[777] = -5.0
+    return {'timestamp': timestamps, 'close': close, 'FAST_IND': close * 2}
+
+
+def test_decimation_keeps_extremes_and_both_ends(arrays):
+    rows = visible_rows(arrays, buckets=1600)
+    assert len(rows['close']) <= 2 * 1600 + 2
+    assert rows['close'].max() == 250.0 and rows['close'].min() == -5.0
+    assert rows['timestamp'][0] == arrays['timestamp'][0] and rows['timestamp'][-1] == arrays['timestamp'][-1]
+    assert np.all(np.diff(rows['timestamp']) > np.timedelta64(0, 'ns'))
+
+
+def test_window_cuts_by_time(arrays):
+    day = visible_rows(arrays, window=86400)
+    assert len(day['close']) == 24 * 60 + 1
+
+
+def test_event_index_syncs_incrementally_and_filters_by_time(arrays):
+    timestamps = arrays['timestamp']
+    since = visible_rows(arrays, window=86400)['timestamp'][0]
+    index = EventIndex(('BUY', 'SELL'))
+    events = [(timestamps[10], 1.0, 'BUY'), (timestamps[20], 2.0, 'HOLD'), (timestamps[9000], 3.0, 'SELL')]
+    index.sync(events[:2])
+    index.sync(events)
+    assert len(index.points('BUY')[0]) == 1
+    assert len(index.points('SELL', since=since)[0]) == 1
+    assert len(index.points('BUY', since=since)[0]) == 0
@@ -0,0 +1,110 @@
+# tests/test_historical_downloader.py
+import sys
+import os
+import random
+import time
+
+import numpy as np
+import pytest
+
+# Dynamically adjust the path to include the live_trading directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from live_trading.historical_downloader import BulkDownloader, _parse_date
+from utils.candle_store import CandleStore
+
+MINUTE = 60 * 1000
+START = _parse_date('2024-01-01')
+END = START + 20_000 * MINUTE
+
+
+class FakeExchangeClient:
+    """Pages with random latency and every `fail_every`-th call failing with a transient error."""
+
+    def __init__(self, fail_after=None, fail_every=7, seed=0):
+        self.calls = 0
+        self.fail_after = fail_after
+        self.fail_every = fail_every
+        self.random = random.Random(seed)
+
+    def get_ohlcv(self, symbol, interval, limit, since):
+        self.calls += 1
+        if self.fail_after is not None and self.calls > self.fail_after:
+            raise ConnectionError("simulated interruption")
+        if self.fail_every and self.calls % self.fail_every == 0:
+            raise TimeoutError("simulated transient error")
+        time.sleep(self.random.uniform(0, 0.005))
+        start = since - since % MINUTE
+        return [[t, 1.0, 1.0, 1.0, float(t // MINUTE), 1.0] for t in range(start, start + limit * MINUTE, MINUTE)]
+
+
+def downloader(client, max_retries=10, max_workers=4):
+    return BulkDownloader(client, max_workers=max_workers, max_retries=max_retries, retry_delay=0.001,
+                          requests_per_second=1000)
+
+
+def timestamps(store):
+    return np.asarray(store.load()['timestamp'])
+
+
+def assert_contiguous(store, first, count):
+    stored = timestamps(store)
+    assert len(stored) == count
+    assert stored[0] == first and np.all(np.diff(stored) == MINUTE)
+    # Close carries the candle's own minute, so a misplaced page would show here
+    assert np.array_equal(store.load()['close'], stored // MINUTE)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CandleStore('BTC/USDT', '1m', base_path=str(tmp_path))
+
+
+def test_download_is_ordered_despite_concurrent_pages(store):
+    written = downloader(FakeExchangeClient()).download('BTC/USDT', '1m', START, END, store=store)
+    assert written == 20_000
+    assert_contiguous(store, START, 20_000)
+
+
+def test_overlapping_range_only_appends_new_candles(store):
+    downloader(FakeExchangeClient()).download('BTC/USDT', '1m', START, START + 5_000 * MINUTE, store=store)
+    # Starts inside the stored range and off the minute grid
+    written = downloader(FakeExchangeClient()).download('BTC/USDT', '1m', START + 2_500 * MINUTE + 123, END, store=store)
+    assert written == 15_000
+    assert_contiguous(store, START, 20_000)
+
+
+def test_interrupted_download_resumes_from_the_last_candle(store):
+    # One worker, so the pages land in order until the interruption
+    interrupted = downloader(FakeExchangeClient(fail_after=8, fail_every=0), max_retries=1, max_workers=1)
+    with pytest.raises(ConnectionError):
+        interrupted.download('BTC/USDT', '1m', START, END, store=store)
+    partial = len(store)
+    assert 0 < partial <= 8_000
+    assert_contiguous(store, START, partial)
+
+    client = FakeExchangeClient()
+    assert downloader(client).download('BTC/USDT', '1m', START, END, store=store) == 20_000 - partial
+    assert_contiguous(store, START, 20_000)
+
+    calls = client.calls
+    assert downloader(client).download('BTC/USDT', '1m', START, END, store=store) == 0
+    assert client.calls == calls  # nothing left to fetch
+
+
+def test_older_history_is_backfilled_in_front_of_the_store(store, tmp_path):
+    downloader(FakeExchangeClient()).download('BTC/USDT', '1m', START, END, store=store)
+    earlier = START - 3_000 * MINUTE
+    assert downloader(FakeExchangeClient()).download('BTC/USDT', '1m', earlier, END, store=store) == 3_000
+    assert_contiguous(store, earlier, 23_000)
+    assert sorted(os.listdir(tmp_path)) == [os.path.basename(store.path)]  # scratch store cleaned up
+
+
+def test_stale_store_sync_hands_the_gap_to_the_downloader(store):
+    now = int(time.time() * 1000)
+    now -= now % MINUTE
+    client = FakeExchangeClient(fail_every=0)
+    store.sync(client, now_ms=now - 20_000 * MINUTE)
+    assert len(store) == 1000 and client.calls == 1
+
+    store.sync(client)
+    assert_contiguous(store, now - 21_000 * MINUTE, 21_000)
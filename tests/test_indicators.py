@@ -0,0 +1,56 @@
+# tests/test_indicators.py
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Dynamically adjust the path to include the strategies directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from strategies.indicators import EMA, SMA, RSI, ATR, BollingerBands, VWAP, MACD, IndicatorSet
+
+pd = pytest.importorskip('pandas')
+
+
+@pytest.fixture(scope='module')
+def series():
+    rng = np.random.default_rng(42)
+    prices = 100 + np.cumsum(rng.normal(0, 1, 5000))
+    prices[[10, 11, 500]] = prices[9]  # repeated prices hit the unchanged-value branch
+    high = prices + rng.uniform(0, 1, len(prices))
+    low = prices - rng.uniform(0, 1, len(prices))
+    volume = rng.uniform(1, 10, len(prices))
+    return prices, high, low, volume
+
+
+@pytest.mark.parametrize('span', [1, 2, 9, 50, 200])
+def test_streaming_ema_matches_pandas(series, span):
+    prices = series[0]
+    expected = pd.Series(prices).ewm(span=span, min_periods=1).mean().to_numpy()
+    np.testing.assert_allclose(np.array(EMA(span).seed(prices)), expected, rtol=0, atol=1e-9)
+
+    warm = pd.Series(prices).ewm(span=span, min_periods=span).mean().to_numpy()
+    np.testing.assert_allclose(np.array(EMA(span, min_periods=span).seed(prices)), warm, rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize('indicator', [SMA(20), RSI(14), ATR(14), BollingerBands(20, 2), VWAP(), VWAP(50), MACD()],
+                         ids=lambda indicator: type(indicator).__name__)
+def test_streaming_matches_batch(series, indicator):
+    prices, high, low, volume = series
+    batch = indicator.compute(prices, high, low, volume)
+    indicator.reset()
+    streamed = {column: [] for column in indicator.columns}
+    for i in range(len(prices)):
+        indicator.update(prices[i], high[i], low[i], volume[i])
+        for column, value in indicator.values.items():
+            streamed[column].append(value)
+    for column in indicator.columns:
+        np.testing.assert_allclose(streamed[column], batch[column], rtol=1e-9, atol=1e-8, err_msg=column)
+
+
+def test_indicator_set_deduplicates_indicators_and_ticks():
+    shared = IndicatorSet()
+    a, b = shared.require('EMA', window=50), shared.require('EMA', span=50)
+    assert a is b and len(shared.indicators) == 1
+    assert shared.update(101.0, seq=0) and not shared.update(101.0, seq=0)  # second consumer, same tick
+    assert a.count == 1
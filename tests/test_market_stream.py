@@ -0,0 +1,119 @@
+# tests/test_market_stream.py
+import sys
+import os
+import asyncio
+import json
+import time
+from http import HTTPStatus
+
+import pytest
+
+# Dynamically adjust the path to include the live_trading directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+websockets = pytest.importorskip('websockets')
+from live_trading.market_stream import KlineStream
+
+MINUTE = 60 * 1000
+BASE = (int(time.time() * 1000) // MINUTE - 10) * MINUTE
+
+
+def kline(i, closed=True):
+    return json.dumps({'e': 'kline', 'k': {
+        't': BASE + i * MINUTE, 'o': '1', 'h': '1', 'l': '1', 'c': str(100 + i), 'v': '1', 'x': closed
+    }})
+
+
+class FakeClient:
+    """REST fallback that knows candles 2..4."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_historical_klines(self, symbol, interval, limit, since):
+        self.calls += 1
+        return [
+            {'timestamp': BASE + i * MINUTE, 'open': 1, 'high': 1, 'low': 1, 'close': 100 + i, 'volume': 1}
+            for i in range(2, 5) if BASE + i * MINUTE >= since
+        ]
+
+
+def collect(handler, count, client=None, process_request=None):
+    """Run a KlineStream against a local fake server until `count` events arrived."""
+
+    async def run():
+        async with websockets.serve(handler, 'localhost', 0, process_request=process_request) as server:
+            port = server.sockets[0].getsockname()[1]
+            stream = KlineStream('BTC/USDT', client=client, base_url=f'ws://localhost:{port}',
+                                 reconnect_delay=0.01)
+            closes = []
+            async for candle in stream.candles():
+                closes.append(candle['close'])
+                if len(closes) == count:
+                    break
+            return stream, closes
+
+    return asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+
+def test_reconnect_backfills_the_gap():
+    connections = []
+
+    async def handler(ws, *args):
+        connections.append(ws)
+        if len(connections) == 1:
+            for message in (kline(0), kline(1, closed=False), kline(1)):
+                await ws.send(message)
+            return  # drop the connection to force a reconnect + backfill
+        for message in (kline(4), kline(5)):  # 4 was already backfilled
+            await ws.send(message)
+        await ws.wait_closed()
+
+    client = FakeClient()
+    stream, closes = collect(handler, 6, client=client)
+    assert closes == [100, 101, 102, 103, 104, 105]
+    assert stream.reconnects == 1 and client.calls == 1
+
+
+def test_rejected_handshake_is_retried():
+    attempts = []
+
+    def reject_first(connection, request):
+        attempts.append(request.path)
+        if len(attempts) == 1:
+            return connection.respond(HTTPStatus.SERVICE_UNAVAILABLE, "maintenance\n")
+        return None
+
+    async def handler(ws, *args):
+        await ws.send(kline(0))
+        await ws.wait_closed()
+
+    stream, closes = collect(handler, 1, process_request=reject_first)
+    assert closes == [100]
+    assert len(attempts) == 2 and stream.reconnects == 1
+
+
+def test_malformed_frame_reconnects_instead_of_ending_the_stream():
+    connections = []
+
+    async def handler(ws, *args):
+        connections.append(ws)
+        if len(connections) == 1:
+            await ws.send(kline(0))
+            await ws.send('{"e": "kline", "k": {"t": 1')  # truncated JSON
+        elif len(connections) == 2:
+            await ws.send(json.dumps({'e': 'kline', 'k': {'x': True}}))  # fields missing
+        else:
+            await ws.send(kline(1))
+        await ws.wait_closed()
+
+    stream, closes = collect(handler, 2)
+    assert closes == [100, 101]
+    assert stream.reconnects == 2
+
+
+def test_duplicate_and_open_candles_are_skipped():
+    stream = KlineStream('BTC/USDT')
+    assert stream.parse_message(kline(3, closed=False)) is None
+    assert stream.parse_message(kline(3))['close'] == 103
+    assert stream.parse_message(kline(3)) is None
+    assert stream.parse_message(kline(2)) is None
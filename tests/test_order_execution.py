@@ -0,0 +1,67 @@
+# tests/test_order_execution.py
+import sys
+import os
+
+import ccxt
+import pytest
+
+# Dynamically adjust the path to include the project root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from live_trading.order_execution import OrderExecutor, OrderRejected
+
+PRICE = 67123.456
+
+
+class FlakyClient:
+    """Times out the first send after the order reached the exchange."""
+
+    def __init__(self):
+        self.placed = {}
+        self.sends = 0
+
+    def market(self, symbol):
+        return {'symbol': symbol, 'info': {'filters': [
+            {'filterType': 'LOT_SIZE', 'stepSize': '0.00001000', 'minQty': '0.00001000'},
+            {'filterType': 'PRICE_FILTER', 'tickSize': '0.01000000'},
+            {'filterType': 'NOTIONAL', 'minNotional': '5.00000000'},
+        ]}}
+
+    def submit_order(self, symbol, order_type, side, amount, price=None, params=None):
+        self.sends += 1
+        order = {'id': str(self.sends), 'symbol': symbol, 'side': side, 'amount': amount,
+                 'clientOrderId': params['newClientOrderId']}
+        self.placed[params['newClientOrderId']] = order
+        if self.sends == 1:
+            raise ccxt.RequestTimeout("simulated timeout after the order was accepted")
+        return order
+
+    def get_order_by_client_id(self, symbol, client_order_id):
+        return self.placed.get(client_order_id)
+
+
+@pytest.fixture
+def client():
+    return FlakyClient()
+
+
+@pytest.fixture
+def executor(client):
+    return OrderExecutor(client, ['BTC/USDT'])
+
+
+def test_build_rounds_to_exchange_filters(executor):
+    request = executor.build('BTC/USDT', 'BUY', 11 / PRICE, 'LIMIT', price=PRICE)
+    assert request['amount'] == 0.00016 and request['price'] == 67123.45
+    assert executor.build('BTC/USDT', 'SELL', 1, 'LIMIT', price=67123.451)['price'] == 67123.46
+
+
+def test_timed_out_order_is_recovered_not_resent(client, executor):
+    order = executor.submit('BTC/USDT', 'BUY', 11 / PRICE, reference_price=PRICE)
+    assert client.sends == 1 and len(client.placed) == 1
+    assert order['ack_seconds'] >= 0
+
+
+def test_below_min_notional_is_rejected_locally(client, executor):
+    with pytest.raises(OrderRejected):
+        executor.submit('BTC/USDT', 'BUY', 4 / PRICE, reference_price=PRICE)
+    assert client.sends == 0
@@ -0,0 +1,42 @@
+# tests/test_simulated_client.py
+import sys
+import os
+
+import pytest
+
+# Dynamically adjust the path to include the project root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from live_trading.simulated_client import SimulatedBinanceClient, ReplayFinished
+
+
+@pytest.fixture
+def client():
+    return SimulatedBinanceClient([0, 60_000, 120_000, 180_000], [100.0, 100.0, 110.0, 120.0],
+                                  symbol='BTCUSDT', history=2, fee_rate=0.001, slippage_bps=10)
+
+
+def test_history_ends_at_the_replay_cursor(client):
+    assert [c['close'] for c in client.get_historical_klines('BTC/USDT')] == [100.0, 100.0]
+
+
+def test_round_trip_pays_fees_and_slippage(client):
+    events = []
+    client.subscribe_user_data(events.append)
+
+    client.clock.sleep(60)
+    assert client.get_ticker('BTC/USDT')['last'] == 110.0
+    buy = client.create_order('BTC/USDT', 'MARKET', 'BUY', 1.0)
+    assert buy['average'] == pytest.approx(110.11)
+    assert client.get_balance('BTC') == pytest.approx(0.999)
+
+    client.clock.sleep(60)
+    assert client.get_ticker('BTC/USDT')['last'] == 120.0
+    client.create_order('BTC/USDT', 'MARKET', 'SELL', client.get_balance('BTC'))
+    assert client.get_balance('USDT') == pytest.approx(10_000 - 110.11 + 0.999 * 119.88 * (1 - 0.001))
+    assert [e['e'] for e in events] == ['executionReport', 'outboundAccountPosition'] * 2
+
+
+def test_replay_finishes_after_the_last_candle(client):
+    client.clock.sleep(180)
+    with pytest.raises(ReplayFinished):
+        client.get_ticker('BTC/USDT')
@@ -0,0 +1,127 @@
+# tests/test_supervisor.py
+import sys
+import os
+import queue
+import time
+
+# Dynamically adjust the path to include the live_trading directory
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from live_trading.supervisor import Supervisor, strategy_worker
+from utils.checkpoint import load_checkpoint
+
+# Spawned workers re-import this module before their first beat, so it stays light:
+# the simulated exchange (and ccxt with it) is only imported inside the test that needs it
+HEARTBEAT_TIMEOUT = 1.0
+
+
+# Workers are module-level: spawned processes import them by name
+def crash_once_worker(ctx, marker):
+    if not os.path.exists(marker):
+        open(marker, 'w').close()
+        raise RuntimeError("simulated crash")
+    while ctx.running:
+        ctx.wait(0.05)
+
+
+def stall_once_worker(ctx, marker):
+    if not os.path.exists(marker):
+        open(marker, 'w').close()
+        time.sleep(3600)  # stuck without beating
+    while ctx.running:
+        ctx.wait(0.05)
+
+
+def supervise_until(supervisor, condition, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not condition():
+        time.sleep(0.05)
+        supervisor.check()
+
+
+def test_crashed_and_stalled_workers_are_restarted(tmp_path):
+    supervisor = Supervisor(heartbeat_timeout=HEARTBEAT_TIMEOUT)
+    supervisor.add_worker('crash', crash_once_worker, (str(tmp_path / 'crashed'),))
+    supervisor.add_worker('stall', stall_once_worker, (str(tmp_path / 'stalled'),))
+    supervisor.start()
+    try:
+        supervise_until(supervisor, lambda: all(len(w['restarts']) == 1 and w['process'] for w in supervisor.workers))
+        assert [len(w['restarts']) for w in supervisor.workers] == [1, 1]
+
+        # The restarted workers keep beating past the timeout
+        time.sleep(2 * HEARTBEAT_TIMEOUT)
+        assert supervisor.check() and all(w['process'].is_alive() for w in supervisor.workers)
+    finally:
+        supervisor.shutdown()
+    assert all(w['process'].exitcode == 0 for w in supervisor.workers)
+
+
+def test_critical_worker_is_given_up_on_after_max_restarts(tmp_path):
+    supervisor = Supervisor(heartbeat_timeout=HEARTBEAT_TIMEOUT, max_restarts=0)
+    supervisor.add_worker('crash', crash_once_worker, (str(tmp_path / 'crashed'),), critical=True)
+    supervisor.start()
+    try:
+        deadline = time.monotonic() + 20
+        while time.monotonic() < deadline and supervisor.check():
+            time.sleep(0.05)
+        assert supervisor.workers[0]['failed'] and supervisor.workers[0]['process'] is None
+    finally:
+        supervisor.shutdown()
+
+
+class ScriptedContext:
+    """Runs a worker in-process over a fixed list of inbox messages, then stops it."""
+
+    name = 'strategy-test'
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.running = True
+
+    def get(self, inbox):
+        if not self.messages:
+            self.running = False
+            return None
+        return self.messages.pop(0)
+
+
+def drain(q):
+    items = []
+    while True:
+        try:
+            items.append(q.get_nowait())
+        except queue.Empty:
+            return items
+
+
+def test_restarted_strategy_worker_backfills_the_gap_and_keeps_markers(tmp_path):
+    from live_trading.simulated_client import SimulatedBinanceClient
+
+    client = SimulatedBinanceClient.synthetic(length=1100, seed=3)
+    config = {'LIVE_SYMBOL': 'BTC/USDT', 'STOP_LOSS': 0.02, 'PROFIT_TARGET': 0.04, 'SHORT_WINDOW': 5,
+              'LONG_WINDOW': 20, 'ENABLE_LONGING': True, 'TIMEFRAME': '1m', 'CHECKPOINT_INTERVAL': 60,
+              'PLOT_INTERVAL': 0}
+    orders, journal = queue.Queue(), queue.Queue()
+
+    def run(messages):
+        strategy_worker(ScriptedContext(messages), config, str(tmp_path), queue.Queue(), orders, journal, client=client)
+        return drain(journal)
+
+    first = run([('tick', client.price, client.clock.time()),
+                 ('event', '2023-11-14 22:20:00', client.price, 'BUY')])
+    assert first[0][0] == 'rows' and first[0][2][0][4] == 'PREFILL'
+    last_candle_time = load_checkpoint(str(tmp_path / 'checkpoint.pkl'))['last_candle_time']
+
+    # Down for ten minutes
+    client.clock.sleep(600)
+    client.sync()
+    since = last_candle_time + 60_000
+    missed = [ts for ts in client.timestamps[:client.cursor + 1] if ts >= since]
+    assert missed
+
+    second = run([('tick', client.price, client.clock.time())])
+    kinds = [message[0] for message in second]
+    assert kinds[0] == 'rows' and {row[4] for row in second[0][2]} == {'BACKFILL'}
+    assert len(second[0][2]) == len(missed)
+    plots = [message for message in second if message[0] == 'plot']
+    assert plots and [event[2] for event in plots[-1][4]] == ['BUY']
+    assert [event[2] for event in load_checkpoint(str(tmp_path / 'checkpoint.pkl'))['events']] == ['BUY']
@@ -0,0 +1,51 @@
+# tests/test_vectorized_backtest.py
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Dynamically adjust the path to include the project root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from backtesting.vectorized_backtest import run_backtest, HOLD, BUY_LONG, SELL_LONG, STOP_LOSS_LONG
+from strategies.live_strategy import LiveStrategy, Signal
+
+PARAMS = dict(stop_loss=0.01, profit_target=0.015, short_window=20, long_window=60)
+PREFILL = 200
+CODES = {Signal.HOLD: HOLD, Signal.BUY_LONG: BUY_LONG, Signal.SELL_LONG: SELL_LONG, Signal.STOP_LOSS_LONG: STOP_LOSS_LONG}
+
+
+@pytest.fixture
+def close():
+    rng = np.random.default_rng(7)
+    return 100 * np.exp(np.cumsum(rng.normal(0, 0.002, 2000)))
+
+
+def live_signals(strategy, close):
+    signals = []
+    for price in close[PREFILL:]:
+        strategy.update_data(float(price))
+        signals.append(CODES[strategy.get_signal()])
+    return np.array(signals, dtype=np.int8)
+
+
+def test_signals_match_live_strategy_tick_for_tick(close):
+    strategy = LiveStrategy(**PARAMS)
+    strategy.prefill_data([
+        {'timestamp': i * 60000, 'open': c, 'high': c, 'low': c, 'close': c, 'volume': 0}
+        for i, c in enumerate(close[:PREFILL])
+    ])
+    live = live_signals(strategy, close)
+
+    result = run_backtest(close, start=PREFILL, **PARAMS)
+    assert result['trades'] > 0
+    assert np.array_equal(result['signals'][PREFILL:], live)
+
+
+def test_sma_crossover_matches_live_strategy(close):
+    strategy = LiveStrategy(**PARAMS, fast_type='SMA', slow_type='SMA')
+    strategy.prefill_arrays(np.arange(PREFILL) * 60000, close[:PREFILL])
+    live = live_signals(strategy, close)
+
+    result = run_backtest(close, start=PREFILL, fast_type='SMA', slow_type='SMA', **PARAMS)
+    assert np.array_equal(result['signals'][PREFILL:], live)
@@ -0,0 +1,110 @@
+# utils/candle_aggregator.py
+import sys
+import os
+
+# Dynamically adjust the path to include the project root
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from utils.timeframes import interval_to_ms
+
+DEFAULT_TIMEFRAMES = ('1m', '5m', '15m', '1h')
+
+
+class CandleAggregator:
+    """
+    Builds OHLCV bars for several timeframes at once from a single trade or closed-kline
+    stream. Each input is folded into the open bar of every timeframe in O(1), so higher
+    timeframes never re-resample history. Bars are aligned to the epoch like Binance's.
+
+    Closed klines close a bar as soon as its last base candle arrives; trades close a bar
+    on the first trade of the next one (or on `flush`).
+    """
+
+    def __init__(self, timeframes=DEFAULT_TIMEFRAMES, base_interval='1m'):
+        self.base_interval = base_interval
+        self.base_ms = interval_to_ms(base_interval)
+        self.bars = {}         # timeframe -> open bar dict, or None
+        self.timeframe_ms = {}
+        self.subscribers = {}  # timeframe -> [callback(timeframe, candle)]
+        for timeframe in timeframes:
+            self.subscribe(timeframe)
+
+    def subscribe(self, timeframe, callback=None):
+        """Start building `timeframe` bars; `callback(timeframe, candle)` runs on every close."""
+        if timeframe not in self.timeframe_ms:
+            timeframe_ms = interval_to_ms(timeframe)
+            if timeframe_ms % self.base_ms:
+                raise ValueError(f"❌ Timeframe {timeframe} is not a multiple of the {self.base_interval} base interval.")
+            self.timeframe_ms[timeframe] = timeframe_ms
+            self.bars[timeframe] = None
+            self.subscribers[timeframe] = []
+        if callback is not None:
+            self.subscribers[timeframe].append(callback)
+        return self
+
+    def add(self, event):
+        """Fold one market event from KlineStream (a trade if it carries a trade id, else a closed kline)."""
+        if 'trade_id' in event:
+            return self.add_trade(event['timestamp'], event['close'], event['volume'])
+        return self.add_candle(event)
+
+    def add_trade(self, timestamp, price, quantity=0.0):
+        """Fold one trade (ms timestamp); returns the (timeframe, candle) bars it closed."""
+        closed = []
+        for timeframe, timeframe_ms in self.timeframe_ms.items():
+            bar = self._open(timeframe, timestamp - timestamp % timeframe_ms, closed)
+            self._merge(bar, price, price, price, price, quantity)
+        return self._publish(closed)
+
+    def add_candle(self, candle):
+        """Fold one closed base-interval kline; returns the (timeframe, candle) bars it closed."""
+        start = int(candle['timestamp'])
+        end = start + self.base_ms
+        closed = []
+        for timeframe, timeframe_ms in self.timeframe_ms.items():
+            bar = self._open(timeframe, start - start % timeframe_ms, closed)
+            self._merge(bar, candle['open'], candle['high'], candle['low'], candle['close'], candle['volume'])
+            if end >= bar['timestamp'] + timeframe_ms:
+                closed.append((timeframe, bar))
+                self.bars[timeframe] = None
+        return self._publish(closed)
+
+    def flush(self, now_ms):
+        """Close every bar whose period has ended by `now_ms` (trade streams with no trade since)."""
+        closed = []
+        for timeframe, bar in self.bars.items():
+            if bar is not None and bar['timestamp'] + self.timeframe_ms[timeframe] <= now_ms:
+                closed.append((timeframe, bar))
+                self.bars[timeframe] = None
+        return self._publish(closed)
+
+    def current(self, timeframe):
+        """The still-open bar of `timeframe` (a copy), or None."""
+        bar = self.bars[timeframe]
+        return dict(bar) if bar is not None else None
+
+    def _open(self, timeframe, bucket, closed):
+        bar = self.bars[timeframe]
+        if bar is not None and bucket > bar['timestamp']:
+            closed.append((timeframe, bar))  # input moved past the bar's end
+            bar = None
+        elif bar is not None and bucket < bar['timestamp']:
+            raise ValueError(f"❌ Out-of-order market data for {timeframe}: {bucket} < {bar['timestamp']}")
+        if bar is None:
+            bar = self.bars[timeframe] = {'timestamp': bucket, 'open': None, 'high': float('-inf'),
+                                          'low': float('inf'), 'close': None, 'volume': 0.0}
+        return bar
+
+    @staticmethod
+    def _merge(bar, open_, high, low, close, volume):
+        if bar['open'] is None:
+            bar['open'] = float(open_)
+        bar['high'] = max(bar['high'], float(high))
+        bar['low'] = min(bar['low'], float(low))
+        bar['close'] = float(close)
+        bar['volume'] += float(volume)
+
+    def _publish(self, closed):
+        for timeframe, bar in closed:
+            for callback in self.subscribers[timeframe]:
+                callback(timeframe, bar)
+        return closed
@@ -0,0 +1,154 @@
+# utils/candle_store.py
+import os
+import shutil
+import time
+import numpy as np
+from utils.logger import logger
+from utils.timeframes import interval_to_ms
+
+# One fixed-width record per candle; the file is a plain append-only array of these
+CANDLE_DTYPE = np.dtype([
+    ('timestamp', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+])
+
+DEFAULT_STORE_PATH = './data/candles'
+
+
+def read_candle_file(path, limit=None):
+    """Memory-map a candle file (optionally only its last `limit` rows)."""
+    if not os.path.exists(path) or os.path.getsize(path) < CANDLE_DTYPE.itemsize:
+        return np.empty(0, dtype=CANDLE_DTYPE)
+    candles = np.memmap(path, dtype=CANDLE_DTYPE, mode='r')
+    return candles[-limit:] if limit else candles
+
+
+def to_candle_array(ohlcv):
+    """Convert ccxt-style [[ts, o, h, l, c, v], ...] rows into a candle record array."""
+    if isinstance(ohlcv, np.ndarray) and ohlcv.dtype == CANDLE_DTYPE:
+        return ohlcv
+    rows = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+    candles = np.empty(len(rows), dtype=CANDLE_DTYPE)
+    candles['timestamp'] = rows[:, 0].astype(np.int64)
+    for i, name in enumerate(CANDLE_DTYPE.names[1:], start=1):
+        candles[name] = rows[:, i]
+    return candles
+
+
+class CandleStore:
+    """
+    On-disk OHLCV cache for one symbol/interval.
+    Candles are stored as a memory-mappable binary array, only the missing tail is fetched
+    on sync, and loads go straight into NumPy arrays without building dicts or DataFrames.
+    """
+
+    def __init__(self, symbol, interval='1m', base_path=DEFAULT_STORE_PATH):
+        self.symbol = symbol
+        self.interval = interval
+        self.interval_ms = interval_to_ms(interval)
+        os.makedirs(base_path, exist_ok=True)
+        self.path = os.path.join(base_path, f"{symbol.replace('/', '')}_{interval}.bin")
+        self._repair()
+
+    def _repair(self):
+        """Drop a partially written trailing record left behind by a crash."""
+        if os.path.exists(self.path):
+            size = os.path.getsize(self.path)
+            whole = size - size % CANDLE_DTYPE.itemsize
+            if whole != size:
+                with open(self.path, 'r+b') as f:
+                    f.truncate(whole)
+                logger.warning(f"⚠️ Truncated partial candle record in {self.path}")
+
+    def __len__(self):
+        if not os.path.exists(self.path):
+            return 0
+        return os.path.getsize(self.path) // CANDLE_DTYPE.itemsize
+
+    def first_timestamp(self):
+        """Open time (ms) of the oldest stored candle, or None if the store is empty."""
+        if len(self) == 0:
+            return None
+        with open(self.path, 'rb') as f:
+            return int(np.frombuffer(f.read(CANDLE_DTYPE.itemsize), dtype=CANDLE_DTYPE)['timestamp'][0])
+
+    def last_timestamp(self):
+        """Open time (ms) of the newest stored candle, or None if the store is empty."""
+        if len(self) == 0:
+            return None
+        with open(self.path, 'rb') as f:
+            f.seek(-CANDLE_DTYPE.itemsize, os.SEEK_END)
+            return int(np.frombuffer(f.read(CANDLE_DTYPE.itemsize), dtype=CANDLE_DTYPE)['timestamp'][0])
+
+    def append(self, ohlcv):
+        """Append candles newer than the last stored one; returns how many were written."""
+        candles = to_candle_array(ohlcv)
+        if len(candles) == 0:
+            return 0
+        candles = np.sort(candles, order='timestamp')
+        _, first = np.unique(candles['timestamp'], return_index=True)
+        candles = candles[first]
+
+        last = self.last_timestamp()
+        if last is not None:
+            candles = candles[candles['timestamp'] > last]
+        if len(candles):
+            with open(self.path, 'ab') as f:
+                candles.tofile(f)
+        return len(candles)
+
+    def prepend(self, path):
+        """
+        Put the candles of another store file (all older than ours) in front of this store.
+        The merged file is built next to the store and swapped in atomically.
+        """
+        first = self.first_timestamp()
+        older = read_candle_file(path)
+        if first is not None and len(older) and older['timestamp'][-1] >= first:
+            raise ValueError(f"❌ Candles in {path} overlap {self.path}; cannot prepend.")
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as out:
+            for source in (path, self.path):
+                if os.path.exists(source):
+                    with open(source, 'rb') as f:
+                        shutil.copyfileobj(f, out)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp_path, self.path)
+        return len(older)
+
+    def load(self, limit=None):
+        """Memory-mapped candle records, oldest first."""
+        return read_candle_file(self.path, limit)
+
+    def sync(self, client, limit=1000, now_ms=None, max_pages=5):
+        """
+        Fetch only the candles missing since the last stored one (or the last `limit`
+        candles for an empty store). The still-open candle is never stored.
+        A gap longer than `max_pages` pages (a long-stale store) is handed to the
+        concurrent, rate-budgeted BulkDownloader instead of being paged serially.
+        """
+        now_ms = now_ms or int(time.time() * 1000)
+        last = self.last_timestamp()
+        since = last + self.interval_ms if last is not None else now_ms - limit * self.interval_ms
+        if (now_ms - since) // (limit * self.interval_ms) > max_pages:
+            # Deferred: the downloader itself builds on CandleStore
+            from live_trading.historical_downloader import BulkDownloader
+            logger.info(f"💾 Candle store {self.path} is {(now_ms - since) // self.interval_ms} candles behind; bulk downloading.")
+            return BulkDownloader(client, page_limit=limit).download(self.symbol, self.interval, since, now_ms, store=self)
+        written = 0
+        while since + self.interval_ms <= now_ms:
+            page = client.get_ohlcv(self.symbol, interval=self.interval, limit=limit, since=since)
+            closed = [row for row in page if row[0] >= since and row[0] + self.interval_ms <= now_ms]
+            if not closed:
+                break
+            written += self.append(closed)
+            since = int(closed[-1][0]) + self.interval_ms
+            if len(page) < limit:
+                break
+        logger.info(f"💾 Candle store {self.path}: +{written} candles ({len(self)} total).")
+        return written
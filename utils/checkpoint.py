@@ -0,0 +1,44 @@
+# utils/checkpoint.py
+import os
+import pickle
+import time
+from utils.logger import logger
+
+CHECKPOINT_VERSION = 1
+# Settings a checkpoint's indicator state depends on; a mismatch forces a fresh prefill
+CHECKPOINT_KEYS = ('LIVE_SYMBOL', 'TIMEFRAME', 'SHORT_WINDOW', 'LONG_WINDOW', 'FAST_INDICATOR', 'SLOW_INDICATOR',
+                   'EXTRA_INDICATORS', 'RETENTION_WINDOW')
+
+
+def checkpoint_key(config):
+    return tuple(config.get(key) for key in CHECKPOINT_KEYS)
+
+
+def save_checkpoint(path, state):
+    """
+    Write `state` atomically: a crash mid-write leaves the previous checkpoint intact,
+    never a truncated one.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'version': CHECKPOINT_VERSION, 'saved_at': time.time(), 'state': state}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    """Return the saved state dict (with its `saved_at`), or None if there is no usable checkpoint."""
+    try:
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"⚠️ Ignoring unreadable checkpoint {path}: {e}")
+        return None
+    if payload.get('version') != CHECKPOINT_VERSION:
+        logger.warning(f"⚠️ Ignoring checkpoint {path} written by another version.")
+        return None
+    return dict(payload['state'], saved_at=payload['saved_at'])
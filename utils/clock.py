@@ -0,0 +1,49 @@
+# utils/clock.py
+import time
+from datetime import datetime, timezone
+
+
+class SystemClock:
+    """Wall-clock time; what the live loops use unless a clock is injected."""
+
+    def time(self):
+        return time.time()
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def now(self):
+        return datetime.now()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+class SimulatedClock:
+    """
+    Manually driven clock for replays: `sleep` moves time forward and returns immediately,
+    so a session of hours runs as fast as the loop itself. Naive `now()` is in UTC, like
+    the candle timestamps it is replayed against.
+    """
+
+    def __init__(self, start=0.0):
+        self.current = float(start)
+
+    def time(self):
+        return self.current
+
+    def monotonic(self):
+        return self.current
+
+    def now(self):
+        return datetime.fromtimestamp(self.current, tz=timezone.utc).replace(tzinfo=None)
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.current += seconds
+
+    def advance_to(self, timestamp):
+        self.current = max(self.current, float(timestamp))
+
+
+SYSTEM_CLOCK = SystemClock()
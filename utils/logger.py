@@ -1,7 +1,13 @@
 # utils/logger.py
+import atexit
+import json
 import logging
 import os
-from config import LOG_FOLDER, LOG_FILE, LOG_LEVEL
+import queue
+import time
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
+from config import LOG_FOLDER, LOG_FILE, LOG_LEVEL, LOG_FORMAT, LOG_RATE_LIMIT
 
 # Ensure the log folder exists
 os.makedirs(LOG_FOLDER, exist_ok=True)
@@ -18,6 +24,79 @@ LOG_LEVEL_MAPPING = {
 # Default to DEBUG if LOG_LEVEL is not valid
 log_level = LOG_LEVEL_MAPPING.get(LOG_LEVEL, logging.DEBUG)
 
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log shipping and grep-free analysis."""
+
+    def format(self, record):
+        entry = {
+            'ts': self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            'level': record.levelname,
+            'msg': record.getMessage(),
+            'thread': record.threadName,
+        }
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Let an identical WARNING-or-above message through at most once per `interval` seconds.
+    The next emitted copy reports how many were suppressed in between.
+    Most messages are f-strings (a new key per price or timestamp), so keys whose window has
+    passed are dropped and at most `max_keys` are tracked.
+    """
+
+    def __init__(self, interval=60.0, min_level=logging.WARNING, max_keys=1024):
+        super().__init__()
+        self.interval = interval
+        self.min_level = min_level
+        self.max_keys = max_keys
+        self.seen = OrderedDict()  # key -> [last emitted time, suppressed count], oldest emission first
+
+    def filter(self, record):
+        if record.levelno < self.min_level or self.interval <= 0:
+            return True
+        try:
+            key = (record.levelno, record.msg, record.args)
+            hash(key)
+        except TypeError:
+            return True
+
+        now = time.monotonic()
+        state = self.seen.get(key)
+        if state is not None and now - state[0] < self.interval:
+            state[1] += 1
+            return False
+        if state is not None and state[1]:
+            record.msg = f"{record.msg} (suppressed {state[1]} similar)"
+        self.seen[key] = [now, 0]
+        self.seen.move_to_end(key)
+        # Past its window a key suppresses nothing, so forgetting it only drops a stale count
+        while len(self.seen) > self.max_keys or now - next(iter(self.seen.values()))[0] >= self.interval:
+            self.seen.popitem(last=False)
+        return True
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    Enqueue the raw record: message %-formatting and handler formatting both happen on
+    the listener thread, so the caller only pays for a queue put.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+def build_formatter():
+    if LOG_FORMAT == 'json':
+        return JsonFormatter()
+    if LOG_FORMAT == 'compact':
+        return logging.Formatter('%(asctime)s %(levelname).1s %(message)s', datefmt='%H:%M:%S')
+    return logging.Formatter('%(asctime)s [%(levelname)s]: %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+
+
 # Create the logger
 logger = logging.getLogger('TradingBotLogger')
 logger.setLevel(logging.DEBUG)  # Set the base level to DEBUG
@@ -25,22 +104,23 @@ logger.setLevel(logging.DEBUG)  # Set the base level to DEBUG
 # File Handler (DEBUG logs written to file, overwrites each run)
 file_handler = logging.FileHandler(LOG_FILE, mode='w')
 file_handler.setLevel(logging.DEBUG)
-file_formatter = logging.Formatter(
-    '%(asctime)s [%(levelname)s]: %(message)s', datefmt='%Y-%m-%d %H:%M:%S'
-)
-file_handler.setFormatter(file_formatter)
+file_handler.setFormatter(build_formatter())
 
 # Console Handler (INFO logs shown on console)
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
-console_formatter = logging.Formatter(
-    '%(asctime)s [%(levelname)s]: %(message)s', datefmt='%Y-%m-%d %H:%M:%S'
-)
-console_handler.setFormatter(console_formatter)
+console_handler.setFormatter(build_formatter())
+
+# Disk and console I/O run on a background listener thread
+log_queue = queue.SimpleQueue()
+queue_handler = LazyQueueHandler(log_queue)
+queue_handler.addFilter(RateLimitFilter(interval=LOG_RATE_LIMIT))
+listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)  # drain the queue on shutdown
 
 # Add Handlers to Logger
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+logger.addHandler(queue_handler)
 
 # Initial Log Message
-logger.info(f"Logger initialized with file level: DEBUG and console level: INFO")
+logger.info("Logger initialized with file level: DEBUG and console level: INFO (format: %s)", LOG_FORMAT)
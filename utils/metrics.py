@@ -0,0 +1,213 @@
+# utils/metrics.py
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Latency buckets in seconds (Prometheus-style upper bounds)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUANTILES = (0.5, 0.9, 0.99)
+PREFIX = 'livetrader_'
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+def _escape(value):
+    """Label value escaping required by the Prometheus text format."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _family(lines, name, kind, seen):
+    """`# HELP`/`# TYPE` header, once per metric name, ahead of its first series."""
+    if name not in seen:
+        seen.add(name)
+        lines.append(f'# HELP {PREFIX}{name} {name.replace("_", " ")}')
+        lines.append(f'# TYPE {PREFIX}{name} {kind}')
+
+
+class Histogram:
+    """Bucketed latency histogram plus a bounded sample window for p50/p90/p99."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, window=2048):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.samples = deque(maxlen=window)
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += value
+        self.count += 1
+        self.samples.append(value)
+
+    def quantiles(self):
+        if not self.samples:
+            return {q: 0.0 for q in QUANTILES}
+        ordered = sorted(self.samples)
+        return {q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] for q in QUANTILES}
+
+
+class MetricsRegistry:
+    """
+    In-process counters, gauges and latency histograms for the trading cycle.
+    Rendered as Prometheus text for the HTTP endpoint and as JSON for the run folder.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.started = time.time()
+
+    def inc(self, name, value=1, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        with self.lock:
+            self.gauges[(name, _label_key(labels))] = value
+
+    def observe(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    @contextmanager
+    def span(self, name, **labels):
+        """Time a block into `<name>_seconds`; exceptions also count into `<name>_errors_total`."""
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.inc(f'{name}_errors_total', **labels)
+            raise
+        finally:
+            self.observe(f'{name}_seconds', time.perf_counter() - start, **labels)
+
+    def render_prometheus(self):
+        """Prometheus text format; percentiles stay in the JSON snapshot (scrapers use the buckets)."""
+        lines = []
+        seen = set()
+        with self.lock:
+            for (name, key), value in sorted(self.counters.items()):
+                _family(lines, name, 'counter', seen)
+                lines.append(f'{PREFIX}{name}{_format_labels(key)} {value}')
+            for (name, key), value in sorted(self.gauges.items()):
+                _family(lines, name, 'gauge', seen)
+                lines.append(f'{PREFIX}{name}{_format_labels(key)} {value}')
+            for (name, key), histogram in sorted(self.histograms.items()):
+                _family(lines, name, 'histogram', seen)
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{PREFIX}{name}_bucket{_format_labels(key, [("le", bound)])} {cumulative}')
+                lines.append(f'{PREFIX}{name}_bucket{_format_labels(key, [("le", "+Inf")])} {histogram.count}')
+                lines.append(f'{PREFIX}{name}_sum{_format_labels(key)} {histogram.total}')
+                lines.append(f'{PREFIX}{name}_count{_format_labels(key)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self):
+        """Plain-dict view (counts, p50/p90/p99 in ms) for JSON export."""
+        def label(name, key):
+            return name + _format_labels(key)
+
+        with self.lock:
+            return {
+                'uptime_seconds': time.time() - self.started,
+                'counters': {label(n, k): v for (n, k), v in self.counters.items()},
+                'gauges': {label(n, k): v for (n, k), v in self.gauges.items()},
+                'histograms': {
+                    label(n, k): {
+                        'count': h.count,
+                        'mean_ms': h.total / h.count * 1000 if h.count else 0.0,
+                        **{f'p{int(q * 100)}_ms': v * 1000 for q, v in h.quantiles().items()},
+                    }
+                    for (n, k), h in self.histograms.items()
+                },
+            }
+
+    def write_json(self, path):
+        """Atomically write the snapshot to `path`."""
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp_path, path)
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+
+
+class MetricsExporter:
+    """Background thread that periodically writes the JSON snapshot into a run folder."""
+
+    def __init__(self, registry, path, interval=60.0):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._loop, name='MetricsExporter', daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _loop(self):
+        while not self.stopped.wait(self.interval):
+            self.registry.write_json(self.path)
+
+    def stop(self):
+        self.stopped.set()
+        self.registry.write_json(self.path)
+
+
+def start_metrics_server(registry, port, host='127.0.0.1'):
+    """Serve GET /metrics in Prometheus text format on a daemon thread."""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # keep scrapes out of the trading log
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='MetricsServer', daemon=True).start()
+    return server
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
@@ -0,0 +1,51 @@
+# utils/startup.py
+import threading
+import time
+from contextlib import contextmanager
+from utils.logger import logger
+from utils.metrics import metrics
+
+
+class StartupProfile:
+    """
+    Where the time between process start and the first processed tick goes.
+    Stages are timed with `stage(name)`; `finish()` logs the breakdown once and exports it
+    as `startup_seconds{stage=...}` plus `time_to_first_tick_seconds`.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = {}  # name -> [seconds, count]; stages run in parallel threads are summed
+        self.lock = threading.Lock()
+        self.done = False
+
+    def record(self, name, seconds):
+        with self.lock:
+            entry = self.stages.setdefault(name, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def finish(self):
+        """Close the profile at the first tick and report it (later calls do nothing)."""
+        with self.lock:
+            if self.done:
+                return
+            self.done = True
+        total = time.perf_counter() - self.started
+        lines = []
+        for name, (seconds, count) in self.stages.items():
+            metrics.set_gauge('startup_seconds', seconds, stage=name)
+            lines.append(f"   {name:<12} {seconds:7.3f}s" + (f" (x{count})" if count > 1 else ''))
+        metrics.set_gauge('time_to_first_tick_seconds', total)
+        logger.info("⏱️ Startup took %.3fs to the first tick:\n%s", total, '\n'.join(lines))
+
+
+startup = StartupProfile()
@@ -0,0 +1,17 @@
+# utils/timeframes.py
+
+TIMEFRAME_UNITS_MS = {
+    's': 1000,
+    'm': 60 * 1000,
+    'h': 60 * 60 * 1000,
+    'd': 24 * 60 * 60 * 1000,
+    'w': 7 * 24 * 60 * 60 * 1000,
+}
+
+
+def interval_to_ms(interval):
+    """Convert a Binance interval string such as '1m', '15m' or '1h' to milliseconds."""
+    try:
+        return int(interval[:-1]) * TIMEFRAME_UNITS_MS[interval[-1]]
+    except (KeyError, ValueError, IndexError):
+        raise ValueError(f"❌ Unsupported interval: {interval}")
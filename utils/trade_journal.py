@@ -0,0 +1,131 @@
+# utils/trade_journal.py
+import csv
+import os
+import threading
+import time
+import numpy as np
+from utils.logger import logger
+
+JOURNAL_COLUMNS = ['timestamp', 'close', 'FAST_IND', 'SLOW_IND', 'action', 'position', 'stop_reason', 'error_message']
+
+# Fixed-width record for the binary backend (text fields are truncated to their width)
+JOURNAL_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[s]'),
+    ('close', '<f8'),
+    ('FAST_IND', '<f8'),
+    ('SLOW_IND', '<f8'),
+    ('action', 'S12'),
+    ('position', 'S8'),
+    ('stop_reason', 'S16'),
+    ('error_message', 'S200'),
+])
+
+
+class CsvJournalBackend:
+    """Human-readable journal; one open handle, header written only for a new file."""
+
+    extension = '.csv'
+
+    def __init__(self, path):
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, mode='a', newline='')
+        self.writer = csv.writer(self.file)
+        if is_new:
+            self.writer.writerow(JOURNAL_COLUMNS)
+
+    def write_rows(self, rows):
+        self.writer.writerows(rows)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class BinaryJournalBackend:
+    """Compact append-only journal of fixed-width records; read back with read_binary_journal."""
+
+    extension = '.bin'
+
+    def __init__(self, path):
+        self.file = open(path, mode='ab')
+
+    def write_rows(self, rows):
+        records = np.empty(len(rows), dtype=JOURNAL_DTYPE)
+        for i, row in enumerate(rows):
+            records[i] = (
+                np.datetime64(str(row[0]).replace(' ', 'T'), 's'), row[1], row[2], row[3],
+                str(row[4]).encode()[:12], str(row[5]).encode()[:8],
+                str(row[6]).encode()[:16], str(row[7]).encode()[:200]
+            )
+        records.tofile(self.file)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+JOURNAL_BACKENDS = {
+    'csv': CsvJournalBackend,
+    'binary': BinaryJournalBackend,
+}
+
+
+def read_binary_journal(path):
+    """Memory-map a binary journal as a record array."""
+    if not os.path.exists(path) or os.path.getsize(path) < JOURNAL_DTYPE.itemsize:
+        return np.empty(0, dtype=JOURNAL_DTYPE)
+    return np.memmap(path, dtype=JOURNAL_DTYPE, mode='r')
+
+
+class TradeJournal:
+    """
+    Buffered trade journal.
+    Rows are batched in memory and written when `batch_size` rows are pending, when
+    `flush_interval` seconds have passed, or immediately for urgent rows (orders).
+    """
+
+    def __init__(self, path, backend='csv', batch_size=100, flush_interval=5.0):
+        if backend not in JOURNAL_BACKENDS:
+            raise ValueError(f"❌ Unknown journal backend: {backend}")
+        self.path = path
+        self.backend = JOURNAL_BACKENDS[backend](path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.pending = []
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+        logger.info(f"📄 Trade journal ({backend}): {path}")
+
+    def record(self, row, urgent=False):
+        """Queue one row (values in JOURNAL_COLUMNS order)."""
+        with self.lock:
+            self.pending.append(row)
+            if (urgent or len(self.pending) >= self.batch_size
+                    or time.monotonic() - self.last_flush >= self.flush_interval):
+                self._flush_locked()
+
+    def record_many(self, rows):
+        """Write a block of rows (e.g. prefill) in one go."""
+        with self.lock:
+            self.pending.extend(rows)
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self.pending:
+            self.backend.write_rows(self.pending)
+            self.pending = []
+        self.backend.flush()
+        self.last_flush = time.monotonic()
+
+    def flush(self):
+        with self.lock:
+            self._flush_locked()
+
+    def close(self):
+        with self.lock:
+            self._flush_locked()
+            self.backend.close()
@@ -0,0 +1,93 @@
+import numpy as np
+
+
+def window_start(timestamps, window):
+    """Index of the first row inside the trailing `window` seconds (0 keeps every row)."""
+    if not window or len(timestamps) == 0:
+        return 0
+    cutoff = timestamps[-1] - np.timedelta64(int(window * 1e9), 'ns')
+    return int(np.searchsorted(timestamps, cutoff, side='left'))
+
+
+def minmax_indices(values, buckets):
+    """
+    Row indices of the min and max of each of `buckets` equal slices, plus both ends, in order.
+    With one bucket per pixel column the line drawn through them looks like the full series.
+    """
+    n = len(values)
+    if buckets < 1 or n <= 2 * buckets:
+        return np.arange(n)
+    size = -(-n // buckets)
+    count = -(-n // size)
+    # Pad the last slice with the final value so every slice reshapes to the same width
+    padded = np.empty(size * count, dtype=np.float64)
+    padded[:n] = values
+    padded[n:] = values[-1]
+    blocks = padded.reshape(count, size)
+    offsets = np.arange(count) * size
+    picks = np.concatenate(([0], offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1), [n - 1]))
+    return np.unique(np.minimum(picks, n - 1))
+
+
+def visible_rows(arrays, window=0, buckets=0):
+    """Cut the arrays to the trailing `window` seconds and min/max-decimate them on `close`."""
+    start = window_start(arrays['timestamp'], window)
+    if buckets:
+        rows = minmax_indices(arrays['close'][start:], buckets) + start
+    else:
+        rows = slice(start, None)
+    return {name: values[rows] for name, values in arrays.items()}
+
+
+def visible_chart(arrays, events, window=0, buckets=0):
+    """Rows to draw plus each action's markers (an EventIndex) from the first visible row on."""
+    rows = visible_rows(arrays, window, buckets)
+    since = rows['timestamp'][0] if window and len(rows['timestamp']) else None
+    return rows, {action: events.points(action, since) for action in events.actions}
+
+
+class EventIndex:
+    """
+    Trade markers grouped by action, kept as they arrive so a render reads each action's
+    points (from the start of the visible window on) directly instead of scanning every row.
+    """
+
+    def __init__(self, actions):
+        self.actions = tuple(actions)
+        self.timestamps = {action: [] for action in self.actions}
+        self.prices = {action: [] for action in self.actions}
+        self.count = 0  # events consumed, so `sync` only indexes new ones
+        self._arrays = {}
+
+    @classmethod
+    def from_rows(cls, actions, timestamps, prices, row_actions):
+        """Index journal rows in one vectorized pass over the action column."""
+        index = cls(actions)
+        for row in np.flatnonzero(np.isin(row_actions, index.actions)):
+            index.add(timestamps[row], prices[row], row_actions[row])
+        return index
+
+    def add(self, timestamp, price, action):
+        if action in self.timestamps:
+            self.timestamps[action].append(np.datetime64(timestamp, 'ns'))
+            self.prices[action].append(float(price))
+            self._arrays.pop(action, None)
+
+    def sync(self, events):
+        """Index the (timestamp, price, action) events appended since the last call."""
+        if len(events) < self.count:  # a different (e.g. restored) event list: start over
+            self.__init__(self.actions)
+        for timestamp, price, action in events[self.count:]:
+            self.add(timestamp, price, action)
+        self.count = len(events)
+
+    def points(self, action, since=None):
+        """(timestamps, prices) of one action, optionally from `since` (datetime64) on."""
+        if action not in self._arrays:
+            self._arrays[action] = (np.array(self.timestamps[action], dtype='datetime64[ns]'),
+                                    np.array(self.prices[action], dtype=np.float64))
+        timestamps, prices = self._arrays[action]
+        if since is None:
+            return timestamps, prices
+        start = int(np.searchsorted(timestamps, since, side='left'))
+        return timestamps[start:], prices[start:]
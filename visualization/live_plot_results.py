@@ -1,50 +1,34 @@
-import matplotlib.pyplot as plt
-import pandas as pd
 from utils.logger import logger
+from visualization.chart_data import EventIndex
+from visualization.plot_worker import create_plot, MARKER_ACTIONS
 
 
-def plot_results(df, output_file='trading_results.png'):
+def plot_results(df, output_file='trading_results.png', labels=None, window=0):
     """
     Plot the trading results, including all Long and Short transactions, for any strategy.
+    Every numeric indicator column is drawn; `labels` maps columns to legend text.
+    Only the last `window` seconds are shown (0: the whole session), decimated to the chart
+    width; a .svg or .html `output_file` is written without matplotlib.
     """
+    # Deferred so importing this module stays cheap
+    import pandas as pd
     try:
         # Ensure DataFrame has a datetime index
         if not isinstance(df.index, pd.DatetimeIndex):
             raise ValueError("❌ DataFrame index is not a DatetimeIndex.")
 
-        # Plot Close Price
-        plt.figure(figsize=(16, 8))
-        plt.plot(df.index, df['close'], label='Close Price', linewidth=1, color='gray')
+        timestamps = df.index.values.astype('datetime64[ns]')
+        close = df['close'].to_numpy(dtype='float64')
+        arrays = {'timestamp': timestamps, 'close': close}
+        for col in df.select_dtypes('number').columns:
+            if col != 'close':
+                arrays[col] = df[col].to_numpy(dtype='float64')
 
-        # Plot Indicators
-        indicators = {
-            'FAST_IND': {'label': 'Fast Indicator', 'style': '--', 'color': 'blue'},
-            'SLOW_IND': {'label': 'Slow Indicator', 'style': '--', 'color': 'orange'}
-        }
-        for col, params in indicators.items():
-            if col in df.columns:
-                plt.plot(df.index, df[col], label=params['label'], linestyle=params['style'], linewidth=1, color=params['color'])
-        
-        # Plot Actions
-        actions = [
-            # ('PREFILL', 'o', 'black', 'Prefill'),
-            ('BUY', '^', 'green', 'Buy'),
-            ('SELL', 'v', 'red', 'Sell'),
-            ('STOP_LOSS', 'x', 'purple', 'Stop-Loss')
-        ]
-        for action, marker, color, label in actions:
-            subset = df[df['action'] == action]
-            if not subset.empty:
-                plt.scatter(subset.index, subset['close'], marker=marker, color=color, s=50, label=label)
-        
-        plt.title('Trading Strategy Performance')
-        plt.xlabel('Time')
-        plt.ylabel('Price')
-        plt.legend(loc='upper left')
-        plt.grid(True, linestyle='--', alpha=0.5)
-        plt.tight_layout()
-        plt.savefig(output_file)
+        plot = create_plot(output_file, columns=list(arrays), labels=labels, window=window)
+        # Markers come from one pass over the action column, not a filtered frame per action
+        if 'action' in df:
+            plot.events = EventIndex.from_rows(MARKER_ACTIONS, timestamps, close, df['action'].to_numpy())
+        plot.render(arrays)
         logger.info(f"✅ Plot saved as {output_file}")
-        plt.close()
     except Exception as e:
         logger.error(f"❌ Failed to generate plot: {e}")
@@ -0,0 +1,222 @@
+import threading
+import time
+import numpy as np
+from utils.logger import logger
+from visualization.chart_data import EventIndex, visible_chart
+
+# Same styling as plot_results
+INDICATOR_STYLES = {
+    'FAST_IND': {'label': 'Fast Indicator', 'style': '--', 'color': 'blue'},
+    'SLOW_IND': {'label': 'Slow Indicator', 'style': '--', 'color': 'orange'}
+}
+INDICATOR_PALETTE = ['teal', 'brown', 'olive', 'magenta', 'navy', 'darkgoldenrod', 'slategray', 'crimson']
+NON_INDICATOR_COLUMNS = {'timestamp', 'close', 'action', 'position', 'stop_reason', 'error_message'}
+# Indicators not on the price scale are drawn against a secondary axis
+OSCILLATOR_PREFIXES = ('RSI', 'MACD', 'ATR')
+ACTION_MARKERS = [
+    ('BUY', '^', 'green', 'Buy'),
+    ('SELL', 'v', 'red', 'Sell'),
+    ('STOP_LOSS', 'x', 'purple', 'Stop-Loss')
+]
+MARKER_ACTIONS = tuple(action for action, *_ in ACTION_MARKERS)
+# png renders with matplotlib; svg/html are lightweight hand-written vector charts
+PLOT_FORMATS = ('png', 'svg', 'html')
+
+
+def plot_filename(config):
+    return 'plot.' + config.get('PLOT_FORMAT', 'png')
+
+
+def indicator_styles(columns, labels=None):
+    """Line style per indicator column: FAST/SLOW keep their fixed styles, others cycle the palette."""
+    labels = labels or {}
+    styles, extra = {}, 0
+    for col in columns:
+        if col in NON_INDICATOR_COLUMNS:
+            continue
+        if col in INDICATOR_STYLES:
+            params = dict(INDICATOR_STYLES[col])
+            if col in labels:
+                params['label'] = f"{params['label']} ({labels[col]})"
+        else:
+            params = {'label': labels.get(col, col), 'style': ':', 'color': INDICATOR_PALETTE[extra % len(INDICATOR_PALETTE)]}
+            extra += 1
+        params['secondary'] = col.startswith(OSCILLATOR_PREFIXES)
+        styles[col] = params
+    return styles
+
+
+class LivePlot:
+    """
+    Persistent chart for one output file. The figure and its artists are created once;
+    each render only swaps the line/marker data and saves, instead of building a new figure.
+    Only the trailing `window` seconds are drawn (0: everything retained), min/max-decimated
+    to the figure's pixel width, so render cost does not grow with the session.
+    """
+
+    def __init__(self, output_file, columns=tuple(INDICATOR_STYLES), labels=None, window=0):
+        # Object API (no pyplot) so rendering is safe off the main thread
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self.output_file = output_file
+        self.window = window
+        self.events = EventIndex(MARKER_ACTIONS)
+        self.figure = Figure(figsize=(16, 8))
+        FigureCanvasAgg(self.figure)
+        self.buckets = int(self.figure.get_figwidth() * self.figure.dpi)  # one min/max pair per pixel column
+        self.ax = self.figure.add_subplot(1, 1, 1)
+
+        self.close_line, = self.ax.plot([], [], label='Close Price', linewidth=1, color='gray')
+        self.secondary_ax = None
+        self.indicator_lines = {}
+        for col, params in indicator_styles(columns, labels).items():
+            ax = self.ax
+            if params['secondary']:
+                if self.secondary_ax is None:
+                    self.secondary_ax = self.ax.twinx()
+                ax = self.secondary_ax
+            self.indicator_lines[col] = ax.plot(
+                [], [], label=params['label'], linestyle=params['style'], linewidth=1, color=params['color'])[0]
+        self.markers = {
+            action: self.ax.scatter([], [], marker=marker, color=color, s=50, label=label)
+            for action, marker, color, label in ACTION_MARKERS
+        }
+
+        self.ax.set_title('Trading Strategy Performance')
+        self.ax.set_xlabel('Time')
+        self.ax.set_ylabel('Price')
+        self.ax.legend(loc='upper left')
+        if self.secondary_ax is not None:
+            self.secondary_ax.legend(loc='upper right')
+        self.ax.grid(True, linestyle='--', alpha=0.5)
+        self.figure.tight_layout()
+
+    def render(self, arrays, events=None):
+        """Draw `arrays` (oldest to newest) with markers for the (timestamp, price, action) `events`."""
+        from matplotlib.dates import date2num
+
+        if events is not None:
+            self.events.sync(events)
+        rows, markers = visible_chart(arrays, self.events, self.window, self.buckets)
+        x = date2num(rows['timestamp'])
+        self.close_line.set_data(x, rows['close'])
+        for col, line in self.indicator_lines.items():
+            line.set_data(x, rows[col])
+        if self.secondary_ax is not None:
+            self.secondary_ax.relim()
+            self.secondary_ax.autoscale_view()
+
+        for action, scatter in self.markers.items():
+            timestamps, prices = markers[action]
+            if len(timestamps):
+                scatter.set_offsets(np.column_stack((date2num(timestamps), prices)))
+            else:
+                scatter.set_offsets(np.empty((0, 2)))
+
+        self.ax.xaxis_date()
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.figure.savefig(self.output_file)
+
+
+class SvgPlot:
+    """LivePlot's counterpart for .svg/.html output: no matplotlib, a few kB per render."""
+
+    def __init__(self, output_file, columns=tuple(INDICATOR_STYLES), labels=None, window=0, refresh=None):
+        from visualization.svg_chart import SvgChart
+
+        self.output_file = output_file
+        self.window = window
+        self.events = EventIndex(MARKER_ACTIONS)
+        self.styles = indicator_styles(columns, labels)
+        self.chart = SvgChart(refresh=refresh)
+        self.buckets = self.chart.width
+
+    def render(self, arrays, events=None):
+        if events is not None:
+            self.events.sync(events)
+        rows, markers = visible_chart(arrays, self.events, self.window, self.buckets)
+        marker_rows = [(marker, color, label) + markers[action] for action, marker, color, label in ACTION_MARKERS]
+        self.chart.save(self.chart.render(rows, self.styles, marker_rows), self.output_file)
+
+
+def create_plot(output_file, columns=tuple(INDICATOR_STYLES), labels=None, window=0, refresh=None):
+    """The renderer matching the output file's extension."""
+    if output_file.endswith(('.svg', '.html')):
+        return SvgPlot(output_file, columns, labels, window=window, refresh=refresh)
+    return LivePlot(output_file, columns, labels, window=window)
+
+
+class PlotWorker:
+    """
+    Background thread that renders charts from in-memory snapshots.
+    `submit` never blocks the trading loop: it is throttled to `refresh_interval`, copies
+    the retained arrays, and only the newest pending snapshot per chart is drawn.
+    """
+
+    def __init__(self, refresh_interval=60.0, window=0):
+        self.refresh_interval = refresh_interval
+        self.window = window  # seconds of history drawn; 0 draws everything retained
+        self.plots = {}
+        self.pending = {}
+        self.last_submit = {}
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        if self.running:
+            return self
+        self.running = True
+        self.thread = threading.Thread(target=self._loop, name='PlotWorker', daemon=True)
+        self.thread.start()
+        return self
+
+    def submit(self, output_file, buffer, events, force=False, labels=None):
+        """
+        Queue a render of `buffer` (a PriceBuffer) plus trade events; returns immediately.
+        Every indicator column of the buffer is drawn; `labels` maps columns to legend text.
+        """
+        now = time.monotonic()
+        if not force and now - self.last_submit.get(output_file, float('-inf')) < self.refresh_interval:
+            return False
+        return self.submit_arrays(output_file, buffer.to_arrays(), events, labels=labels)
+
+    def submit_arrays(self, output_file, arrays, events, labels=None):
+        """Queue an already copied snapshot (e.g. received from another process), unthrottled."""
+        self.last_submit[output_file] = time.monotonic()
+        snapshot = (arrays, list(events), labels)
+        with self.lock:
+            self.pending[output_file] = snapshot  # older pending snapshot is simply replaced
+        self.wakeup.set()
+        return True
+
+    def _render_pending(self):
+        with self.lock:
+            jobs, self.pending = self.pending, {}
+        for output_file, (arrays, events, labels) in jobs.items():
+            try:
+                if output_file not in self.plots:
+                    self.plots[output_file] = create_plot(output_file, columns=list(arrays), labels=labels,
+                                                          window=self.window, refresh=self.refresh_interval)
+                self.plots[output_file].render(arrays, events)
+                logger.debug("✅ Plot saved as %s", output_file)
+            except Exception as e:
+                logger.error(f"❌ Failed to generate plot: {e}")
+
+    def _loop(self):
+        while self.running:
+            self.wakeup.wait()
+            self.wakeup.clear()
+            self._render_pending()
+
+    def stop(self, timeout=30.0):
+        """Render whatever is still pending and stop the thread."""
+        self.running = False
+        self.wakeup.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+            self.thread = None
+        self._render_pending()
@@ -0,0 +1,128 @@
+import os
+from html import escape
+import numpy as np
+
+DASH_PATTERNS = {'--': '6,4', ':': '2,3'}
+MARKER_PATHS = {'^': 'M0,-6L5,4L-5,4Z', 'v': 'M0,6L5,-4L-5,-4Z', 'x': 'M-4,-4L4,4M-4,4L4,-4'}
+MARGIN_LEFT, MARGIN_RIGHT, MARGIN_TOP, MARGIN_BOTTOM = 80, 80, 40, 40
+TICKS = 5
+
+
+def _range(series):
+    """Padded (low, high) over the finite values of several arrays."""
+    finite = [s[np.isfinite(s)] for s in series]
+    finite = [s for s in finite if len(s)]
+    if not finite:
+        return 0.0, 1.0
+    low, high = min(s.min() for s in finite), max(s.max() for s in finite)
+    pad = (high - low) * 0.02 or abs(high) * 0.01 or 1.0
+    return float(low - pad), float(high + pad)
+
+
+class SvgChart:
+    """
+    Hand-written SVG (optionally wrapped in a self-refreshing HTML page) for already decimated
+    chart data: a few kB of polylines instead of a rasterized matplotlib figure.
+    """
+
+    def __init__(self, width=1600, height=800, title='Trading Strategy Performance', refresh=None):
+        self.width = width
+        self.height = height
+        self.title = title
+        self.refresh = refresh  # seconds between browser reloads of the HTML page
+
+    def _x(self, timestamps, t0, t1):
+        span = max(t1 - t0, 1)
+        plot_width = self.width - MARGIN_LEFT - MARGIN_RIGHT
+        return MARGIN_LEFT + (timestamps.astype('datetime64[ns]').astype(np.int64) - t0) * (plot_width / span)
+
+    def _y(self, values, low, high):
+        plot_height = self.height - MARGIN_TOP - MARGIN_BOTTOM
+        return MARGIN_TOP + (high - values) * (plot_height / (high - low))
+
+    @staticmethod
+    def _polyline(x, y, color, style=None, width=1):
+        keep = np.isfinite(y)
+        points = ' '.join(map('{:.1f},{:.1f}'.format, x[keep], y[keep]))
+        dash = DASH_PATTERNS.get(style)
+        dash = f' stroke-dasharray="{dash}"' if dash else ''
+        return f'<polyline fill="none" stroke="{color}" stroke-width="{width}"{dash} points="{points}"/>'
+
+    def render(self, rows, styles, markers):
+        """
+        `rows`: visible arrays (timestamp, close, indicator columns); `styles`: indicator_styles();
+        `markers`: (marker, color, label, timestamps, prices) per action.
+        """
+        timestamps = rows['timestamp']
+        if len(timestamps) == 0:
+            return self._document('')
+        t0, t1 = (int(t) for t in timestamps[[0, -1]].astype('datetime64[ns]').astype(np.int64))
+        x = self._x(timestamps, t0, t1)
+        primary = [col for col, params in styles.items() if not params['secondary']]
+        secondary = [col for col, params in styles.items() if params['secondary']]
+        low, high = _range([rows['close']] + [rows[col] for col in primary])
+        right = _range([rows[col] for col in secondary]) if secondary else None
+
+        parts = [f'<text x="{self.width / 2}" y="24" text-anchor="middle" font-size="16">{escape(self.title)}</text>']
+        left_edge, right_edge = MARGIN_LEFT, self.width - MARGIN_RIGHT
+        for i in range(TICKS + 1):
+            fraction = i / TICKS
+            y = MARGIN_TOP + fraction * (self.height - MARGIN_TOP - MARGIN_BOTTOM)
+            parts.append(f'<line x1="{left_edge}" x2="{right_edge}" y1="{y:.1f}" y2="{y:.1f}" stroke="#ddd" '
+                         f'stroke-dasharray="4,4"/>')
+            parts.append(f'<text x="{left_edge - 6}" y="{y + 4:.1f}" text-anchor="end">'
+                         f'{high - fraction * (high - low):.2f}</text>')
+            if right is not None:
+                parts.append(f'<text x="{right_edge + 6}" y="{y + 4:.1f}">'
+                             f'{right[1] - fraction * (right[1] - right[0]):.2f}</text>')
+            tick = np.datetime64(int(t0 + fraction * (t1 - t0)), 'ns')
+            tick_x = left_edge + fraction * (right_edge - left_edge)
+            parts.append(f'<text x="{tick_x:.1f}" y="{self.height - 14}" text-anchor="middle">'
+                         f'{np.datetime_as_string(tick, unit="m").replace("T", " ")}</text>')
+
+        legend = [('Close Price', 'gray', None)]
+        parts.append(self._polyline(x, self._y(rows['close'], low, high), 'gray'))
+        for col, params in styles.items():
+            y_low, y_high = right if params['secondary'] else (low, high)
+            parts.append(self._polyline(x, self._y(rows[col], y_low, y_high), params['color'], params['style']))
+            legend.append((params['label'], params['color'], params['style']))
+
+        for marker, color, label, marker_times, marker_prices in markers:
+            if len(marker_times) == 0:
+                continue
+            marker_x = self._x(marker_times, t0, t1)
+            marker_y = self._y(marker_prices, low, high)
+            path = MARKER_PATHS.get(marker, MARKER_PATHS['x'])
+            parts.append(f'<g fill="{color}" stroke="{color}" stroke-width="1.5">' + ''.join(
+                f'<path transform="translate({mx:.1f},{my:.1f})" d="{path}"/>' for mx, my in zip(marker_x, marker_y)
+            ) + '</g>')
+            legend.append((label, color, marker))
+
+        for i, (label, color, style) in enumerate(legend):
+            y = MARGIN_TOP + 14 + i * 16
+            if style in MARKER_PATHS:
+                symbol = f'<path transform="translate({left_edge + 20},{y - 4})" d="{MARKER_PATHS[style]}" fill="{color}" stroke="{color}"/>'
+            else:
+                dash = DASH_PATTERNS.get(style)
+                dash = f' stroke-dasharray="{dash}"' if dash else ''
+                symbol = f'<line x1="{left_edge + 10}" x2="{left_edge + 30}" y1="{y - 4}" y2="{y - 4}" stroke="{color}"{dash}/>'
+            parts.append(symbol + f'<text x="{left_edge + 36}" y="{y}">{escape(label)}</text>')
+        return self._document('\n'.join(parts))
+
+    def _document(self, body):
+        return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+                f'viewBox="0 0 {self.width} {self.height}" font-family="sans-serif" font-size="11">\n'
+                f'<rect width="100%" height="100%" fill="white"/>\n{body}\n</svg>\n')
+
+    def save(self, svg, output_file):
+        """Write the SVG (or an HTML page embedding it) atomically, so a viewer never reads half a file."""
+        if output_file.endswith('.html'):
+            refresh = ''
+            if self.refresh and np.isfinite(self.refresh):
+                refresh = f'<meta http-equiv="refresh" content="{max(1, int(self.refresh))}">'
+            svg = (f'<!DOCTYPE html>\n<html><head><meta charset="utf-8">{refresh}<title>{escape(self.title)}</title>'
+                   f'</head>\n<body style="margin:0">\n{svg}</body></html>\n')
+        tmp_path = output_file + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(svg)
+        os.replace(tmp_path, output_file)